@@ -4,15 +4,16 @@ from __future__ import annotations
 
 from dataclasses import asdict
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional
 
 from .cache.index_store import IndexStore
 from .cache.lock import FileLock
-from .config import DEFAULT_EXCLUDE, DEFAULT_INCLUDE, WORK_DIR_NAME
-from .core.pairing import pair_live
+from .cache.scan_checkpoint import ScanCheckpoint
+from .config import DEFAULT_EXCLUDE, DEFAULT_HASH_POLICY, DEFAULT_INCLUDE, WORK_DIR_NAME
+from .core.pairing import pair_live, repair_live
 from .models.album import Album
 from .models.types import LiveGroup
-from .errors import ManifestInvalidError
+from .errors import IndexCorruptedError, ManifestInvalidError
 from .utils.jsonio import read_json, write_json
 from .utils.logging import get_logger
 
@@ -20,39 +21,131 @@ LOGGER = get_logger()
 
 
 def open_album(root: Path) -> Album:
-    """Open an album directory, scanning and pairing as required."""
+    """Open an album directory, scanning and pairing as required.
+
+    ``links.json`` records the :meth:`IndexStore.stamp` of the index it was
+    computed from.  When the stamp still matches, the index is neither read
+    nor re-paired, so reopening an unchanged album costs a few ``stat`` calls.
+    """
 
     album = Album.open(root)
     store = IndexStore(root)
+    # Taken before reading so a concurrent write can only make it stale.
+    stamp = store.stamp()
+    if store.storage_bytes() > 0:
+        links = _read_links(root)
+        if links is not None and links.get("index_stamp") == stamp:
+            return album
     rows = list(store.read_all())
     if not rows:
         include = album.manifest.get("filters", {}).get("include", DEFAULT_INCLUDE)
         exclude = album.manifest.get("filters", {}).get("exclude", DEFAULT_EXCLUDE)
-        from .io.scanner import scan_album
-
-        rows = list(scan_album(root, include, exclude))
-        store.write_rows(rows)
-    _ensure_links(root, rows)
+        rows = _scan_to_index(root, include, exclude, existing_rows=None)
+        stamp = store.stamp()
+    _ensure_links(root, rows, stamp=stamp)
     return album
 
 
-def _ensure_links(root: Path, rows: List[dict]) -> None:
-    work_dir = root / WORK_DIR_NAME
-    links_path = work_dir / "links.json"
-    _, payload = _compute_links_payload(rows)
-    if links_path.exists():
-        try:
-            existing: Dict[str, object] = read_json(links_path)
-        except ManifestInvalidError:
-            existing = {}
-        if existing == payload:
-            return
+def _scan_to_index(
+    root: Path,
+    include: Iterable[str],
+    exclude: Iterable[str],
+    *,
+    existing_rows: Optional[List[dict]],
+    workers: Optional[int] = None,
+    hash_policy: str = DEFAULT_HASH_POLICY,
+) -> List[dict]:
+    """Scan *root* through a :class:`ScanCheckpoint` and promote it as the index.
+
+    Rows left behind by an interrupted scan are reused, so only files that were
+    not yet processed are inspected again.
+    """
+
+    from .io.scanner import scan_album
+
+    checkpoint = ScanCheckpoint(root)
+    existing_rows = checkpoint.merge_existing(existing_rows)
+    rows = list(
+        checkpoint.record(
+            scan_album(
+                root,
+                include,
+                exclude,
+                existing_rows=existing_rows,
+                workers=workers,
+                hash_policy=hash_policy,
+            )
+        )
+    )
+    checkpoint.promote(IndexStore(root))
+    return rows
+
+
+def _ensure_links(
+    root: Path,
+    rows: List[dict],
+    *,
+    changed: Optional[Iterable[str]] = None,
+    stamp: Optional[str] = None,
+) -> List[LiveGroup]:
+    """Bring ``links.json`` in line with *rows*, writing it only when it changed.
+
+    When *changed* lists the rels that differ from the index the current links
+    were computed from, only the groups they affect are re-paired (see
+    :func:`repair_live`); otherwise every group is recomputed.  *stamp* is the
+    index stamp taken before *rows* were read; it defaults to the current one.
+    """
+
+    if stamp is None:
+        stamp = IndexStore(root).stamp()
+    existing = _read_links(root)
+    previous = _live_groups_from_payload(existing) if changed is not None else None
+    if previous is not None:
+        groups, payload = _compute_links_payload(rows, previous=previous, changed=changed)
+    else:
+        groups, payload = _compute_links_payload(rows)
+    payload["index_stamp"] = stamp
+    if existing == payload:
+        return groups
     LOGGER.info("Updating links.json for %s", root)
     _write_links(root, payload)
+    return groups
 
 
-def _compute_links_payload(rows: List[dict]) -> tuple[List[LiveGroup], Dict[str, object]]:
-    groups = pair_live(rows)
+def _read_links(root: Path) -> Optional[Dict[str, object]]:
+    links_path = root / WORK_DIR_NAME / "links.json"
+    if not links_path.exists():
+        return None
+    try:
+        return read_json(links_path)
+    except ManifestInvalidError:
+        return None
+
+
+def _live_groups_from_payload(payload: Optional[Dict[str, object]]) -> Optional[List[LiveGroup]]:
+    """Return the groups stored in a links payload, or ``None`` if it is unusable."""
+
+    if not payload:
+        return None
+    entries = payload.get("live_groups")
+    if not isinstance(entries, list):
+        return None
+    try:
+        return [LiveGroup(**entry) for entry in entries]
+    except TypeError:
+        return None
+
+
+def _compute_links_payload(
+    rows: List[dict],
+    *,
+    previous: Optional[List[LiveGroup]] = None,
+    changed: Optional[Iterable[str]] = None,
+) -> tuple[List[LiveGroup], Dict[str, object]]:
+    if previous is not None and changed is not None:
+        groups = repair_live(rows, previous, changed)
+    else:
+        groups = pair_live(rows)
     payload: Dict[str, object] = {
         "schema": "iPhoto/links@1",
         "live_groups": [asdict(group) for group in groups],
@@ -67,24 +160,85 @@ def _write_links(root: Path, payload: Dict[str, object]) -> None:
         write_json(work_dir / "links.json", payload, backup_dir=work_dir / "manifest.bak")
 
 
-def rescan(root: Path) -> List[dict]:
-    """Rescan the album and return the fresh index rows."""
+def rescan(
+    root: Path,
+    *,
+    full: bool = False,
+    workers: Optional[int] = None,
+    hash_policy: str = DEFAULT_HASH_POLICY,
+) -> List[dict]:
+    """Rescan the album and return the fresh index rows.
+
+    By default the scan is incremental: rows already present in the index are
+    reused for files whose size, modification time and inode are unchanged, so
+    only new or modified files are hashed and inspected.  Pass ``full=True`` to
+    ignore the cached rows and re-extract metadata for every file.  *workers*
+    overrides the size of the scanner's hashing/probing thread pool and
+    *hash_policy* (``fast`` or ``full``) how much of each file is hashed.
+    """
 
     album = Album.open(root)
     include = album.manifest.get("filters", {}).get("include", DEFAULT_INCLUDE)
     exclude = album.manifest.get("filters", {}).get("exclude", DEFAULT_EXCLUDE)
-    from .io.scanner import scan_album
 
-    rows = list(scan_album(root, include, exclude))
-    IndexStore(root).write_rows(rows)
+    existing_rows: Optional[List[dict]] = None
+    if not full:
+        try:
+            existing_rows = list(IndexStore(root).read_all())
+        except IndexCorruptedError as exc:
+            LOGGER.warning("Ignoring unreadable index for %s: %s", root, exc)
+            existing_rows = None
+
+    rows = _scan_to_index(
+        root,
+        include,
+        exclude,
+        existing_rows=existing_rows,
+        workers=workers,
+        hash_policy=hash_policy,
+    )
     _ensure_links(root, rows)
     return rows
 
 
-def pair(root: Path) -> List[LiveGroup]:
-    """Rebuild live photo pairings from the current index."""
+def pair(
+    root: Path,
+    *,
+    added: Optional[Iterable[str]] = None,
+    removed: Optional[Iterable[str]] = None,
+) -> List[LiveGroup]:
+    """Rebuild live photo pairings from the current index.
 
-    rows = list(IndexStore(root).read_all())
-    groups, payload = _compute_links_payload(rows)
-    _write_links(root, payload)
-    return groups
+    Passing the rels that were *added* to or *removed* from the index since
+    ``links.json`` was last written re-pairs only the content ids, stems and
+    folders they touch and merges the result into the stored groups.  Without
+    either argument, or when no usable ``links.json`` exists, every group is
+    recomputed.
+    """
+
+    store = IndexStore(root)
+    stamp = store.stamp()
+    rows = list(store.read_all())
+    if added is None and removed is None:
+        groups, payload = _compute_links_payload(rows)
+        payload["index_stamp"] = stamp
+        _write_links(root, payload)
+        return groups
+    changed = set(added or ()) | set(removed or ())
+    return _ensure_links(root, rows, changed=changed, stamp=stamp)
+
+
+def compute_full_hashes(root: Path) -> int:
+    """Store the full-content ``xxh3`` hash for indexed rows that lack one.
+
+    Fast scans only fingerprint sampled blocks of each file; this fills in the
+    whole-file hashes on demand, e.g. before looking for duplicates.  Returns the
+    number of rows that were updated.
+    """
+
+    from .io.scanner import fill_full_hashes
+
+    store = IndexStore(root)
+    updated = fill_full_hashes(root, store.read_all())
+    store.append_rows(updated)
+    return len(updated)
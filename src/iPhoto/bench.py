@@ -0,0 +1,312 @@
+"""Reproducible scanner benchmarks backed by synthetic fixture albums."""
+
+from __future__ import annotations
+
+import os
+import random
+import struct
+import time
+from io import BytesIO
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .cache.index_store import IndexStore
+from .config import (
+    DEFAULT_EXCLUDE,
+    DEFAULT_HASH_POLICY,
+    DEFAULT_INCLUDE,
+    THUMBNAIL_CODECS,
+    THUMBNAIL_QUALITY,
+)
+from .errors import IPhotoError
+from .io.scanner import ScanStats, scan_album
+from .models.album import Album
+from .utils.deps import load_pillow
+from .utils.jsonio import available_codecs, get_codec
+
+_PILLOW = load_pillow()
+
+# Synthetic files are spread over sub-directories of this many assets so the
+# directory walk resembles a camera import rather than one flat folder.
+_FILES_PER_DIRECTORY = 1000
+# Capture timestamps start here and advance one second per asset, which keeps
+# the generated album byte-for-byte identical between runs with the same seed.
+_EPOCH = 1_600_000_000
+_JPEG_SIZE = (640, 480)
+_PNG_SIZE = (320, 240)
+_MOVIE_PAYLOAD_BYTES = 256 * 1024
+
+
+def _box(kind: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I", 8 + len(payload)) + kind + payload
+
+
+def _movie_bytes(rng: random.Random, timestamp: int, duration_sec: float) -> bytes:
+    """Return a minimal QuickTime file: ``ftyp``, a ``moov`` header and ``mdat`` noise."""
+
+    # QuickTime timestamps count seconds from 1904-01-01.
+    qt_time = timestamp + 2_082_844_800
+    timescale = 600
+    mvhd = struct.pack(
+        ">B3xIIIIIH10x9IIIIIIII",
+        0,
+        qt_time,
+        qt_time,
+        timescale,
+        int(duration_sec * timescale),
+        0x00010000,
+        0x0100,
+        0x00010000, 0, 0, 0, 0x00010000, 0, 0, 0, 0x40000000,
+        0, 0, 0, 0, 0, 0,
+        2,
+    )
+    return b"".join(
+        (
+            _box(b"ftyp", b"qt  " + struct.pack(">I", 0) + b"qt  "),
+            _box(b"moov", _box(b"mvhd", mvhd)),
+            _box(b"mdat", rng.randbytes(_MOVIE_PAYLOAD_BYTES)),
+        )
+    )
+
+
+def _noise_image(rng: random.Random, size: tuple[int, int]):
+    assert _PILLOW is not None
+    width, height = size
+    return _PILLOW.Image.frombytes("RGB", size, rng.randbytes(width * height * 3))
+
+
+def _photo_like_image(rng: random.Random, size: int):
+    """Return a smooth gradient with mild noise, closer to a photo than pure noise."""
+
+    assert _PILLOW is not None
+    image_module = _PILLOW.Image
+    channels = [
+        image_module.linear_gradient("L").rotate(rng.uniform(0, 360)).resize((size, size))
+        for _ in range(3)
+    ]
+    gradient = image_module.merge("RGB", channels)
+    return image_module.blend(gradient, _noise_image(rng, (size, size)), 0.12)
+
+
+def _format_exif_time(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y:%m:%d %H:%M:%S")
+
+
+def generate_synthetic_album(root: Path, count: int, *, seed: int = 0) -> List[Path]:
+    """Write *count* deterministic JPEG, PNG and MOV fixtures below *root*.
+
+    Files cycle through ``IMG_n.JPG``, ``SCR_n.PNG`` and ``IMG_n.MOV`` so every
+    movie shares its stem and capture time with a still, like a Live Photo.
+    Pixel data and movie payloads are seeded noise, so hashing and decoding do
+    real work while the same *seed* always produces the same album.
+
+    Raises
+    ------
+    IPhotoError
+        Raised when Pillow is not available to encode the still images.
+    """
+
+    if _PILLOW is None:
+        raise IPhotoError("Pillow is required to generate synthetic images")
+
+    rng = random.Random(seed)
+    created: List[Path] = []
+    for index in range(count):
+        directory = root / f"batch_{index // _FILES_PER_DIRECTORY:03d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        asset = index // 3
+        timestamp = _EPOCH + asset
+        kind = index % 3
+        if kind == 0:
+            path = directory / f"IMG_{asset:05d}.JPG"
+            exif = _PILLOW.Image.Exif()
+            exif[271] = "iPhoto"  # Make
+            exif[272] = "Synthetic Camera"  # Model
+            exif[306] = _format_exif_time(timestamp)  # DateTime
+            _noise_image(rng, _JPEG_SIZE).save(path, "JPEG", quality=85, exif=exif)
+        elif kind == 1:
+            path = directory / f"SCR_{asset:05d}.PNG"
+            _noise_image(rng, _PNG_SIZE).save(path, "PNG")
+        else:
+            path = directory / f"IMG_{asset:05d}.MOV"
+            path.write_bytes(_movie_bytes(rng, timestamp, duration_sec=2.5))
+        os.utime(path, (timestamp, timestamp))
+        created.append(path)
+    return created
+
+
+def bench_scan(
+    root: Path,
+    *,
+    workers: Optional[int] = None,
+    hash_policy: str = DEFAULT_HASH_POLICY,
+) -> ScanStats:
+    """Run a full scan of *root*, write the index and return the measurements.
+
+    Cached rows are ignored so every file goes through the whole pipeline; the
+    time spent persisting the rows is recorded as the ``write`` stage.
+    """
+
+    album = Album.open(root)
+    include = album.manifest.get("filters", {}).get("include", DEFAULT_INCLUDE)
+    exclude = album.manifest.get("filters", {}).get("exclude", DEFAULT_EXCLUDE)
+
+    stats = ScanStats()
+    rows = list(
+        scan_album(
+            root,
+            include,
+            exclude,
+            existing_rows=None,
+            workers=workers,
+            stats=stats,
+            hash_policy=hash_policy,
+        )
+    )
+    with stats.measure("write"):
+        IndexStore(root).write_rows(rows)
+    return stats
+
+
+def synthetic_index_rows(count: int, *, seed: int = 0) -> List[Dict[str, object]]:
+    """Return *count* index rows shaped like the scanner's output.
+
+    Two thirds are photos with camera and GPS fields and one third are videos,
+    so the payload mixes strings, integers, floats and nested mappings.
+    """
+
+    rng = random.Random(seed)
+    start = datetime.fromtimestamp(_EPOCH, tz=timezone.utc)
+    rows: List[Dict[str, object]] = []
+    for index in range(count):
+        taken = start + timedelta(seconds=index)
+        folder = f"batch_{index // _FILES_PER_DIRECTORY:03d}"
+        row: Dict[str, object] = {
+            "bytes": rng.randrange(200_000, 8_000_000),
+            "dt": taken.isoformat().replace("+00:00", "Z"),
+            "id": f"as_{rng.getrandbits(64):016x}",
+            "ino": rng.getrandbits(40),
+            "mtime_ns": (_EPOCH + index) * 1_000_000_000,
+        }
+        if index % 3 == 2:
+            row.update(
+                {
+                    "rel": f"{folder}/IMG_{index:06d}.MOV",
+                    "mime": "video/quicktime",
+                    "dur": round(rng.uniform(1.0, 60.0), 3),
+                    "codec": "hevc",
+                    "frame_rate": 29.97,
+                    "w": 1920,
+                    "h": 1080,
+                }
+            )
+        else:
+            row.update(
+                {
+                    "rel": f"{folder}/IMG_{index:06d}.HEIC",
+                    "mime": "image/heic",
+                    "make": "Apple",
+                    "model": "iPhone 15 Pro",
+                    "lens": "Main Camera",
+                    "iso": rng.choice((32, 64, 125, 400)),
+                    "f_number": 1.78,
+                    "exposure_time": rng.choice((0.001, 0.004, 0.0333)),
+                    "focal_length": 6.86,
+                    "gps": {"lat": rng.uniform(-60, 70), "lon": rng.uniform(-180, 180)},
+                    "w": 4032,
+                    "h": 3024,
+                    "content_id": f"{rng.getrandbits(128):032X}",
+                }
+            )
+        rows.append(row)
+    return rows
+
+
+def bench_json_codecs(count: int = 100_000, *, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Time every available JSON codec on a synthetic index of *count* rows.
+
+    Each codec encodes the rows to JSON lines and decodes the resulting bytes
+    line by line, exactly as :class:`~iPhoto.cache.index_store.IndexStore`
+    does.  Returns, per codec name, the encode and decode times in seconds and
+    the size of the encoded payload.
+    """
+
+    rows = synthetic_index_rows(count, seed=seed)
+    results: Dict[str, Dict[str, float]] = {}
+    for name in available_codecs():
+        codec = get_codec(name)
+        started = time.perf_counter()
+        payload = "".join(codec.dumps_line(row) + "\n" for row in rows).encode("utf-8")
+        encoded = time.perf_counter()
+        decoded = [codec.loads(line) for line in payload.splitlines()]
+        finished = time.perf_counter()
+        if len(decoded) != len(rows):  # pragma: no cover - defensive guard
+            raise IPhotoError(f"JSON codec {name} lost rows during the round trip")
+        results[name] = {
+            "encode_seconds": encoded - started,
+            "decode_seconds": finished - encoded,
+            "bytes": float(len(payload)),
+        }
+    return results
+
+
+def bench_thumbnail_codecs(
+    count: int = 200,
+    *,
+    size: int = 256,
+    quality: int = THUMBNAIL_QUALITY,
+    seed: int = 0,
+) -> Dict[str, Dict[str, float]]:
+    """Time every thumbnail codec on *count* synthetic *size* x *size* canvases.
+
+    Canvases are encoded exactly as the GUI thumbnail cache writes them and
+    decoded back with Qt.  Returns, per codec name, the mean encode and decode
+    times in milliseconds and the mean encoded size in bytes.
+
+    Raises
+    ------
+    IPhotoError
+        Raised when Pillow is not available to generate the canvases.
+    """
+
+    if _PILLOW is None:
+        raise IPhotoError("Pillow is required to generate synthetic images")
+
+    # Qt is only needed here; keep the command line importable without it.
+    from PySide6.QtGui import QImage
+
+    from .gui.utils.thumbnail_codec import encode_thumbnail
+
+    rng = random.Random(seed)
+    canvases = []
+    for _ in range(count):
+        buffer = BytesIO()
+        _photo_like_image(rng, size).save(buffer, format="PNG")
+        canvas = QImage.fromData(buffer.getvalue(), "PNG")
+        canvases.append(canvas.convertToFormat(QImage.Format_ARGB32_Premultiplied))
+
+    results: Dict[str, Dict[str, float]] = {}
+    for codec in sorted(THUMBNAIL_CODECS):
+        started = time.perf_counter()
+        payloads = [encode_thumbnail(canvas, codec, quality) for canvas in canvases]
+        encoded = time.perf_counter()
+        decoded = [QImage.fromData(payload) for payload in payloads if payload is not None]
+        finished = time.perf_counter()
+        if len(decoded) != count or any(image.isNull() for image in decoded):
+            raise IPhotoError(f"Thumbnail codec {codec} failed to round-trip a canvas")
+        results[codec] = {
+            "encode_ms": (encoded - started) * 1000 / count,
+            "decode_ms": (finished - encoded) * 1000 / count,
+            "bytes": sum(len(payload) for payload in payloads if payload is not None) / count,
+        }
+    return results
+
+
+__all__ = [
+    "bench_json_codecs",
+    "bench_scan",
+    "bench_thumbnail_codecs",
+    "generate_synthetic_album",
+    "synthetic_index_rows",
+]
@@ -0,0 +1,387 @@
+"""Memory-mapped columnar snapshot of an album index."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from ..config import INDEX_SNAPSHOT_MIN_BYTES, WORK_DIR_NAME
+from ..utils.jsonio import dumps_line, loads
+from ..utils.logging import get_logger
+from .index_store import IndexStore
+
+try:  # pragma: no cover - optional dependency detection
+    import numpy as np
+except Exception:  # pragma: no cover - numpy not available or broken
+    np = None  # type: ignore[assignment]
+
+LOGGER = get_logger()
+
+_MAGIC = b"IPHSNAP\x01"
+_HEADER = struct.Struct("<8sI")
+_ALIGN = 8
+
+# Row fields stored in typed columns.  Strings are NUL-joined UTF-8 blobs,
+# categories are int32 codes into a small table of distinct values, integers
+# are int64 arrays and floats are float64 arrays with NaN for missing values.
+# ``gps`` mappings of the form ``{"lat": ..., "lon": ...}`` become the float
+# columns ``lat`` and ``lon``.  Anything else a row carries, or a value that
+# does not fit its column type, is kept in the per-row JSON ``extra`` column.
+_STRING_FIELDS = ("rel", "id", "dt", "content_id", "xxh3")
+_CATEGORY_FIELDS = ("mime", "make", "model", "lens", "codec")
+_INT_FIELDS = ("bytes", "w", "h", "iso", "mtime_ns", "ino")
+_FLOAT_FIELDS = (
+    "dur",
+    "frame_rate",
+    "still_image_time",
+    "f_number",
+    "exposure_time",
+    "exposure_compensation",
+    "focal_length",
+)
+# Bit positions in the ``flags`` column marking which string and integer
+# fields hold a value (categories and floats encode absence in-band).
+_FLAG_FIELDS = _STRING_FIELDS + _INT_FIELDS
+_FLAG_BITS = {name: 1 << bit for bit, name in enumerate(_FLAG_FIELDS)}
+_FIELD_KINDS = {
+    **{name: "str" for name in _STRING_FIELDS},
+    **{name: "cat" for name in _CATEGORY_FIELDS},
+    **{name: "int" for name in _INT_FIELDS},
+    **{name: "float" for name in _FLOAT_FIELDS},
+    "gps": "gps",
+}
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+_NAN = float("nan")
+
+
+def snapshot_path(album_root: Path) -> Path:
+    """Return the location of the columnar snapshot for *album_root*."""
+
+    return album_root / WORK_DIR_NAME / "index.snapshot"
+
+
+class IndexSnapshot:
+    """Read-only, memory-mapped columnar copy of the rows held by :class:`IndexStore`.
+
+    The snapshot records the :meth:`IndexStore.stamp` of the index it was built
+    from, so :meth:`load` can tell when it is stale and rebuild it.  Numeric
+    columns are exposed as NumPy views over the mapped file; :meth:`iter_rows`
+    turns columns back into row dictionaries without any JSON decoding.  Fields
+    a row did not carry come back as ``None``.
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any], buffer: mmap.mmap, base: int) -> None:
+        self.path = path
+        self._header = header
+        self._buffer = buffer
+        self._base = base
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def load(
+        cls, album_root: Path, *, min_bytes: int = INDEX_SNAPSHOT_MIN_BYTES
+    ) -> Optional["IndexSnapshot"]:
+        """Return a current snapshot of the album index, rebuilding it when stale.
+
+        Returns ``None`` when NumPy is unavailable, when the index is smaller
+        than *min_bytes* (plain JSON parsing is fast enough there) or when the
+        snapshot cannot be written; callers then read :class:`IndexStore`.
+        """
+
+        if np is None:
+            return None
+        store = IndexStore(album_root)
+        if store.storage_bytes() < min_bytes:
+            return None
+        # Taken before reading so a concurrent write can only make it stale.
+        stamp = store.stamp()
+        path = snapshot_path(album_root)
+        snapshot = cls.open(path, stamp=stamp)
+        if snapshot is not None:
+            return snapshot
+        try:
+            cls.write(path, list(store.read_all()), stamp=stamp)
+        except OSError as exc:
+            LOGGER.warning("Could not write index snapshot %s: %s", path, exc)
+            return None
+        return cls.open(path, stamp=stamp)
+
+    @classmethod
+    def open(cls, path: Path, *, stamp: Optional[str] = None) -> Optional["IndexSnapshot"]:
+        """Map the snapshot at *path*, or return ``None`` if it is missing or stale."""
+
+        if np is None:
+            return None
+        try:
+            with path.open("rb") as handle:
+                buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            magic, header_size = _HEADER.unpack_from(buffer, 0)
+            if magic != _MAGIC:
+                raise ValueError("not an index snapshot")
+            start = _HEADER.size
+            header = json.loads(buffer[start : start + header_size].decode("utf-8"))
+        except (struct.error, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable index snapshot %s: %s", path, exc)
+            buffer.close()
+            return None
+        if stamp is not None and header.get("stamp") != stamp:
+            buffer.close()
+            return None
+        return cls(path, header, buffer, _aligned(_HEADER.size + header_size))
+
+    @classmethod
+    def write(cls, path: Path, rows: Sequence[Dict[str, object]], *, stamp: str) -> None:
+        """Encode *rows* into a snapshot at *path*, replacing it atomically."""
+
+        if np is None:
+            raise RuntimeError("numpy is required to write index snapshots")
+
+        count = len(rows)
+        strings: Dict[str, List[str]] = {name: [""] * count for name in _STRING_FIELDS}
+        tables: Dict[str, Dict[str, int]] = {name: {} for name in _CATEGORY_FIELDS}
+        extras: List[str] = [""] * count
+
+        # Plain Python lists are filled first; per-element NumPy stores are slow.
+        row_flags = [0] * count
+        int_values = {name: [0] * count for name in _INT_FIELDS}
+        float_values = {name: [_NAN] * count for name in _FLOAT_FIELDS + ("lat", "lon")}
+        code_values = {name: [-1] * count for name in _CATEGORY_FIELDS}
+
+        for index, row in enumerate(rows):
+            extra: Dict[str, object] = {}
+            present = 0
+            for key, value in row.items():
+                if value is None:
+                    continue
+                kind = _FIELD_KINDS.get(key)
+                if kind == "str":
+                    if type(value) is str and "\0" not in value:
+                        strings[key][index] = value
+                        present |= _FLAG_BITS[key]
+                        continue
+                elif kind == "cat":
+                    if type(value) is str:
+                        table = tables[key]
+                        code = table.get(value)
+                        if code is None:
+                            code = table[value] = len(table)
+                        code_values[key][index] = code
+                        continue
+                elif kind == "int":
+                    if type(value) is int and _INT64_MIN <= value <= _INT64_MAX:
+                        int_values[key][index] = value
+                        present |= _FLAG_BITS[key]
+                        continue
+                elif kind == "float":
+                    if type(value) is float and value == value:
+                        float_values[key][index] = value
+                        continue
+                elif kind == "gps":
+                    if _is_plain_gps(value):
+                        float_values["lat"][index] = value["lat"]
+                        float_values["lon"][index] = value["lon"]
+                        continue
+                extra[key] = value
+            row_flags[index] = present
+            if extra:
+                extras[index] = dumps_line(extra)
+
+        flags = np.array(row_flags, dtype=np.uint32)
+        codes = {name: np.array(values, dtype=np.int32) for name, values in code_values.items()}
+        ints = {name: np.array(values, dtype=np.int64) for name, values in int_values.items()}
+        floats = {
+            name: np.array(values, dtype=np.float64) for name, values in float_values.items()
+        }
+
+        arrays: List[tuple[str, Any]] = [("flags", flags)]
+        arrays.extend(codes.items())
+        arrays.extend(ints.items())
+        arrays.extend(floats.items())
+        for name, values in strings.items():
+            arrays.append((name, _blob(values)))
+        arrays.append(("extra", _blob(extras)))
+
+        columns: Dict[str, Dict[str, object]] = {}
+        offset = 0
+        for name, array in arrays:
+            columns[name] = {"dtype": array.dtype.str, "offset": offset, "size": array.size}
+            offset = _aligned(offset + array.nbytes)
+        for name, table in tables.items():
+            columns[name]["table"] = list(table)
+        header = json.dumps(
+            {"version": 1, "stamp": stamp, "rows": count, "columns": columns},
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp_path.open("wb") as handle:
+                handle.write(_HEADER.pack(_MAGIC, len(header)))
+                handle.write(header)
+                _pad(handle)
+                for _, array in arrays:
+                    handle.write(array.tobytes())
+                    _pad(handle)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return int(self._header["rows"])
+
+    def __enter__(self) -> "IndexSnapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def stamp(self) -> Optional[str]:
+        """Return the index stamp the snapshot was built from."""
+
+        return self._header.get("stamp")
+
+    def close(self) -> None:
+        """Release the memory mapping; arrays returned earlier become invalid."""
+
+        if not self._buffer.closed:
+            self._buffer.close()
+
+    def column(self, name: str) -> Any:
+        """Return the raw NumPy array stored for column *name* (zero-copy)."""
+
+        spec = self._header["columns"][name]
+        return np.frombuffer(
+            self._buffer,
+            dtype=np.dtype(spec["dtype"]),
+            count=spec["size"],
+            offset=self._base + spec["offset"],
+        )
+
+    def geotagged_indices(self) -> Any:
+        """Return the positions of rows carrying GPS coordinates."""
+
+        lat = self.column("lat")
+        lon = self.column("lon")
+        return np.flatnonzero(~np.isnan(lat) & ~np.isnan(lon))
+
+    def iter_rows(
+        self, indices: Any = None, *, fields: Optional[Sequence[str]] = None
+    ) -> Iterator[Dict[str, object]]:
+        """Yield row dictionaries, optionally restricted to the positions *indices*.
+
+        *fields* limits the typed columns that are decoded; values kept in the
+        ``extra`` column are always merged in.
+        """
+
+        def _take(array: Any) -> Any:
+            return array if indices is None else array[indices]
+
+        def _wanted(name: str) -> bool:
+            return fields is None or name in fields
+
+        flags = _take(self.column("flags"))
+        names: List[str] = []
+        values: List[List[object]] = []
+
+        for name, bit in _FLAG_BITS.items():
+            if not _wanted(name):
+                continue
+            present = (flags & bit) != 0
+            if name in _STRING_FIELDS:
+                column = _take(np.array(self._strings(name), dtype=object))
+            else:
+                column = _take(self.column(name)).astype(object)
+            column[~present] = None
+            names.append(name)
+            values.append(column.tolist())
+        for name in filter(_wanted, _CATEGORY_FIELDS):
+            table = np.array(list(self._header["columns"][name]["table"]) + [None], dtype=object)
+            names.append(name)
+            values.append(table[_take(self.column(name))].tolist())
+        for name in filter(_wanted, _FLOAT_FIELDS):
+            raw = _take(self.column(name))
+            column = raw.astype(object)
+            column[np.isnan(raw)] = None
+            names.append(name)
+            values.append(column.tolist())
+
+        if _wanted("gps"):
+            lat = _take(self.column("lat")).tolist()
+            lon = _take(self.column("lon")).tolist()
+            names.append("gps")
+            values.append(
+                [
+                    None if latitude != latitude or longitude != longitude
+                    else {"lat": latitude, "lon": longitude}
+                    for latitude, longitude in zip(lat, lon)
+                ]
+            )
+        extras = _take(np.array(self._strings("extra"), dtype=object)).tolist()
+
+        for record, extra in zip(zip(*values), extras):
+            row = dict(zip(names, record))
+            if extra:
+                row.update(loads(extra))
+            yield row
+
+    def _strings(self, name: str) -> List[str]:
+        blob = self.column(name).tobytes().decode("utf-8")
+        return blob.split("\0") if len(self) else []
+
+
+def read_index_rows(album_root: Path) -> List[Dict[str, object]]:
+    """Return every index row of *album_root*, via the snapshot when one applies."""
+
+    snapshot = IndexSnapshot.load(album_root)
+    if snapshot is None:
+        return list(IndexStore(album_root).read_all())
+    with snapshot:
+        return list(snapshot.iter_rows())
+
+
+def read_geotagged_rows(album_root: Path) -> List[Dict[str, object]]:
+    """Return the index rows of *album_root* that carry GPS coordinates."""
+
+    snapshot = IndexSnapshot.load(album_root)
+    if snapshot is None:
+        return list(IndexStore(album_root).read_geotagged())
+    with snapshot:
+        return list(snapshot.iter_rows(snapshot.geotagged_indices()))
+
+
+def _is_plain_gps(value: object) -> bool:
+    return (
+        isinstance(value, dict)
+        and value.keys() == {"lat", "lon"}
+        and all(isinstance(value[key], float) for key in ("lat", "lon"))
+    )
+
+
+def _blob(values: List[str]) -> Any:
+    return np.frombuffer("\0".join(values).encode("utf-8"), dtype=np.uint8)
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _pad(handle: Any) -> None:
+    position = handle.tell()
+    handle.write(b"\0" * (_aligned(position) - position))
+
+
+__all__ = ["IndexSnapshot", "read_geotagged_rows", "read_index_rows", "snapshot_path"]
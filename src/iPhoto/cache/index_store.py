@@ -3,117 +3,566 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List
+from typing import Dict, Iterable, Iterator, List, Optional
 
-from ..config import WORK_DIR_NAME
+from ..config import (
+    DEFAULT_INDEX_BACKEND,
+    INDEX_BACKENDS,
+    INDEX_JOURNAL_COMPACT_MIN_BYTES,
+    INDEX_JOURNAL_COMPACT_RATIO,
+    INDEX_JOURNAL_ENABLED,
+    WORK_DIR_NAME,
+)
 from .lock import FileLock
 from ..errors import IndexCorruptedError
-from ..utils.jsonio import atomic_write_text
+from ..utils.jsonio import atomic_write_text, dumps_line, loads
+from ..utils.logging import get_logger
 
+LOGGER = get_logger()
 
-class IndexStore:
-    """Read/write helper for ``index.jsonl`` files."""
 
-    def __init__(self, album_root: Path):
+def _rel_key(value: object) -> str:
+    """Return the normalised POSIX form of an index ``rel`` value."""
+
+    return Path(str(value)).as_posix()
+
+
+class IndexBackend:
+    """Storage strategy used by :class:`IndexStore`.
+
+    Backends own the on-disk representation of the index.  Every backend must
+    implement the same row-level API so callers never need to know which file
+    format an album uses.
+    """
+
+    name: str = ""
+
+    def __init__(self, album_root: Path, path: Path):
         self.album_root = album_root
-        self.path = album_root / WORK_DIR_NAME / "index.jsonl"
-        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+
+    def exists(self) -> bool:
+        """Return ``True`` when the backing file is present on disk."""
+
+        return self.path.exists()
+
+    def storage_bytes(self) -> int:
+        """Return the size of the backing file(s) in bytes."""
+
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return 0
+
+    def stamp(self) -> str:
+        """Return a token that changes whenever the stored rows may have changed.
+
+        The token combines the backend name with the inode, size and
+        ``st_mtime_ns`` of every file in :meth:`_stamp_paths`, so computing it
+        costs a few ``stat`` calls rather than a read of the index.
+        """
+
+        parts = [self.name]
+        for path in self._stamp_paths():
+            try:
+                stat = path.stat()
+            except OSError:
+                parts.append("-")
+                continue
+            parts.append(f"{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}")
+        return "|".join(parts)
+
+    def _stamp_paths(self) -> List[Path]:
+        return [self.path]
 
     def write_rows(self, rows: Iterable[Dict[str, object]]) -> None:
-        """Rewrite the entire index with *rows*."""
+        raise NotImplementedError
 
-        payload = "\n".join(json.dumps(row, ensure_ascii=False, sort_keys=True) for row in rows)
+    def read_all(self) -> Iterator[Dict[str, object]]:
+        raise NotImplementedError
+
+    def upsert_row(self, rel: str, row: Dict[str, object]) -> None:
+        raise NotImplementedError
+
+    def remove_rows(self, rels: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    def append_rows(self, rows: Iterable[Dict[str, object]]) -> None:
+        raise NotImplementedError
+
+    def replace_from_jsonl(self, source: Path) -> None:
+        """Replace every stored row with the JSON Lines file *source*, consuming it.
+
+        The default implementation loads *source* through :meth:`write_rows`;
+        the JSONL backend renames the file into place instead.
+        """
+
+        self.write_rows(JsonlIndexBackend(self.album_root, source).read_all())
+        source.unlink(missing_ok=True)
+
+    def read_geotagged(self) -> Iterator[Dict[str, object]]:
+        """Yield rows carrying a ``gps`` mapping.
+
+        The default implementation filters :meth:`read_all`; backends with a
+        queryable index override it.
+        """
+
+        for row in self.read_all():
+            if isinstance(row.get("gps"), dict):
+                yield row
+
+    def compact(self) -> bool:
+        """Fold pending incremental writes into the main file.
+
+        Returns ``True`` when there was anything to compact.
+        """
+
+        return False
+
+    def destroy(self) -> None:
+        """Delete the backing file(s)."""
+
+        self.path.unlink(missing_ok=True)
+
+
+class JsonlIndexBackend(IndexBackend):
+    """Plain-text backend storing one JSON document per line in ``index.jsonl``.
+
+    With *journal* enabled, row-level updates are appended as delta records to
+    an ``index.journal`` sidecar instead of rewriting the snapshot.  Each journal
+    line is either ``{"op": "upsert", "rel": ..., "row": {...}}`` or a tombstone
+    ``{"op": "remove", "rel": ...}``.  Readers replay the journal over the
+    snapshot, and :meth:`compact` folds it back into ``index.jsonl`` once it
+    outgrows :data:`INDEX_JOURNAL_COMPACT_MIN_BYTES` and
+    :data:`INDEX_JOURNAL_COMPACT_RATIO` times the snapshot size.
+
+    Journaling is opt-in per album: the presence of ``index.journal`` (even an
+    empty one) keeps it enabled, so external tools reading ``index.jsonl`` must
+    replay the sidecar whenever it is non-empty.
+    """
+
+    name = "jsonl"
+
+    def __init__(self, album_root: Path, path: Path, *, journal: bool = False):
+        super().__init__(album_root, path)
+        self.journal_enabled = journal
+        self.journal_path = path.with_name("index.journal")
+
+    def exists(self) -> bool:
+        return self.path.exists() or self._journal_size() > 0
+
+    def storage_bytes(self) -> int:
+        """Return the combined size of the snapshot and its pending journal."""
+
+        try:
+            snapshot_size = self.path.stat().st_size
+        except OSError:
+            snapshot_size = 0
+        return snapshot_size + self._journal_size()
+
+    def _stamp_paths(self) -> List[Path]:
+        return [self.path, self.journal_path]
+
+    def _journal_size(self) -> int:
+        try:
+            return self.journal_path.stat().st_size
+        except OSError:
+            return 0
+
+    def write_rows(self, rows: Iterable[Dict[str, object]]) -> None:
+        """Rewrite the entire index with *rows* and discard the journal."""
+
+        payload = "\n".join(dumps_line(row) for row in rows)
         if payload:
             payload += "\n"
         with FileLock(self.album_root, "index"):
+            # *rows* supersede every pending delta, so the journal is cleared
+            # first: replaying it over the new snapshot after an interrupted
+            # write would resurrect stale rows.
+            self._reset_journal()
             atomic_write_text(self.path, payload)
 
+    def replace_from_jsonl(self, source: Path) -> None:
+        """Rename *source* over the snapshot; it already uses the snapshot format."""
+
+        with FileLock(self.album_root, "index"):
+            self._reset_journal()
+            os.replace(source, self.path)
+
+    def _reset_journal(self) -> None:
+        if self.journal_enabled:
+            self.journal_path.write_bytes(b"")
+        else:
+            self.journal_path.unlink(missing_ok=True)
+
     def read_all(self) -> Iterator[Dict[str, object]]:
-        """Yield all rows from the index."""
+        """Yield all rows from the index, replaying pending journal records."""
+
+        if self._journal_size() == 0:
+            return self._read_snapshot()
+
+        def _replayed() -> Iterator[Dict[str, object]]:
+            merged: Dict[str, Dict[str, object]] = {}
+            # A shared lock keeps a compaction from swapping the snapshot
+            # between reading it and reading the journal.
+            with FileLock(self.album_root, "index", shared=True):
+                for row in self._read_snapshot():
+                    merged[_rel_key(row.get("rel", ""))] = row
+                for record in self._read_journal():
+                    rel_key = _rel_key(record.get("rel", ""))
+                    if record.get("op") == "remove":
+                        merged.pop(rel_key, None)
+                    else:
+                        row = record.get("row")
+                        if isinstance(row, dict):
+                            merged[rel_key] = row
+            yield from merged.values()
 
+        return _replayed()
+
+    def _read_snapshot(self) -> Iterator[Dict[str, object]]:
         if not self.path.exists():
-            return iter(())
+            return
+        try:
+            # Lines are decoded straight from bytes; the codec parses UTF-8.
+            with self.path.open("rb") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    yield loads(line)
+        except json.JSONDecodeError as exc:
+            raise IndexCorruptedError(f"Corrupted index file: {self.path}") from exc
 
-        def _iterator() -> Iterator[Dict[str, object]]:
-            try:
-                with self.path.open("r", encoding="utf-8") as handle:
-                    for line in handle:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        yield json.loads(line)
-            except json.JSONDecodeError as exc:
-                raise IndexCorruptedError(f"Corrupted index file: {self.path}") from exc
+    def _read_journal(self) -> Iterator[Dict[str, object]]:
+        try:
+            handle = self.journal_path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = loads(line)
+                except json.JSONDecodeError:
+                    # Appends are fsynced one batch at a time, so an undecodable
+                    # line can only be a record torn by an interrupted writer.
+                    # That delta never completed and is skipped.
+                    LOGGER.warning("Ignoring incomplete journal record in %s", self.journal_path)
+                    continue
+                if isinstance(record, dict):
+                    yield record
 
-        return _iterator()
+    def _append_journal(self, records: List[Dict[str, object]]) -> None:
+        payload = "".join(
+            dumps_line(record) + "\n" for record in records
+        )
+        with FileLock(self.album_root, "index"):
+            with self.journal_path.open("a+b") as handle:
+                # Terminate a torn trailing record so the new batch starts on
+                # its own line.
+                if handle.tell() > 0:
+                    handle.seek(-1, os.SEEK_END)
+                    if handle.read(1) != b"\n":
+                        payload = "\n" + payload
+                handle.write(payload.encode("utf-8"))
+                handle.flush()
+                os.fsync(handle.fileno())
+            if self._needs_compaction():
+                self._compact_locked()
+
+    def _needs_compaction(self) -> bool:
+        journal_size = self._journal_size()
+        if journal_size == 0:
+            return False
+        try:
+            snapshot_size = self.path.stat().st_size
+        except FileNotFoundError:
+            snapshot_size = 0
+        threshold = max(
+            INDEX_JOURNAL_COMPACT_MIN_BYTES, snapshot_size * INDEX_JOURNAL_COMPACT_RATIO
+        )
+        return journal_size > threshold
+
+    def compact(self) -> bool:
+        """Fold pending journal records into the snapshot.
+
+        Returns ``True`` when a journal existed and was compacted.
+        """
+
+        with FileLock(self.album_root, "index"):
+            return self._compact_locked()
+
+    def _compact_locked(self) -> bool:
+        if self._journal_size() == 0:
+            return False
+        rows = list(self.read_all())
+        payload = "".join(dumps_line(row) + "\n" for row in rows)
+        # Swap in the folded snapshot before clearing the journal.  Replaying
+        # upserts and tombstones is idempotent, so a journal that survives an
+        # interrupted compaction (or is still read by an unlocked reader) only
+        # re-applies changes the new snapshot already contains.
+        atomic_write_text(self.path, payload)
+        self._reset_journal()
+        LOGGER.debug("Compacted index journal for %s (%s rows)", self.album_root, len(rows))
+        return True
 
     def upsert_row(self, rel: str, row: Dict[str, object]) -> None:
         """Insert or update a single row identified by *rel*."""
 
-        data = {existing["rel"]: existing for existing in self.read_all()}
-        data[rel] = row
-        self.write_rows(data.values())
+        if self.journal_enabled:
+            self._append_journal([{"op": "upsert", "rel": rel, "row": row}])
+            return
+
+        with FileLock(self.album_root, "index"):
+            data = {existing["rel"]: existing for existing in self.read_all()}
+            data[rel] = row
+            self.write_rows(data.values())
 
     def remove_rows(self, rels: Iterable[str]) -> None:
         """Drop any index rows whose ``rel`` key matches *rels*.
 
-        The helper loads the existing payload once, filters out the requested
-        entries, and rewrites the file atomically.  This mirrors the behaviour
-        of :meth:`write_rows` so concurrent processes never observe a partially
-        written ``index.jsonl`` file.
+        Without a journal the helper loads the existing payload once, filters
+        out the requested entries, and rewrites the file atomically.  This
+        mirrors the behaviour of :meth:`write_rows` so concurrent processes
+        never observe a partially written ``index.jsonl`` file.  With a journal
+        a tombstone per *rel* is appended instead.
         """
 
-        removable = {Path(rel).as_posix() for rel in rels}
+        removable = {_rel_key(rel) for rel in rels}
         if not removable:
             return
 
-        remaining: List[Dict[str, object]] = []
-        removed_any = False
-        for row in self.read_all():
-            rel_key = Path(str(row.get("rel", ""))).as_posix()
-            if rel_key in removable:
-                removed_any = True
-                continue
-            remaining.append(row)
-
-        # Rewrite the file only when something actually changed.  Skipping the
-        # write keeps the lock duration short if the target rows were absent.
-        if not removed_any:
+        if self.journal_enabled:
+            self._append_journal([{"op": "remove", "rel": rel} for rel in sorted(removable)])
             return
 
-        self.write_rows(remaining)
+        # The read-modify-write runs under one exclusive lock (re-entered by
+        # :meth:`write_rows`) so concurrent writers cannot lose each other's rows.
+        with FileLock(self.album_root, "index"):
+            remaining: List[Dict[str, object]] = []
+            removed_any = False
+            for row in self.read_all():
+                rel_key = _rel_key(row.get("rel", ""))
+                if rel_key in removable:
+                    removed_any = True
+                    continue
+                remaining.append(row)
+
+            # Rewrite the file only when something actually changed.  Skipping the
+            # write keeps the lock duration short if the target rows were absent.
+            if not removed_any:
+                return
+
+            self.write_rows(remaining)
 
     def append_rows(self, rows: Iterable[Dict[str, object]]) -> None:
         """Merge *rows* into the index, replacing duplicates by ``rel`` key.
 
-        Appending new entries requires keeping existing rows intact.  The
-        implementation reads the current snapshot once, merges the incoming
-        payload, and relies on :meth:`write_rows` to persist the result using an
-        atomic rename so interrupted writes cannot corrupt the cache.
+        Appending new entries requires keeping existing rows intact.  Without a
+        journal the implementation reads the current snapshot once, merges the
+        incoming payload, and relies on :meth:`write_rows` to persist the result
+        using an atomic rename so interrupted writes cannot corrupt the cache.
+        With a journal each row becomes an upsert record, so the cost is
+        proportional to the number of rows appended.
         """
 
-        additions = list(rows)
+        additions = [row for row in rows if row.get("rel") is not None]
         if not additions:
             return
 
-        merged: Dict[str, Dict[str, object]] = {}
-        for row in self.read_all():
-            rel_key = Path(str(row.get("rel", ""))).as_posix()
-            merged[rel_key] = row
+        if self.journal_enabled:
+            self._append_journal(
+                [{"op": "upsert", "rel": _rel_key(row["rel"]), "row": row} for row in additions]
+            )
+            return
 
-        changed = False
-        for row in additions:
-            rel_value = row.get("rel")
-            if rel_value is None:
-                continue
-            rel_key = Path(str(rel_value)).as_posix()
-            existing = merged.get(rel_key)
-            if existing != row:
-                changed = True
-            merged[rel_key] = row
+        with FileLock(self.album_root, "index"):
+            merged: Dict[str, Dict[str, object]] = {}
+            for row in self.read_all():
+                merged[_rel_key(row.get("rel", ""))] = row
 
-        if not changed:
-            return
+            changed = False
+            for row in additions:
+                rel_key = _rel_key(row["rel"])
+                existing = merged.get(rel_key)
+                if existing != row:
+                    changed = True
+                merged[rel_key] = row
+
+            if not changed:
+                return
+
+            self.write_rows(merged.values())
+
+    def destroy(self) -> None:
+        self.journal_path.unlink(missing_ok=True)
+        self.path.unlink(missing_ok=True)
+
+
+def _create_backend(name: str, album_root: Path, work_dir: Path) -> IndexBackend:
+    if name == "jsonl":
+        path = work_dir / "index.jsonl"
+        journal = INDEX_JOURNAL_ENABLED or path.with_name("index.journal").exists()
+        return JsonlIndexBackend(album_root, path, journal=journal)
+    if name == "sqlite":
+        from .sqlite_index import SqliteIndexBackend
+
+        return SqliteIndexBackend(album_root, work_dir / "index.db")
+    raise ValueError(f"Unknown index backend {name!r}; expected one of {sorted(INDEX_BACKENDS)}")
+
+
+class IndexStore:
+    """Read/write helper for the album index.
+
+    The store delegates to a pluggable :class:`IndexBackend`.  When *backend* is
+    ``None`` the backend already present in the album's work directory is used
+    (``index.db`` selects SQLite), falling back to :data:`DEFAULT_INDEX_BACKEND`
+    for albums that have not been indexed yet.
+    """
+
+    def __init__(self, album_root: Path, *, backend: Optional[str] = None):
+        self.album_root = album_root
+        work_dir = album_root / WORK_DIR_NAME
+        work_dir.mkdir(parents=True, exist_ok=True)
+        # ``path`` keeps pointing at the JSONL location because it doubles as
+        # the portable export format regardless of the active backend.
+        self.path = work_dir / "index.jsonl"
+        if backend is None:
+            backend = "sqlite" if (work_dir / "index.db").exists() else DEFAULT_INDEX_BACKEND
+        self._backend = _create_backend(backend, album_root, work_dir)
+
+    @property
+    def backend_name(self) -> str:
+        """Return the identifier of the active backend (``"jsonl"`` or ``"sqlite"``)."""
+
+        return self._backend.name
+
+    @property
+    def storage_path(self) -> Path:
+        """Return the file that holds the index for the active backend."""
+
+        return self._backend.path
+
+    def storage_bytes(self) -> int:
+        """Return the on-disk size of the index, including pending journal records."""
+
+        return self._backend.storage_bytes()
+
+    def stamp(self) -> str:
+        """Return a cheap validity token for the stored rows.
+
+        Two equal stamps mean the index files were not rewritten in between, so
+        data derived from the rows (such as ``links.json``) is still current.
+        """
+
+        return self._backend.stamp()
+
+    @property
+    def journal_enabled(self) -> bool:
+        """Return ``True`` when row updates are recorded in ``index.journal``."""
+
+        return isinstance(self._backend, JsonlIndexBackend) and self._backend.journal_enabled
 
-        self.write_rows(merged.values())
+    def set_journal(self, enabled: bool) -> None:
+        """Enable or disable the append-only journal of the JSONL backend.
+
+        The choice is stored with the album: an ``index.journal`` file keeps
+        journaling active, and disabling it folds pending records into
+        ``index.jsonl`` before the sidecar is removed.
+        """
+
+        backend = self._backend
+        if not isinstance(backend, JsonlIndexBackend):
+            raise ValueError("The index journal is only available for the jsonl backend")
+        with FileLock(self.album_root, "index"):
+            if enabled:
+                if not backend.journal_path.exists():
+                    backend.journal_path.write_bytes(b"")
+            else:
+                backend._compact_locked()
+                backend.journal_path.unlink(missing_ok=True)
+        backend.journal_enabled = enabled
+
+    def write_rows(self, rows: Iterable[Dict[str, object]]) -> None:
+        """Rewrite the entire index with *rows*."""
+
+        self._backend.write_rows(rows)
+
+    def read_all(self) -> Iterator[Dict[str, object]]:
+        """Yield all rows from the index."""
+
+        return self._backend.read_all()
+
+    def read_geotagged(self) -> Iterator[Dict[str, object]]:
+        """Yield only the rows that carry GPS coordinates."""
+
+        return self._backend.read_geotagged()
+
+    def upsert_row(self, rel: str, row: Dict[str, object]) -> None:
+        """Insert or update a single row identified by *rel*."""
+
+        self._backend.upsert_row(rel, row)
+
+    def remove_rows(self, rels: Iterable[str]) -> None:
+        """Drop any index rows whose ``rel`` key matches *rels*."""
+
+        self._backend.remove_rows(rels)
+
+    def append_rows(self, rows: Iterable[Dict[str, object]]) -> None:
+        """Merge *rows* into the index, replacing duplicates by ``rel`` key."""
+
+        self._backend.append_rows(rows)
+
+    def replace_from_jsonl(self, source: Path) -> None:
+        """Atomically replace the index with the rows of the JSON Lines file *source*.
+
+        *source* is consumed: it is renamed into place or deleted after import.
+        """
+
+        self._backend.replace_from_jsonl(source)
+
+    def compact(self) -> bool:
+        """Fold pending incremental writes (journal or WAL) into the main file."""
+
+        return self._backend.compact()
+
+    def export_jsonl(self, destination: Optional[Path] = None) -> Path:
+        """Write the current rows as JSON Lines and return the written path.
+
+        Without *destination* the JSONL backend folds any pending journal into
+        ``index.jsonl`` and returns it, while other backends export to
+        ``index.jsonl`` in the album root so no stale copy is left inside the
+        work directory for a later migration to pick up.
+        """
+
+        if destination is None:
+            if self._backend.name == "jsonl":
+                self._backend.compact()
+                return self.path
+            destination = self.album_root / "index.jsonl"
+        target = destination
+        rows = self.read_all()
+        payload = "".join(dumps_line(row) + "\n" for row in rows)
+        atomic_write_text(target, payload)
+        return target
+
+    def convert(self, backend: str) -> None:
+        """Migrate the index to *backend*, removing the previous storage file."""
+
+        if backend == self._backend.name:
+            return
+        target = _create_backend(backend, self.album_root, self.path.parent)
+        rows = list(self.read_all())
+        previous = self._backend
+        # ``write_rows`` replaces the whole index, so neither backend imports
+        # the previous storage file; the SQLite backend deletes a leftover
+        # ``index.jsonl`` itself and ``previous.destroy`` covers the rest.
+        target.write_rows(rows)
+        if previous.path != target.path:
+            previous.destroy()
+        self._backend = target
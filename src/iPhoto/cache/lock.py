@@ -4,29 +4,228 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator
+from typing import Dict, Optional
 
 from ..config import LOCK_EXPIRE_SEC, WORK_DIR_NAME
 from ..errors import LockTimeoutError
+from ..utils.logging import get_logger
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+LOGGER = get_logger()
+
+
+@dataclass
+class LockWaitStats:
+    """Acquisition counters for one lock name, aggregated over the process."""
+
+    acquired: int = 0
+    contended: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+_STATS: Dict[str, LockWaitStats] = {}
+_STATS_LOCK = threading.Lock()
+# Locks held by the current thread, keyed by lock file path, so nested
+# acquisitions of the same lock (for example a reader running inside a writer's
+# critical section) do not deadlock on a second file descriptor.
+_HELD = threading.local()
+
+
+def lock_wait_stats() -> Dict[str, LockWaitStats]:
+    """Return a snapshot of the wait-time counters keyed by lock name."""
+
+    with _STATS_LOCK:
+        return {
+            name: LockWaitStats(
+                stats.acquired, stats.contended, stats.wait_seconds, stats.max_wait_seconds
+            )
+            for name, stats in _STATS.items()
+        }
+
+
+def _record_wait(name: str, waited: Optional[float]) -> None:
+    with _STATS_LOCK:
+        stats = _STATS.setdefault(name, LockWaitStats())
+        stats.acquired += 1
+        if waited is not None:
+            stats.contended += 1
+            stats.wait_seconds += waited
+            stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+
+
+def _held_locks() -> Dict[Path, list]:
+    held = getattr(_HELD, "locks", None)
+    if held is None:
+        held = _HELD.locks = {}
+    return held
 
 
 class FileLock:
-    """A cooperative lock implemented using ``.lock`` files."""
+    """A cooperative inter-process lock for album metadata files.
+
+    Where :mod:`fcntl` is available the lock is an advisory ``flock`` on
+    ``locks/<name>.flock``: readers pass ``shared=True`` and may hold it
+    together, writers hold it exclusively, and a contended acquisition blocks
+    in the kernel rather than polling.  The kernel drops the lock when its
+    holder exits, so no expiry is needed.  Acquisitions are re-entrant per
+    thread; a shared request inside an exclusive section reuses the exclusive
+    lock.
 
-    def __init__(self, album_root: Path, name: str):
-        self.lock_path = album_root / WORK_DIR_NAME / "locks" / f"{name}.lock"
-        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+    Elsewhere, or when the file system rejects ``flock``, the original
+    protocol is used: writers create ``locks/<name>.lock`` with ``O_EXCL`` and
+    poll until it disappears or expires after :data:`LOCK_EXPIRE_SEC`.  Shared
+    acquisitions are no-ops there, as readers historically took no lock.
+    """
+
+    def __init__(self, album_root: Path, name: str, *, shared: bool = False):
+        self.name = name
+        self.shared = shared
+        locks_dir = album_root / WORK_DIR_NAME / "locks"
+        self.lock_path = locks_dir / f"{name}.lock"
+        self.flock_path = locks_dir / f"{name}.flock"
+        locks_dir.mkdir(parents=True, exist_ok=True)
+        self._fd: Optional[int] = None
+        self._mode: Optional[str] = None
 
     def acquire(self, *, timeout: float = LOCK_EXPIRE_SEC) -> None:
-        deadline = time.monotonic() + timeout
+        """Acquire the lock, raising :class:`LockTimeoutError` after *timeout* seconds."""
+
+        held = _held_locks()
+        entry = held.get(self.flock_path)
+        if entry is not None:
+            if entry[0] == "shared" and not self.shared:
+                # Upgrading would deadlock against our own shared lock.
+                raise LockTimeoutError(
+                    f"Cannot upgrade shared lock {self.flock_path} to exclusive"
+                )
+            entry[1] += 1
+            self._mode = "nested"
+            return
+
+        if fcntl is not None:
+            fd = self._acquire_flock(timeout)
+            if fd is not None:
+                self._fd = fd
+                self._mode = "flock"
+                held[self.flock_path] = ["shared" if self.shared else "exclusive", 1]
+                return
+        if self.shared:
+            self._mode = "none"
+            return
+        self._acquire_lock_file(timeout)
+        self._mode = "file"
+        held[self.flock_path] = ["exclusive", 1]
+
+    def release(self) -> None:
+        mode, self._mode = self._mode, None
+        if mode is None or mode == "none":
+            return
+        held = _held_locks()
+        entry = held.get(self.flock_path)
+        if mode == "nested":
+            if entry is not None:
+                entry[1] -= 1
+            return
+        held.pop(self.flock_path, None)
+        if mode == "flock" and self._fd is not None:
+            fd, self._fd = self._fd, None
+            try:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+            return
+        try:
+            self.lock_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    # ------------------------------------------------------------------
+    # flock implementation
+    # ------------------------------------------------------------------
+    def _acquire_flock(self, timeout: float) -> Optional[int]:
+        """Return a descriptor holding the flock, or ``None`` if unsupported here."""
+
+        operation = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+        fd = os.open(self.flock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, operation | fcntl.LOCK_NB)
+        except BlockingIOError:
+            pass
+        except OSError as exc:
+            # ``ENOLCK``/``EOPNOTSUPP`` on some network file systems.
+            os.close(fd)
+            LOGGER.debug("flock unavailable for %s (%s); using lock files", self.flock_path, exc)
+            return None
+        else:
+            _record_wait(self.name, None)
+            return fd
+
+        # Contended: block in the kernel on a helper thread so the wait can be
+        # bounded by *timeout* without polling.
+        started = time.monotonic()
+        acquired = threading.Event()
+        guard = threading.Lock()
+        state = {"abandoned": False, "error": None}
+
+        def _wait() -> None:
+            try:
+                fcntl.flock(fd, operation)
+            except OSError as exc:
+                state["error"] = exc
+            with guard:
+                if state["abandoned"]:
+                    # The caller gave up; dropping the descriptor releases
+                    # anything acquired after the timeout.
+                    os.close(fd)
+                    return
+                acquired.set()
+
+        threading.Thread(target=_wait, name=f"iphoto-lock-{self.name}", daemon=True).start()
+        finished = acquired.wait(timeout)
+        with guard:
+            if not finished and not acquired.is_set():
+                state["abandoned"] = True
+                raise LockTimeoutError(f"Timed out acquiring lock {self.flock_path}")
+        if state["error"] is not None:
+            os.close(fd)
+            raise LockTimeoutError(f"Failed to acquire lock {self.flock_path}: {state['error']}")
+        waited = time.monotonic() - started
+        _record_wait(self.name, waited)
+        LOGGER.debug("Waited %.3fs for %s lock %s", waited, self._kind(), self.flock_path)
+        return fd
+
+    def _kind(self) -> str:
+        return "shared" if self.shared else "exclusive"
+
+    # ------------------------------------------------------------------
+    # Lock-file fallback
+    # ------------------------------------------------------------------
+    def _acquire_lock_file(self, timeout: float) -> None:
+        started = time.monotonic()
+        deadline = started + timeout
         info = {
             "pid": os.getpid(),
             "time": time.time(),
             "host": os.uname().nodename if hasattr(os, "uname") else "unknown",
         }
         payload = json.dumps(info)
+        contended = False
         while True:
             try:
                 fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
@@ -34,8 +233,10 @@ class FileLock:
                     os.write(fd, payload.encode("utf-8"))
                 finally:
                     os.close(fd)
+                _record_wait(self.name, time.monotonic() - started if contended else None)
                 return
             except FileExistsError:
+                contended = True
                 if time.monotonic() > deadline:
                     raise LockTimeoutError(f"Timed out acquiring lock {self.lock_path}")
                 # Check expiry
@@ -47,15 +248,5 @@ class FileLock:
                     pass
                 time.sleep(0.1)
 
-    def release(self) -> None:
-        try:
-            self.lock_path.unlink()
-        except FileNotFoundError:
-            pass
-
-    def __enter__(self) -> "FileLock":
-        self.acquire()
-        return self
 
-    def __exit__(self, exc_type, exc, tb) -> None:
-        self.release()
+__all__ = ["FileLock", "LockWaitStats", "lock_wait_stats"]
@@ -0,0 +1,115 @@
+"""Resumable spill file for rows produced by an in-progress scan."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from ..config import SCAN_CHECKPOINT_ROWS, WORK_DIR_NAME
+from ..utils.jsonio import dumps_line, loads
+from ..utils.logging import get_logger
+from .index_store import IndexStore, _rel_key
+
+LOGGER = get_logger()
+
+
+class ScanCheckpoint:
+    """Stream scan results to ``index.scan.jsonl`` and promote them when done.
+
+    Rows are appended to the checkpoint as the scanner yields them and flushed to
+    disk every :data:`SCAN_CHECKPOINT_ROWS` rows, so a cancelled or crashed scan
+    keeps everything processed so far.  The file doubles as the progress
+    marker: every row carries its stat fingerprint, so feeding the checkpoint
+    back to the incremental scanner (see :meth:`merge_existing`) skips the files
+    that were already processed.  :meth:`promote` swaps the completed file in as
+    the album index.
+    """
+
+    def __init__(self, album_root: Path) -> None:
+        self.album_root = album_root
+        self.path = album_root / WORK_DIR_NAME / "index.scan.jsonl"
+
+    def exists(self) -> bool:
+        """Return ``True`` when an interrupted or running scan left rows behind."""
+
+        return self.path.exists()
+
+    def read_rows(self) -> List[Dict[str, object]]:
+        """Return the rows recorded so far, skipping a torn trailing line."""
+
+        try:
+            handle = self.path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            return []
+        rows: List[Dict[str, object]] = []
+        with handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = loads(line)
+                except json.JSONDecodeError:
+                    LOGGER.warning("Ignoring incomplete checkpoint row in %s", self.path)
+                    continue
+                if isinstance(row, dict):
+                    rows.append(row)
+        return rows
+
+    def merge_existing(
+        self, existing_rows: Optional[Iterable[Dict[str, object]]]
+    ) -> Optional[List[Dict[str, object]]]:
+        """Overlay checkpointed rows on *existing_rows* to resume a previous scan.
+
+        Returns ``None`` when there is neither a checkpoint nor *existing_rows*,
+        which keeps the scanner in full-scan mode.
+        """
+
+        resumed = self.read_rows()
+        if not resumed:
+            return list(existing_rows) if existing_rows is not None else None
+        LOGGER.info("Resuming scan of %s from %s checkpointed rows", self.album_root, len(resumed))
+        merged: Dict[str, Dict[str, object]] = {}
+        for row in existing_rows or ():
+            merged[_rel_key(row.get("rel", ""))] = row
+        for row in resumed:
+            merged[_rel_key(row.get("rel", ""))] = row
+        return list(merged.values())
+
+    def record(self, rows: Iterable[Dict[str, object]]) -> Iterator[Dict[str, object]]:
+        """Write each of *rows* to the checkpoint and yield it unchanged.
+
+        The checkpoint is rewritten from scratch, so callers must read any
+        previous progress with :meth:`merge_existing` before iterating.
+        """
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w", encoding="utf-8") as handle:
+            pending = 0
+            try:
+                for row in rows:
+                    handle.write(dumps_line(row) + "\n")
+                    pending += 1
+                    if pending >= SCAN_CHECKPOINT_ROWS:
+                        handle.flush()
+                        os.fsync(handle.fileno())
+                        pending = 0
+                    yield row
+            finally:
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    def promote(self, store: IndexStore) -> None:
+        """Atomically replace the index held by *store* with the checkpoint."""
+
+        store.replace_from_jsonl(self.path)
+
+    def discard(self) -> None:
+        """Delete the checkpoint file."""
+
+        self.path.unlink(missing_ok=True)
+
+
+__all__ = ["ScanCheckpoint"]
@@ -0,0 +1,222 @@
+"""SQLite-backed storage for album index rows."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from ..errors import IndexCorruptedError
+from ..utils.jsonio import dumps_line, loads
+from ..utils.logging import get_logger
+from .index_store import IndexBackend, JsonlIndexBackend, _rel_key
+from .lock import FileLock
+
+LOGGER = get_logger()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    rel TEXT PRIMARY KEY,
+    id TEXT,
+    dt TEXT,
+    content_id TEXT,
+    has_gps INTEGER NOT NULL DEFAULT 0,
+    row TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assets_id ON assets(id);
+CREATE INDEX IF NOT EXISTS assets_dt ON assets(dt);
+CREATE INDEX IF NOT EXISTS assets_content_id ON assets(content_id);
+CREATE INDEX IF NOT EXISTS assets_has_gps ON assets(has_gps);
+PRAGMA user_version = 1;
+"""
+
+_UPSERT = """
+INSERT INTO assets (rel, id, dt, content_id, has_gps, row)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(rel) DO UPDATE SET
+    id = excluded.id,
+    dt = excluded.dt,
+    content_id = excluded.content_id,
+    has_gps = excluded.has_gps,
+    row = excluded.row
+"""
+
+
+def _to_record(rel: str, row: Dict[str, object]) -> Tuple[object, ...]:
+    """Return the column tuple stored for *row* under the primary key *rel*."""
+
+    gps = row.get("gps")
+    has_gps = isinstance(gps, dict) and gps.get("lat") is not None and gps.get("lon") is not None
+    return (
+        rel,
+        row.get("id") if isinstance(row.get("id"), str) else None,
+        row.get("dt") if isinstance(row.get("dt"), str) else None,
+        row.get("content_id") if isinstance(row.get("content_id"), str) else None,
+        1 if has_gps else 0,
+        dumps_line(row),
+    )
+
+
+class SqliteIndexBackend(IndexBackend):
+    """Index backend storing rows in a WAL-mode SQLite database (``index.db``).
+
+    ``rel`` is the primary key, so single-row updates and removals touch only
+    the affected rows instead of rewriting the whole index.  Secondary indexes
+    on ``id``, ``dt``, ``content_id`` and GPS presence keep lookups cheap.  The
+    full row is kept as a JSON document so the row schema stays open-ended.
+
+    When the database does not exist yet but an ``index.jsonl`` file does, the
+    JSONL rows are imported on first access and the text file is removed so the
+    album keeps a single source of truth.
+    """
+
+    name = "sqlite"
+
+    @property
+    def _legacy_path(self) -> Path:
+        return self.path.with_name("index.jsonl")
+
+    def _stamp_paths(self) -> List[Path]:
+        # Committed transactions land in the write-ahead log first.
+        return [self.path, Path(f"{self.path}-wal")]
+
+    @contextmanager
+    def _connect(self, *, write: bool = False) -> Iterator[sqlite3.Connection]:
+        """Open the database, preparing the schema only for writers.
+
+        ``journal_mode=WAL`` is persistent, so readers need neither the pragma
+        nor any DDL and never take a write lock on the file.
+        """
+
+        if write:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            connection = sqlite3.connect(self.path, timeout=30.0)
+        except sqlite3.Error as exc:
+            raise IndexCorruptedError(f"Cannot open index database {self.path}: {exc}") from exc
+        with closing(connection):
+            try:
+                if write:
+                    connection.execute("PRAGMA synchronous=NORMAL")
+                    (version,) = connection.execute("PRAGMA user_version").fetchone()
+                    if version == 0:
+                        connection.execute("PRAGMA journal_mode=WAL")
+                        connection.executescript(_SCHEMA)
+                yield connection
+            except sqlite3.DatabaseError as exc:
+                raise IndexCorruptedError(f"Corrupted index database: {self.path}") from exc
+
+    def _migrate_legacy(self) -> None:
+        """Import ``index.jsonl`` into a freshly created database."""
+
+        if self.path.exists() or not self._legacy_path.exists():
+            return
+        legacy = JsonlIndexBackend(self.album_root, self._legacy_path)
+        with FileLock(self.album_root, "index"):
+            if self.path.exists():
+                return
+            rows = list(legacy.read_all())
+            with self._connect(write=True) as connection:
+                with connection:
+                    connection.executemany(
+                        _UPSERT,
+                        (_to_record(_rel_key(row.get("rel", "")), row) for row in rows),
+                    )
+            legacy.destroy()
+        LOGGER.info("Imported %s index rows from %s", len(rows), legacy.path)
+
+    def write_rows(self, rows: Iterable[Dict[str, object]]) -> None:
+        """Replace every stored row with *rows* in a single transaction.
+
+        *rows* supersede any legacy ``index.jsonl``, so the text file is
+        removed rather than imported first.
+        """
+
+        records = [_to_record(_rel_key(row.get("rel", "")), row) for row in rows]
+        with FileLock(self.album_root, "index"):
+            with self._connect(write=True) as connection:
+                with connection:
+                    connection.execute("DELETE FROM assets")
+                    connection.executemany(_UPSERT, records)
+            JsonlIndexBackend(self.album_root, self._legacy_path).destroy()
+
+    def read_all(self) -> Iterator[Dict[str, object]]:
+        """Yield all rows in insertion order."""
+
+        self._migrate_legacy()
+        if not self.path.exists():
+            return iter(())
+        return self._query("SELECT row FROM assets ORDER BY rowid")
+
+    def read_geotagged(self) -> Iterator[Dict[str, object]]:
+        """Yield rows with GPS coordinates using the ``has_gps`` index."""
+
+        self._migrate_legacy()
+        if not self.path.exists():
+            return iter(())
+        return self._query("SELECT row FROM assets WHERE has_gps = 1 ORDER BY rowid")
+
+    def _query(self, sql: str) -> Iterator[Dict[str, object]]:
+        with self._connect() as connection:
+            payloads: List[str] = [payload for (payload,) in connection.execute(sql)]
+
+        def _iterator() -> Iterator[Dict[str, object]]:
+            for payload in payloads:
+                try:
+                    yield loads(payload)
+                except json.JSONDecodeError as exc:
+                    raise IndexCorruptedError(f"Corrupted index row in {self.path}") from exc
+
+        return _iterator()
+
+    def upsert_row(self, rel: str, row: Dict[str, object]) -> None:
+        """Insert or update the row stored under *rel*."""
+
+        self._migrate_legacy()
+        with FileLock(self.album_root, "index"), self._connect(write=True) as connection:
+            with connection:
+                connection.execute(_UPSERT, _to_record(_rel_key(rel), row))
+
+    def remove_rows(self, rels: Iterable[str]) -> None:
+        """Delete the rows whose primary key matches any of *rels*."""
+
+        removable = [(_rel_key(rel),) for rel in rels]
+        if not removable:
+            return
+        self._migrate_legacy()
+        with FileLock(self.album_root, "index"), self._connect(write=True) as connection:
+            with connection:
+                connection.executemany("DELETE FROM assets WHERE rel = ?", removable)
+
+    def append_rows(self, rows: Iterable[Dict[str, object]]) -> None:
+        """Upsert *rows*, replacing existing entries that share a ``rel`` key."""
+
+        records = [
+            _to_record(_rel_key(row["rel"]), row) for row in rows if row.get("rel") is not None
+        ]
+        if not records:
+            return
+        self._migrate_legacy()
+        with FileLock(self.album_root, "index"), self._connect(write=True) as connection:
+            with connection:
+                connection.executemany(_UPSERT, records)
+
+    def compact(self) -> bool:
+        """Checkpoint the write-ahead log into the main database file."""
+
+        if not self.path.exists():
+            return False
+        with FileLock(self.album_root, "index"), self._connect() as connection:
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return True
+
+    def destroy(self) -> None:
+        """Delete the database together with its WAL side files."""
+
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+
+
+__all__ = ["SqliteIndexBackend"]
@@ -0,0 +1,430 @@
+"""Disk cache for encoded thumbnails, packed into large append-only files."""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import re
+import struct
+import threading
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import xxhash
+
+from ..config import (
+    DEFAULT_THUMBNAIL_CODEC,
+    DEFAULT_THUMBNAIL_STORE_LAYOUT,
+    THUMBNAIL_CODECS,
+    THUMBNAIL_PACK_GC_MIN_BYTES,
+    THUMBNAIL_PACK_GC_RATIO,
+    THUMBNAIL_PACK_MAX_BYTES,
+    THUMBNAIL_QUALITY,
+    THUMBNAIL_STORE_LAYOUTS,
+    WORK_DIR_NAME,
+)
+from ..errors import LockTimeoutError
+from ..utils.logging import get_logger
+from .lock import FileLock
+
+LOGGER = get_logger()
+
+_INDEX_NAME = "pack.index"
+_INDEX_MAGIC = b"IPHTIDX2"
+# rel hash, width, height, stamp, codec id, quality, pack id, offset, length.
+# A record with a length of zero is a tombstone.
+_RECORD = struct.Struct("<QHHqBBIQI")
+_PACK_NAME = re.compile(r"^pack-(\d{6})\.bin$")
+_CODEC_IDS = {"png": 0, "jpeg": 1, "webp": 2}
+_FILE_SUFFIXES = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+
+Slot = Tuple[int, int, int]
+"""``(rel hash, width, height)``: one thumbnail, whatever its stamp."""
+Profile = Tuple[int, int]
+"""``(codec id, quality)`` an entry was encoded with."""
+
+
+def _rel_hash(rel: str) -> int:
+    return xxhash.xxh3_64_intdigest(rel.encode("utf-8"))
+
+
+def _pack_name(pack_id: int) -> str:
+    return f"pack-{pack_id:06d}.bin"
+
+
+class ThumbnailStore:
+    """Read and write encoded thumbnails for one album.
+
+    Entries are addressed by the asset's relative path, the thumbnail size and
+    a *stamp* (the source file's modification time); an entry only matches
+    the exact stamp it was stored with, and only when it was encoded with the
+    store's *codec* and *quality*, so changing either re-renders thumbnails
+    as they are requested.  Two layouts are supported:
+
+    ``pack``
+        Encoded images are appended to ``thumbs/pack-NNNNNN.bin`` files of up
+        to :data:`THUMBNAIL_PACK_MAX_BYTES`, and ``thumbs/pack.index`` logs a
+        fixed-size record per write.  The newest record for a path and size
+        wins, so storing a new stamp supersedes the old image without a
+        delete.  Packs are read through ``mmap``.  :meth:`collect_garbage`
+        rewrites the packs with only the live entries.
+    ``files``
+        One ``<sha1(rel)>_<stamp>_<W>x<H>.png`` file per thumbnail; lossy
+        codecs add the quality, as in ``..._<W>x<H>_q85.jpg``.
+
+    Writers hold the album's ``thumbs`` :class:`FileLock`, so several
+    processes may share a pack store; readers pick up their appends lazily.
+    """
+
+    def __init__(
+        self,
+        album_root: Path,
+        *,
+        layout: str = DEFAULT_THUMBNAIL_STORE_LAYOUT,
+        codec: str = DEFAULT_THUMBNAIL_CODEC,
+        quality: int = THUMBNAIL_QUALITY,
+    ):
+        if layout not in THUMBNAIL_STORE_LAYOUTS:
+            raise ValueError(
+                f"Unknown thumbnail layout {layout!r}; "
+                f"expected one of {sorted(THUMBNAIL_STORE_LAYOUTS)}"
+            )
+        if codec not in THUMBNAIL_CODECS:
+            raise ValueError(
+                f"Unknown thumbnail codec {codec!r}; expected one of {sorted(THUMBNAIL_CODECS)}"
+            )
+        if not 0 <= quality <= 100:
+            raise ValueError(f"Thumbnail quality must be between 0 and 100, not {quality}")
+        self.album_root = album_root
+        self.layout = layout
+        self.codec = codec
+        # PNG is lossless, so its entries stay valid whatever the quality.
+        self.quality = 0 if codec == "png" else quality
+        self._profile: Profile = (_CODEC_IDS[codec], self.quality)
+        self.directory = album_root / WORK_DIR_NAME / "thumbs"
+        self.index_path = self.directory / _INDEX_NAME
+        self._lock = threading.Lock()
+        # slot -> (stamp, profile, pack id, offset, length)
+        self._entries: Dict[Slot, Tuple[int, Profile, int, int, int]] = {}
+        self._index_identity: Optional[Tuple[int, int]] = None
+        self._index_offset = 0
+        self._maps: Dict[int, mmap.mmap] = {}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def get(self, rel: str, width: int, height: int, stamp: int) -> Optional[bytes]:
+        """Return the encoded thumbnail stored for *rel* at *stamp*, if any."""
+
+        if self.layout == "files":
+            try:
+                return self._file_path(rel, width, height, stamp).read_bytes()
+            except OSError:
+                return None
+        slot = (_rel_hash(rel), width, height)
+        for attempt in range(2):
+            with self._lock:
+                if attempt:
+                    self._refresh()
+                entry = self._entries.get(slot)
+                if entry is not None and entry[:2] == (stamp, self._profile):
+                    data = self._read(*entry[2:])
+                    if data is not None:
+                        return data
+        return None
+
+    def put(self, rel: str, width: int, height: int, stamp: int, data: bytes) -> None:
+        """Store *data* as the thumbnail of *rel* at *stamp*."""
+
+        if not data:
+            return
+        if self.layout == "files":
+            self._put_file(self._file_path(rel, width, height, stamp), data)
+            return
+        self._append((_rel_hash(rel), width, height), stamp, data)
+
+    def discard(self, rel: str, width: int, height: int, stamp: int) -> None:
+        """Forget the thumbnail of *rel* stored at *stamp* (for example when unreadable)."""
+
+        if self.layout == "files":
+            _safe_unlink(self._file_path(rel, width, height, stamp))
+            return
+        slot = (_rel_hash(rel), width, height)
+        with self._lock:
+            entry = self._entries.get(slot)
+        if entry is not None and entry[0] == stamp:
+            self._append(slot, stamp, b"")
+
+    def garbage_bytes(self) -> int:
+        """Return how many pack bytes hold no current entry of this store's codec."""
+
+        if self.layout != "pack":
+            return 0
+        with self._lock:
+            self._refresh()
+            live = self._live_bytes()
+        return self._pack_bytes() - live
+
+    def needs_collection(self) -> bool:
+        """Return ``True`` when :meth:`collect_garbage` would reclaim enough space."""
+
+        if self.layout != "pack":
+            return False
+        garbage = self.garbage_bytes()
+        return (
+            garbage >= THUMBNAIL_PACK_GC_MIN_BYTES
+            and garbage >= self._pack_bytes() * THUMBNAIL_PACK_GC_RATIO
+        )
+
+    def collect_garbage(self) -> int:
+        """Rewrite the packs with only current entries and return the bytes reclaimed.
+
+        Entries encoded with another codec or quality are dropped as well.
+
+        Writers are excluded for the duration; readers keep serving the old
+        packs until the rewritten index is swapped in.
+        """
+
+        if self.layout != "pack":
+            return 0
+        with FileLock(self.album_root, "thumbs"):
+            with self._lock:
+                self._refresh()
+                live = sorted(
+                    (item for item in self._entries.items() if item[1][1] == self._profile),
+                    key=lambda item: item[1][2:4],
+                )
+                before = self._pack_bytes()
+                old_packs = self._pack_ids()
+            next_pack = max(old_packs, default=0) + 1
+            records: List[bytes] = []
+            pack_id, pack_handle, pack_size = next_pack, None, 0
+            try:
+                for slot, (stamp, profile, source, offset, length) in live:
+                    with self._lock:
+                        data = self._read(source, offset, length)
+                    if data is None:
+                        continue
+                    if pack_handle is None or pack_size + length > THUMBNAIL_PACK_MAX_BYTES:
+                        if pack_handle is not None:
+                            pack_handle.close()
+                            pack_id += 1
+                        pack_handle = (self.directory / _pack_name(pack_id)).open("wb")
+                        pack_size = 0
+                    pack_handle.write(data)
+                    records.append(
+                        _RECORD.pack(*slot, stamp, *profile, pack_id, pack_size, length)
+                    )
+                    pack_size += length
+            finally:
+                if pack_handle is not None:
+                    pack_handle.close()
+            tmp_index = self.index_path.with_name(_INDEX_NAME + ".tmp")
+            tmp_index.write_bytes(_INDEX_MAGIC + b"".join(records))
+            with self._lock:
+                os.replace(tmp_index, self.index_path)
+                self._close_maps()
+                for old in old_packs:
+                    _safe_unlink(self.directory / _pack_name(old))
+                self._reset()
+                self._refresh()
+            reclaimed = before - self._pack_bytes()
+        LOGGER.debug("Reclaimed %d bytes of thumbnail packs in %s", reclaimed, self.directory)
+        return reclaimed
+
+    def close(self) -> None:
+        """Release the pack mappings."""
+
+        with self._lock:
+            self._close_maps()
+
+    # ------------------------------------------------------------------
+    # Pack layout internals
+    # ------------------------------------------------------------------
+    def _append(self, slot: Slot, stamp: int, data: bytes) -> None:
+        try:
+            with FileLock(self.album_root, "thumbs"):
+                self.directory.mkdir(parents=True, exist_ok=True)
+                with self._lock:
+                    self._refresh()
+                pack_id, offset = 0, 0
+                if data:
+                    pack_id, offset = self._write_pack_data(data)
+                record = _RECORD.pack(*slot, stamp, *self._profile, pack_id, offset, len(data))
+                if not self._index_is_current():
+                    self._start_index()
+                with self.index_path.open("ab") as handle:
+                    if handle.tell() > len(_INDEX_MAGIC):
+                        # Drop a record torn by an interrupted writer so the
+                        # new one starts on a record boundary.
+                        valid = _aligned_index_size(handle.tell())
+                        if valid != handle.tell():
+                            handle.truncate(valid)
+                            handle.seek(valid)
+                    handle.write(record)
+                with self._lock:
+                    self._refresh()
+        except (OSError, LockTimeoutError) as exc:
+            LOGGER.debug("Could not store thumbnail in %s: %s", self.directory, exc)
+
+    def _write_pack_data(self, data: bytes) -> Tuple[int, int]:
+        pack_id = max(self._pack_ids(), default=1)
+        path = self.directory / _pack_name(pack_id)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size and size + len(data) > THUMBNAIL_PACK_MAX_BYTES:
+            pack_id += 1
+            path = self.directory / _pack_name(pack_id)
+            size = 0
+        with path.open("ab") as handle:
+            offset = handle.tell()
+            handle.write(data)
+        return pack_id, offset
+
+    def _index_is_current(self) -> bool:
+        try:
+            with self.index_path.open("rb") as handle:
+                return handle.read(len(_INDEX_MAGIC)) == _INDEX_MAGIC
+        except FileNotFoundError:
+            return False
+
+    def _start_index(self) -> None:
+        """Replace a missing or outdated index with an empty one (writer lock held).
+
+        Packs referenced only by an outdated index count as garbage until the
+        next :meth:`collect_garbage`.
+        """
+
+        tmp_index = self.index_path.with_name(_INDEX_NAME + ".tmp")
+        tmp_index.write_bytes(_INDEX_MAGIC)
+        os.replace(tmp_index, self.index_path)
+
+    def _pack_ids(self) -> List[int]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return [int(match[1]) for match in map(_PACK_NAME.match, names) if match]
+
+    def _pack_bytes(self) -> int:
+        total = 0
+        for pack_id in self._pack_ids():
+            try:
+                total += (self.directory / _pack_name(pack_id)).stat().st_size
+            except FileNotFoundError:
+                continue
+        return total
+
+    def _live_bytes(self) -> int:
+        return sum(
+            entry[4] for entry in self._entries.values() if entry[1] == self._profile
+        )
+
+    def _reset(self) -> None:
+        self._entries.clear()
+        self._index_identity = None
+        self._index_offset = 0
+
+    def _refresh(self) -> None:
+        """Apply index records appended since the last refresh (lock held)."""
+
+        try:
+            stat = self.index_path.stat()
+        except FileNotFoundError:
+            if self._index_identity is not None:
+                self._close_maps()
+                self._reset()
+            return
+        identity = (stat.st_dev, stat.st_ino)
+        if identity != self._index_identity:
+            # A new index file (first open or after garbage collection).
+            self._close_maps()
+            self._reset()
+            self._index_identity = identity
+        end = _aligned_index_size(stat.st_size)
+        start = max(self._index_offset, len(_INDEX_MAGIC))
+        if end <= start:
+            return
+        with self.index_path.open("rb") as handle:
+            if handle.read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+                LOGGER.warning("Ignoring unreadable thumbnail index %s", self.index_path)
+                self._index_offset = end
+                return
+            handle.seek(start)
+            payload = handle.read(end - start)
+        for fields in _RECORD.iter_unpack(payload):
+            rel_hash, width, height, stamp, codec_id, quality, pack_id, offset, length = fields
+            slot = (rel_hash, width, height)
+            if length:
+                self._entries[slot] = (stamp, (codec_id, quality), pack_id, offset, length)
+            else:
+                self._entries.pop(slot, None)
+        self._index_offset = end
+
+    def _read(self, pack_id: int, offset: int, length: int) -> Optional[bytes]:
+        """Return *length* bytes at *offset* of pack *pack_id* (lock held)."""
+
+        mapping = self._maps.get(pack_id)
+        if mapping is None or offset + length > len(mapping):
+            if mapping is not None:
+                mapping.close()
+                self._maps.pop(pack_id, None)
+            try:
+                with (self.directory / _pack_name(pack_id)).open("rb") as handle:
+                    mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return None
+            self._maps[pack_id] = mapping
+        if offset + length > len(mapping):
+            return None
+        return mapping[offset : offset + length]
+
+    def _close_maps(self) -> None:
+        for mapping in self._maps.values():
+            mapping.close()
+        self._maps.clear()
+
+    # ------------------------------------------------------------------
+    # Files layout internals
+    # ------------------------------------------------------------------
+    def _file_path(self, rel: str, width: int, height: int, stamp: int) -> Path:
+        digest = hashlib.sha1(rel.encode("utf-8")).hexdigest()
+        variant = f"_q{self.quality}" if self.codec != "png" else ""
+        suffix = _FILE_SUFFIXES[self.codec]
+        return self.directory / f"{digest}_{stamp}_{width}x{height}{variant}{suffix}"
+
+    @staticmethod
+    def _put_file(path: Path, data: bytes) -> None:
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            _safe_unlink(path)
+            tmp_path.replace(path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _aligned_index_size(size: int) -> int:
+    header = len(_INDEX_MAGIC)
+    if size <= header:
+        return size
+    return header + (size - header) // _RECORD.size * _RECORD.size
+
+
+def _safe_unlink(path: Path) -> None:
+    try:
+        path.unlink(missing_ok=True)
+    except PermissionError:
+        try:
+            path.rename(path.with_suffix(path.suffix + ".stale"))
+        except OSError:
+            pass
+    except OSError:
+        pass
+
+
+__all__ = ["ThumbnailStore"]
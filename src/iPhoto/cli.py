@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from enum import Enum
+from functools import wraps
 from pathlib import Path
+from typing import Optional
 import sys
 
 import typer
@@ -13,8 +16,15 @@ if __package__ in (None, ""):
     if str(package_root) not in sys.path:
         sys.path.insert(0, str(package_root))
     from iPhoto import app as app_facade  # type: ignore  # pragma: no cover
+    from iPhoto import bench  # type: ignore  # pragma: no cover
     from iPhoto.cache.index_store import IndexStore  # type: ignore  # pragma: no cover
-    from iPhoto.config import WORK_DIR_NAME  # type: ignore  # pragma: no cover
+    from iPhoto.config import (  # type: ignore  # pragma: no cover
+        DEFAULT_HASH_POLICY,
+        HASH_POLICIES,
+        INDEX_BACKENDS,
+        THUMBNAIL_QUALITY,
+        WORK_DIR_NAME,
+    )
     from iPhotos.src.iPhoto.errors import (
         AlbumNotFoundError,
         IPhotoError,
@@ -22,21 +32,43 @@ if __package__ in (None, ""):
         ManifestInvalidError,
     )  # type: ignore  # pragma: no cover
     from iPhoto.models.album import Album  # type: ignore  # pragma: no cover
+    from iPhoto.utils.jsonio import read_json, write_json  # type: ignore  # pragma: no cover
 else:
     from . import app as app_facade
+    from . import bench
     from .cache.index_store import IndexStore
-    from .config import WORK_DIR_NAME
+    from .config import (
+        DEFAULT_HASH_POLICY,
+        HASH_POLICIES,
+        INDEX_BACKENDS,
+        THUMBNAIL_QUALITY,
+        WORK_DIR_NAME,
+    )
     from .errors import AlbumNotFoundError, IPhotoError, LockTimeoutError, ManifestInvalidError
     from .models.album import Album
+    from .utils.jsonio import read_json, write_json
+
+# Typer validates enum options and lists their values in ``--help``.
+IndexBackendName = Enum(  # type: ignore[misc]
+    "IndexBackendName", {name: name for name in sorted(INDEX_BACKENDS)}, type=str
+)
+HashPolicy = Enum(  # type: ignore[misc]
+    "HashPolicy", {name: name for name in sorted(HASH_POLICIES)}, type=str
+)
 
 app = typer.Typer(help="Folder-native photo manager with Live Photo support")
 cover_app = typer.Typer(help="Manage album covers")
 feature_app = typer.Typer(help="Manage featured assets")
+index_app = typer.Typer(help="Inspect and maintain the index cache")
+bench_app = typer.Typer(help="Measure scanner performance")
 app.add_typer(cover_app, name="cover")
 app.add_typer(feature_app, name="feature")
+app.add_typer(index_app, name="index")
+app.add_typer(bench_app, name="bench")
 
 
 def _handle_errors(func):
+    @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
@@ -63,10 +95,27 @@ def init(album_dir: Path = typer.Argument(Path.cwd(), exists=False)) -> None:
 
 @app.command()
 @_handle_errors
-def scan(album_dir: Path = typer.Argument(Path.cwd(), exists=True)) -> None:
+def scan(
+    album_dir: Path = typer.Argument(Path.cwd(), exists=True),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Re-extract metadata for every file instead of only new or changed ones.",
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", min=1, help="Number of threads used to hash and probe files."
+    ),
+    hash_policy: HashPolicy = typer.Option(
+        DEFAULT_HASH_POLICY,
+        "--hash",
+        help="fast: fingerprint sampled blocks; full: also hash every byte for dedupe.",
+    ),
+) -> None:
     """Scan files and update the index cache."""
 
-    rows = app_facade.rescan(album_dir)
+    rows = app_facade.rescan(
+        album_dir, full=full, workers=workers, hash_policy=hash_policy.value
+    )
     print(f"[green]Indexed {len(rows)} assets")
 
 
@@ -112,6 +161,175 @@ def feature_rm(album_dir: Path, ref: str) -> None:
     print(f"[green]Removed featured {ref}")
 
 
+@index_app.command("convert")
+@_handle_errors
+def index_convert(
+    album_dir: Path = typer.Argument(Path.cwd(), exists=True),
+    backend: IndexBackendName = typer.Option(..., "--backend", help="Target storage backend."),
+) -> None:
+    """Migrate the album index to another storage backend."""
+
+    store = IndexStore(album_dir)
+    previous = store.backend_name
+    store.convert(backend.value)
+    print(f"[green]Converted index from {previous} to {backend.value}")
+
+
+@index_app.command("export")
+@_handle_errors
+def index_export(
+    album_dir: Path = typer.Argument(Path.cwd(), exists=True),
+    output: Path = typer.Option(
+        None, "--output", "-o", help="Destination file (defaults to index.jsonl)."
+    ),
+) -> None:
+    """Export the index as portable JSON Lines."""
+
+    target = IndexStore(album_dir).export_jsonl(output)
+    print(f"[green]Exported index to {target}")
+
+
+@index_app.command("journal")
+@_handle_errors
+def index_journal(
+    album_dir: Path = typer.Argument(Path.cwd(), exists=True),
+    enable: bool = typer.Option(
+        ..., "--enable/--disable", help="Record index updates in index.journal."
+    ),
+) -> None:
+    """Toggle the append-only journal of a JSONL index."""
+
+    store = IndexStore(album_dir)
+    if store.backend_name != "jsonl":
+        typer.echo(f"Error: the {store.backend_name} index has no journal", err=True)
+        raise typer.Exit(1)
+    store.set_journal(enable)
+    print(f"[green]Index journal {'enabled' if enable else 'disabled'}")
+
+
+@index_app.command("hash")
+@_handle_errors
+def index_hash(album_dir: Path = typer.Argument(Path.cwd(), exists=True)) -> None:
+    """Compute full-content hashes for indexed assets that only have a fingerprint."""
+
+    updated = app_facade.compute_full_hashes(album_dir)
+    print(f"[green]Hashed {updated} assets")
+
+
+@index_app.command("compact")
+@_handle_errors
+def index_compact(album_dir: Path = typer.Argument(Path.cwd(), exists=True)) -> None:
+    """Fold pending index journal records back into the snapshot."""
+
+    if IndexStore(album_dir).compact():
+        print("[green]Compacted index")
+    else:
+        print("Index has no pending changes")
+
+
+@bench_app.command("scan")
+@_handle_errors
+def bench_scan(
+    album_dir: Path = typer.Argument(..., exists=False),
+    generate: Optional[int] = typer.Option(
+        None,
+        "--generate",
+        min=1,
+        help="First write this many synthetic JPEG/PNG/MOV files into the album.",
+    ),
+    seed: int = typer.Option(0, "--seed", help="Seed for the synthetic album contents."),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", min=1, help="Number of threads used to hash and probe files."
+    ),
+    hash_policy: HashPolicy = typer.Option(
+        DEFAULT_HASH_POLICY,
+        "--hash",
+        help="fast: fingerprint sampled blocks; full: also hash every byte for dedupe.",
+    ),
+    json_path: Optional[Path] = typer.Option(
+        None, "--json", help="Also write the measurements to this file as JSON."
+    ),
+) -> None:
+    """Run a full scan of an album and print where the time goes."""
+
+    if generate is not None:
+        created = bench.generate_synthetic_album(album_dir, generate, seed=seed)
+        print(f"Generated {len(created)} synthetic files in {album_dir}")
+    stats = bench.bench_scan(album_dir, workers=workers, hash_policy=hash_policy.value)
+    result = stats.as_dict()
+
+    print(
+        f"[green]{result['files']} files, {result['bytes'] / 1e6:.1f} MB "
+        f"in {result['wall_seconds']:.2f}s"
+    )
+    print(
+        f"{result['files_per_second']:.1f} files/s, "
+        f"{result['bytes_per_second'] / 1e6:.1f} MB/s"
+    )
+    for stage, seconds in result["stage_seconds"].items():
+        print(f"  {stage:<12} {seconds:8.3f}s")
+    for name, value in result["counts"].items():
+        print(f"  {name:<18} {value}")
+
+    if json_path is not None:
+        write_json(json_path, result)
+        print(f"Wrote {json_path}")
+
+
+@bench_app.command("json")
+@_handle_errors
+def bench_json(
+    rows: int = typer.Option(100_000, "--rows", min=1, help="Number of synthetic index rows."),
+    seed: int = typer.Option(0, "--seed", help="Seed for the synthetic rows."),
+    json_path: Optional[Path] = typer.Option(
+        None, "--json", help="Also write the measurements to this file as JSON."
+    ),
+) -> None:
+    """Compare the available JSON codecs on a synthetic album index."""
+
+    results = bench.bench_json_codecs(rows, seed=seed)
+    print(f"[green]{rows} index rows")
+    for name, result in results.items():
+        print(
+            f"  {name:<8} encode {result['encode_seconds']:7.3f}s  "
+            f"decode {result['decode_seconds']:7.3f}s  "
+            f"{result['bytes'] / 1e6:.1f} MB"
+        )
+
+    if json_path is not None:
+        write_json(json_path, results)
+        print(f"Wrote {json_path}")
+
+
+@bench_app.command("thumbnails")
+@_handle_errors
+def bench_thumbnails(
+    count: int = typer.Option(200, "--count", min=1, help="Number of synthetic thumbnails."),
+    size: int = typer.Option(256, "--size", min=16, help="Thumbnail edge length in pixels."),
+    quality: int = typer.Option(
+        THUMBNAIL_QUALITY, "--quality", min=0, max=100, help="Quality for lossy codecs."
+    ),
+    seed: int = typer.Option(0, "--seed", help="Seed for the synthetic thumbnails."),
+    json_path: Optional[Path] = typer.Option(
+        None, "--json", help="Also write the measurements to this file as JSON."
+    ),
+) -> None:
+    """Compare thumbnail codecs on encode time, decode time and size."""
+
+    results = bench.bench_thumbnail_codecs(count, size=size, quality=quality, seed=seed)
+    print(f"[green]{count} thumbnails of {size}x{size}")
+    for name, result in results.items():
+        print(
+            f"  {name:<5} encode {result['encode_ms']:7.2f}ms  "
+            f"decode {result['decode_ms']:7.2f}ms  "
+            f"{result['bytes'] / 1024:7.1f} KiB"
+        )
+
+    if json_path is not None:
+        write_json(json_path, results)
+        print(f"Wrote {json_path}")
+
+
 @app.command()
 @_handle_errors
 def report(album_dir: Path = typer.Argument(Path.cwd(), exists=True)) -> None:
@@ -122,10 +340,7 @@ def report(album_dir: Path = typer.Argument(Path.cwd(), exists=True)) -> None:
     work_dir = album_dir / WORK_DIR_NAME
     links_path = work_dir / "links.json"
     if links_path.exists():
-        import json
-
-        with links_path.open("r", encoding="utf-8") as handle:
-            groups = json.load(handle).get("live_groups", [])
+        groups = read_json(links_path).get("live_groups", [])
     else:
         groups = [group.__dict__ for group in app_facade.pair(album_dir)]
     print(
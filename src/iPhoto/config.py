@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Final
 
@@ -12,7 +13,87 @@ LIVE_DURATION_PREFERRED: Final[tuple[float, float]] = (1.0, 3.5)
 LOCK_EXPIRE_SEC: Final[int] = 30
 THUMB_SIZES: Final[list[tuple[int, int]]] = [(256, 256), (512, 512)]
 
+# Scanner pipeline tuning.  ``SCAN_WORKERS`` threads stat, hash and probe files
+# while ExifTool reads metadata in batches of ``EXIFTOOL_CHUNK_SIZE`` paths on a
+# separate thread.  Hashing is I/O bound, so the pool is capped rather than
+# scaled with every available core.
+SCAN_WORKERS: Final[int] = max(1, min(8, os.cpu_count() or 1))
+EXIFTOOL_CHUNK_SIZE: Final[int] = 500
+# ``VIDEO_METADATA_SOURCES`` selects where video duration, dimensions, codec
+# and frame rate come from.  ``exiftool`` reads them from the QuickTime groups
+# of the batch payload and only runs ffprobe for fields that are still missing;
+# ``ffprobe`` probes every clip.  At most ``FFPROBE_WORKERS`` ffprobe processes
+# run at the same time.
+VIDEO_METADATA_SOURCES: Final[frozenset[str]] = frozenset({"exiftool", "ffprobe"})
+DEFAULT_VIDEO_METADATA_SOURCE: Final[str] = "exiftool"
+FFPROBE_WORKERS: Final[int] = max(1, min(4, os.cpu_count() or 1))
+# ``HASH_POLICIES`` controls how much of each file the scanner reads.  ``fast``
+# derives the asset ``id`` from the size plus head, middle and tail blocks of
+# ``FINGERPRINT_BLOCK_SIZE`` bytes; ``full`` additionally stores the XXH3 hash
+# of the whole file in the ``xxh3`` column, which deduplication relies on.
+HASH_POLICIES: Final[frozenset[str]] = frozenset({"fast", "full"})
+DEFAULT_HASH_POLICY: Final[str] = "fast"
+FINGERPRINT_BLOCK_SIZE: Final[int] = 64 * 1024
+# Scans stream their rows to ``index.scan.jsonl`` and fsync it every
+# ``SCAN_CHECKPOINT_ROWS`` rows, so an interrupted scan resumes from there.
+SCAN_CHECKPOINT_ROWS: Final[int] = 200
+
+# ``INDEX_BACKENDS`` lists the storage formats understood by ``IndexStore``.
+# Albums keep whichever backend created their index (``index.db`` selects
+# SQLite); new albums use ``DEFAULT_INDEX_BACKEND``.  The plain-text JSONL file
+# stays the default so the cache remains human-readable and tool-agnostic.
+INDEX_BACKENDS: Final[frozenset[str]] = frozenset({"jsonl", "sqlite"})
+DEFAULT_INDEX_BACKEND: Final[str] = "jsonl"
+# Albums that keep the JSONL backend may opt into an append-only
+# ``index.journal`` sidecar (``iphoto index journal --enable``) that records
+# row-level updates instead of rewriting ``index.jsonl``.  The journal is folded
+# back into the snapshot once it exceeds both the absolute floor and the given
+# fraction of the snapshot size, so per-move cost stays proportional to the
+# change.  ``INDEX_JOURNAL_ENABLED`` turns it on for every new album.
+INDEX_JOURNAL_ENABLED: Final[bool] = False
+INDEX_JOURNAL_COMPACT_MIN_BYTES: Final[int] = 256 * 1024
+INDEX_JOURNAL_COMPACT_RATIO: Final[float] = 0.5
+# Indexes of at least ``INDEX_SNAPSHOT_MIN_BYTES`` are mirrored into a
+# memory-mapped columnar ``index.snapshot`` that the asset loader and map view
+# read instead of decoding every JSON row.  It is rebuilt when the index changes.
+INDEX_SNAPSHOT_MIN_BYTES: Final[int] = 4 * 1024 * 1024
+# Reverse geocoding snaps coordinates to a grid of ``GEOCODE_GRID_DEGREES``
+# (about 1 km at the equator) and remembers the place name of each cell: up to
+# ``GEOCODE_CACHE_SIZE`` cells in memory and every resolved cell in the album's
+# ``.iPhoto/geocode.cache``, so reloading an album needs no geocoder lookups.
+GEOCODE_GRID_DEGREES: Final[float] = 0.01
+GEOCODE_CACHE_SIZE: Final[int] = 65536
+# ``write_json`` keeps the previous version of manifests and ``links.json`` in
+# ``.iPhoto/manifest.bak``.  A backup is skipped when its content matches the
+# newest one, at most ``BACKUP_KEEP_COUNT`` versions per file are retained and
+# versions older than ``BACKUP_MAX_AGE_DAYS`` are pruned (the newest is always
+# kept).  ``BACKUP_COMPRESS`` stores them gzip-compressed.
+BACKUP_KEEP_COUNT: Final[int] = 20
+BACKUP_MAX_AGE_DAYS: Final[float] = 30.0
+BACKUP_COMPRESS: Final[bool] = True
+
 THUMBNAIL_SEEK_GUARD_SEC: Final[float] = 0.35
+# Thumbnails are cached under ``.iPhoto/thumbs``.  The ``pack`` layout appends
+# encoded images to pack files of up to ``THUMBNAIL_PACK_MAX_BYTES`` with an
+# offset index, instead of one file per thumbnail (the ``files`` layout).
+# Superseded entries are reclaimed once they exceed both
+# ``THUMBNAIL_PACK_GC_MIN_BYTES`` and ``THUMBNAIL_PACK_GC_RATIO`` of the packs.
+THUMBNAIL_STORE_LAYOUTS: Final[frozenset[str]] = frozenset({"pack", "files"})
+DEFAULT_THUMBNAIL_STORE_LAYOUT: Final[str] = "pack"
+THUMBNAIL_PACK_MAX_BYTES: Final[int] = 256 * 1024 * 1024
+THUMBNAIL_PACK_GC_MIN_BYTES: Final[int] = 16 * 1024 * 1024
+THUMBNAIL_PACK_GC_RATIO: Final[float] = 0.5
+# Encoding of cached thumbnails.  ``jpeg`` and ``webp`` are much smaller and
+# faster to write than lossless ``png`` for photographs; thumbnails with
+# transparent pixels fall back to PNG when the codec cannot keep alpha.
+# Entries written with another codec or quality are treated as misses.
+THUMBNAIL_CODECS: Final[frozenset[str]] = frozenset({"png", "jpeg", "webp"})
+DEFAULT_THUMBNAIL_CODEC: Final[str] = "jpeg"
+THUMBNAIL_QUALITY: Final[int] = 85
+# Decoded thumbnails kept in memory, in bytes of pixel data.  The least
+# recently used thumbnails beyond this budget are dropped (visible ones are
+# pinned) and reloaded from the disk cache when needed again.
+THUMBNAIL_MEMORY_BUDGET_BYTES: Final[int] = 256 * 1024 * 1024
 
 SCHEMA_DIR: Final[Path] = Path(__file__).resolve().parent / "schemas"
 ALBUM_MANIFEST_NAMES: Final[list[str]] = [".iphoto.album.json", ".iPhoto/manifest.json"]
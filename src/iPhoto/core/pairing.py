@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 
@@ -11,11 +12,18 @@ from dateutil import parser
 
 from ..config import LIVE_DURATION_PREFERRED, PAIR_TIME_DELTA_SEC
 from ..models.types import LiveGroup
+from ..utils.hashutils import text_xxh3
 
 
 def _parse_dt(value: str | None) -> datetime | None:
     if not value:
         return None
+    # ``fromisoformat`` is much faster and covers the timestamps the scanner
+    # writes; dateutil handles the remaining ISO-8601 variants.
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        pass
     try:
         return parser.isoparse(value)
     except (ValueError, TypeError):
@@ -60,7 +68,14 @@ def _is_video(row: Dict[str, object]) -> bool:
 
 
 def pair_live(index_rows: List[Dict[str, object]]) -> List[LiveGroup]:
-    """Pair still and motion assets into :class:`LiveGroup` objects."""
+    """Pair still and motion assets into :class:`LiveGroup` objects.
+
+    Matching runs in three passes of decreasing confidence: a shared
+    ``content_id``, then the same file stem within :data:`PAIR_TIME_DELTA_SEC`,
+    then the same folder within that window.  Videos are indexed by stem and by
+    folder up front, with capture times parsed once and sorted, so each photo
+    only inspects the videos inside its time window.
+    """
 
     photos: Dict[str, Dict[str, object]] = {}
     videos: Dict[str, Dict[str, object]] = {}
@@ -86,7 +101,7 @@ def pair_live(index_rows: List[Dict[str, object]]) -> List[LiveGroup]:
         chosen = _select_best_video(video_by_cid[cid])
         if chosen:
             matched[photo["rel"]] = LiveGroup(
-                id=f"live_{hash((photo['rel'], chosen['rel'])) & 0xFFFFFF:x}",
+                id=_group_id(photo["rel"], chosen["rel"]),
                 still=photo["rel"],
                 motion=chosen["rel"],
                 content_id=cid,
@@ -95,13 +110,30 @@ def pair_live(index_rows: List[Dict[str, object]]) -> List[LiveGroup]:
             )
             used_videos.add(chosen["rel"])
 
+    by_stem = _TimeIndex()
+    by_folder = _TimeIndex()
+    for order, video in enumerate(videos.values()):
+        moment = _moment(video.get("dt"))
+        if moment is None:
+            continue
+        rel_path = Path(video["rel"])
+        by_stem.add(rel_path.stem, moment, order, video)
+        by_folder.add(str(rel_path.parent), moment, order, video)
+    by_stem.freeze()
+    by_folder.freeze()
+
+    photo_moments: Dict[str, _Moment | None] = {}
+    for photo in photos.values():
+        if photo["rel"] not in matched:
+            photo_moments[photo["rel"]] = _moment(photo.get("dt"))
+
     # 2) medium match by same stem + time delta
     for photo in photos.values():
         if photo["rel"] in matched:
             continue
-        stem = Path(photo["rel"]).stem
-        candidates = [v for v in videos.values() if Path(v["rel"]).stem == stem]
-        chosen = _match_by_time(photo, candidates, used_videos)
+        chosen = by_stem.nearest(
+            Path(photo["rel"]).stem, photo_moments[photo["rel"]], used_videos
+        )
         if chosen:
             used_videos.add(chosen["rel"])
             matched[photo["rel"]] = _build_group(photo, chosen, confidence=0.7)
@@ -110,9 +142,9 @@ def pair_live(index_rows: List[Dict[str, object]]) -> List[LiveGroup]:
     for photo in photos.values():
         if photo["rel"] in matched:
             continue
-        folder = str(Path(photo["rel"]).parent)
-        candidates = [v for v in videos.values() if str(Path(v["rel"]).parent) == folder]
-        chosen = _match_by_time(photo, candidates, used_videos)
+        chosen = by_folder.nearest(
+            str(Path(photo["rel"]).parent), photo_moments[photo["rel"]], used_videos
+        )
         if chosen:
             used_videos.add(chosen["rel"])
             matched[photo["rel"]] = _build_group(photo, chosen, confidence=0.5)
@@ -120,25 +152,71 @@ def pair_live(index_rows: List[Dict[str, object]]) -> List[LiveGroup]:
     return list(matched.values())
 
 
-def _match_by_time(
-    photo: Dict[str, object],
-    candidates: Iterable[Dict[str, object]],
-    used_videos: set[str],
-) -> Dict[str, object] | None:
-    photo_dt = _parse_dt(photo.get("dt"))
-    best: Tuple[float, Dict[str, object]] | None = None
-    for candidate in candidates:
-        if candidate["rel"] in used_videos:
-            continue
-        video_dt = _parse_dt(candidate.get("dt"))
-        if not photo_dt or not video_dt:
-            continue
-        delta = abs((photo_dt - video_dt).total_seconds())
-        if delta > PAIR_TIME_DELTA_SEC:
-            continue
-        if best is None or delta < best[0]:
-            best = (delta, candidate)
-    return best[1] if best else None
+# A capture time as ``(timezone_aware, microseconds since the epoch)``.  Naive
+# and aware timestamps cannot be compared, so they are kept apart.
+_Moment = Tuple[bool, int]
+
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_AWARE = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_WINDOW_MICROS = int(PAIR_TIME_DELTA_SEC * 1_000_000) + 1
+
+
+def _moment(value: object) -> _Moment | None:
+    parsed = _parse_dt(value) if isinstance(value, str) else None
+    if parsed is None:
+        return None
+    if parsed.utcoffset() is None:
+        return False, (parsed.replace(tzinfo=None) - _EPOCH_NAIVE) // _MICROSECOND
+    return True, (parsed - _EPOCH_AWARE) // _MICROSECOND
+
+
+class _TimeIndex:
+    """Videos grouped by a bucket key and sorted by capture time.
+
+    :meth:`nearest` bisects to the :data:`PAIR_TIME_DELTA_SEC` window around a
+    photo and returns the closest unused video, preferring the one that comes
+    first in the index on ties.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[str, bool], List[Tuple[int, int, Dict[str, object]]]] = (
+            defaultdict(list)
+        )
+        self._times: Dict[Tuple[str, bool], List[int]] = {}
+
+    def add(self, key: str, moment: _Moment, order: int, video: Dict[str, object]) -> None:
+        aware, micros = moment
+        self._entries[(key, aware)].append((micros, order, video))
+
+    def freeze(self) -> None:
+        for bucket, entries in self._entries.items():
+            entries.sort(key=lambda entry: (entry[0], entry[1]))
+            self._times[bucket] = [entry[0] for entry in entries]
+
+    def nearest(
+        self, key: str, moment: _Moment | None, used_videos: set[str]
+    ) -> Dict[str, object] | None:
+        if moment is None:
+            return None
+        aware, micros = moment
+        times = self._times.get((key, aware))
+        if not times:
+            return None
+        entries = self._entries[(key, aware)]
+        lo = bisect_left(times, micros - _WINDOW_MICROS)
+        hi = bisect_right(times, micros + _WINDOW_MICROS)
+        best: Tuple[float, int, Dict[str, object]] | None = None
+        for video_micros, order, video in entries[lo:hi]:
+            if video["rel"] in used_videos:
+                continue
+            # Same arithmetic as ``timedelta.total_seconds`` on the difference.
+            delta = abs(micros - video_micros) / 10**6
+            if delta > PAIR_TIME_DELTA_SEC:
+                continue
+            if best is None or delta < best[0] or (delta == best[0] and order < best[1]):
+                best = (delta, order, video)
+        return best[2] if best else None
 
 
 def _select_best_video(candidates: Iterable[Dict[str, object]]) -> Dict[str, object] | None:
@@ -172,12 +250,86 @@ def _duration_score(duration: float, preferred_min: float, preferred_max: float)
     return preferred_max - abs(midpoint - duration)
 
 
+def _group_id(still: str, motion: str) -> str:
+    """Return a group id derived from the paired rels, stable across runs."""
+
+    return f"live_{text_xxh3(still, motion)}"
+
+
 def _build_group(photo: Dict[str, object], video: Dict[str, object], confidence: float) -> LiveGroup:
     return LiveGroup(
-        id=f"live_{hash((photo['rel'], video['rel'])) & 0xFFFFFF:x}",
+        id=_group_id(photo["rel"], video["rel"]),
         still=photo["rel"],
         motion=video["rel"],
         content_id=video.get("content_id") or photo.get("content_id"),
         still_image_time=video.get("still_image_time"),
         confidence=confidence,
     )
+
+
+def repair_live(
+    index_rows: List[Dict[str, object]],
+    previous_groups: Iterable[LiveGroup],
+    changed_rels: Iterable[str],
+) -> List[LiveGroup]:
+    """Update *previous_groups* after the rows for *changed_rels* changed.
+
+    *changed_rels* lists every ``rel`` that was added to, removed from or
+    rewritten in *index_rows* since *previous_groups* were computed.  Groups are
+    re-paired only for the content ids, stems and folders those rels touch (plus
+    the partners released from dropped groups); every other group is kept as
+    is, including its ``id``.  The result is ordered the way :func:`pair_live`
+    orders its output.
+    """
+
+    changed = set(changed_rels)
+    previous = list(previous_groups)
+    rows_by_rel = {row["rel"]: row for row in index_rows}
+
+    stems: set[str] = set()
+    folders: set[str] = set()
+    content_ids: set[object] = set()
+    for rel in changed:
+        rel_path = Path(rel)
+        stems.add(rel_path.stem)
+        folders.add(str(rel_path.parent))
+        row = rows_by_rel.get(rel)
+        if row is not None and row.get("content_id"):
+            content_ids.add(row["content_id"])
+    for group in previous:
+        if group.content_id and (group.still in changed or group.motion in changed):
+            content_ids.add(group.content_id)
+
+    def _touched(rel: str) -> bool:
+        row = rows_by_rel.get(rel)
+        if row is None:
+            return True
+        cid = row.get("content_id")
+        if cid and cid in content_ids:
+            return True
+        rel_path = Path(rel)
+        return rel_path.stem in stems or str(rel_path.parent) in folders
+
+    kept: List[LiveGroup] = []
+    released: set[str] = set()
+    for group in previous:
+        if _touched(group.still) or _touched(group.motion):
+            released.update((group.still, group.motion))
+        else:
+            kept.append(group)
+
+    claimed = {group.still for group in kept} | {group.motion for group in kept}
+    candidates = [
+        row
+        for row in index_rows
+        if row["rel"] not in claimed and (row["rel"] in released or _touched(row["rel"]))
+    ]
+    merged = kept + pair_live(candidates)
+
+    # ``pair_live`` emits content-id matches first, then stem and folder
+    # matches, each in index order; sort the merged list the same way.
+    position: Dict[str, int] = {}
+    for index, row in enumerate(index_rows):
+        position.setdefault(row["rel"], index)
+    merged.sort(key=lambda group: (-group.confidence, position.get(group.still, len(position))))
+    return merged
@@ -32,6 +32,7 @@ class AppFacade(QObject):
     linksUpdated = Signal(Path)
     errorRaised = Signal(str)
     scanProgress = Signal(Path, int, int)
+    scanChunkReady = Signal(Path, list)
     scanFinished = Signal(Path, bool)
     loadStarted = Signal(Path)
     loadProgress = Signal(Path, int, int)
@@ -85,6 +86,7 @@ class AppFacade(QObject):
             parent=self,
         )
         self._library_update_service.scanProgress.connect(self._relay_scan_progress)
+        self._library_update_service.scanChunkReady.connect(self._relay_scan_chunk)
         self._library_update_service.scanFinished.connect(self._relay_scan_finished)
         self._library_update_service.indexUpdated.connect(self._relay_index_updated)
         self._library_update_service.linksUpdated.connect(self._relay_links_updated)
@@ -543,6 +545,11 @@ class AppFacade(QObject):
 
         self.scanProgress.emit(root, current, total)
 
+    def _relay_scan_chunk(self, root: Path, rows: List[dict]) -> None:
+        """Forward partial scan results emitted by :class:`LibraryUpdateService`."""
+
+        self.scanChunkReady.emit(root, rows)
+
     @Slot(Path, bool)
     def _relay_scan_finished(self, root: Path, success: bool) -> None:
         """Forward scan completion events to existing facade listeners."""
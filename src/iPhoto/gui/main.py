@@ -15,9 +15,13 @@ if __package__ is None or __package__ == "":  # pragma: no cover - script mode
         sys.path.insert(0, str(package_root))
     from iPhotos.src.iPhoto.appctx import AppContext
     from iPhotos.src.iPhoto.gui.ui.main_window import MainWindow
+    from iPhotos.src.iPhoto.utils.exiftool import shutdown_session
+    from iPhotos.src.iPhoto.utils.geocoding import warm_up_geocoder
 else:  # pragma: no cover - normal package execution
     from ..appctx import AppContext
     from .ui.main_window import MainWindow
+    from ..utils.exiftool import shutdown_session
+    from ..utils.geocoding import warm_up_geocoder
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -68,6 +72,14 @@ def main(argv: list[str] | None = None) -> int:
     tooltip_palette.setColor(QPalette.ColorRole.ToolTipText, text_colour)
     app.setPalette(tooltip_palette, "QToolTip")
 
+    # Stop the shared ExifTool process while Qt still owns the worker threads
+    # that might be using it; ``atexit`` remains the fallback for the CLI.
+    app.aboutToQuit.connect(shutdown_session)
+
+    # Build the reverse geocoder while the window comes up so neither the asset
+    # loader nor the Location view has to wait for it on first use.
+    warm_up_geocoder()
+
     context = AppContext()
     window = MainWindow(context)
     window.show()
@@ -24,6 +24,7 @@ class LibraryUpdateService(QObject):
     """Coordinate rescans, Live Photo pairing, and move aftermath bookkeeping."""
 
     scanProgress = Signal(Path, int, int)
+    scanChunkReady = Signal(Path, list)
     scanFinished = Signal(Path, bool)
     indexUpdated = Signal(Path)
     linksUpdated = Signal(Path)
@@ -64,8 +65,15 @@ class LibraryUpdateService(QObject):
         self.assetReloadRequested.emit(album.root, False, False)
         return rows
 
-    def rescan_album_async(self, album: "Album") -> None:
-        """Start an asynchronous rescan for *album* using the background pool."""
+    def rescan_album_async(
+        self, album: "Album", *, full: bool = False, workers: Optional[int] = None
+    ) -> None:
+        """Start an asynchronous rescan for *album* using the background pool.
+
+        The scan is incremental unless *full* is ``True``: cached rows are kept
+        for files whose stat fingerprint is unchanged and only new or modified
+        files are re-inspected.  *workers* overrides the scanner's thread count.
+        """
 
         if self._scanner_worker is not None:
             self._scanner_worker.cancel()
@@ -78,8 +86,11 @@ class LibraryUpdateService(QObject):
 
         signals = ScannerSignals()
         signals.progressUpdated.connect(self._relay_scan_progress)
+        signals.chunkReady.connect(self._relay_scan_chunk)
 
-        worker = ScannerWorker(album.root, include, exclude, signals)
+        worker = ScannerWorker(
+            album.root, include, exclude, signals, incremental=not full, workers=workers
+        )
         self._scanner_worker = worker
         self._scan_pending = False
 
@@ -262,6 +273,11 @@ class LibraryUpdateService(QObject):
 
         self.scanProgress.emit(root, current, total)
 
+    def _relay_scan_chunk(self, root: Path, rows: List[dict]) -> None:
+        """Forward partial scan results so views can show assets early."""
+
+        self.scanChunkReady.emit(root, rows)
+
     def _on_scan_finished(
         self,
         worker: ScannerWorker,
@@ -292,10 +308,14 @@ class LibraryUpdateService(QObject):
         try:
             # Persist the freshly computed index snapshot immediately so future
             # reloads observe the new metadata rather than the stale cache that
-            # existed before the rescan.  The worker keeps the result in memory,
-            # therefore we flush both ``index.jsonl`` and ``links.json`` here to
-            # mirror the historical facade behaviour before notifying listeners.
-            backend.IndexStore(root).write_rows(materialised_rows)
+            # existed before the rescan.  The worker streamed every row to its
+            # checkpoint, which is promoted in place of the index before
+            # ``links.json`` is refreshed and listeners are notified.
+            store = backend.IndexStore(root)
+            if worker.checkpoint.exists():
+                worker.checkpoint.promote(store)
+            else:
+                store.write_rows(materialised_rows)
             backend._ensure_links(root, materialised_rows)
         except IPhotoError as exc:
             self.errorRaised.emit(str(exc))
@@ -5,9 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, Signal
 
 from ....library.manager import GeotaggedAsset, LibraryManager
+from ....utils.geocoding import warm_up_geocoder
 from ..media.playlist_controller import PlaylistController
 from ..widgets.photo_map_view import PhotoMapView
 from .view_controller import ViewController
@@ -16,6 +17,9 @@ from .view_controller import ViewController
 class LocationMapController(QObject):
     """Load geotagged assets and keep the map view in sync with the library."""
 
+    # Re-emitted on the GUI thread when the background geocoder finishes loading.
+    geocoderReady = Signal()
+
     def __init__(
         self,
         library: LibraryManager,
@@ -31,8 +35,12 @@ class LocationMapController(QObject):
         self._map_view = map_view
         self._cached_assets: list[GeotaggedAsset] = []
         self._is_visible = False
+        # ``True`` while the cached markers were built without place names
+        # because the reverse geocoder had not finished loading yet.
+        self._locations_pending = False
 
         self._map_view.assetActivated.connect(self._handle_asset_activated)
+        self.geocoderReady.connect(self._handle_geocoder_ready)
 
     def show_map_view(self) -> None:
         """Display the map view and refresh markers if necessary."""
@@ -66,7 +74,10 @@ class LocationMapController(QObject):
             self._cached_assets = []
             self._map_view.clear()
             return
-        assets = self._library.get_geotagged_assets()
+        # Never block the GUI thread on the geocoder warm-up; markers are
+        # refreshed with place names once it reports ready.
+        self._locations_pending = not warm_up_geocoder(self._emit_geocoder_ready)
+        assets = self._library.get_geotagged_assets(wait_for_geocoder=False)
         self._cached_assets = list(assets)
         self._map_view.set_assets(self._cached_assets, root)
 
@@ -97,6 +108,18 @@ class LocationMapController(QObject):
         else:
             self._map_view.set_assets(self._cached_assets, root)
 
+    def _emit_geocoder_ready(self) -> None:
+        # Called on the geocoder thread; the signal queues the refresh onto
+        # the GUI thread.
+        try:
+            self.geocoderReady.emit()
+        except RuntimeError:  # pragma: no cover - controller already deleted
+            pass
+
+    def _handle_geocoder_ready(self) -> None:
+        if self._locations_pending and self._library.root() is not None:
+            self.refresh_assets()
+
     def _handle_asset_activated(self, rel: str) -> None:
         """Select *rel* in the playlist and transition to the detail view."""
 
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from PySide6.QtCore import QObject, QSize, Signal
 from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPixmap
 
+from ...utils.pixmap_cache import PixmapCacheStats
 from ..tasks.thumbnail_loader import ThumbnailLoader
 from .live_map import load_live_map
 
@@ -25,7 +26,9 @@ class AssetCacheManager(QObject):
         self._thumb_size = QSize(thumb_size)
         self._thumb_loader = ThumbnailLoader(self)
         self._thumb_loader.ready.connect(self._on_thumb_ready)
-        self._thumb_cache: Dict[str, QPixmap] = {}
+        # Thumbnails keyed by ``rel`` share the loader's byte-budgeted cache;
+        # the loader's own entries use tuple keys.
+        self._thumb_cache = self._thumb_loader.memory_cache()
         self._placeholder_cache: Dict[str, QPixmap] = {}
         self._placeholder_templates: Dict[str, QPixmap] = {}
         self._recently_removed_rows: "OrderedDict[str, Dict[str, object]]" = OrderedDict()
@@ -38,12 +41,22 @@ class AssetCacheManager(QObject):
 
         return self._thumb_loader
 
+    def thumbnail_cache_stats(self) -> PixmapCacheStats:
+        """Return hit, miss and eviction counters of the in-memory thumbnails."""
+
+        return self._thumb_cache.stats()
+
+    def pin_thumbnails(self, rels: Iterable[str]) -> None:
+        """Keep the thumbnails of *rels* (the visible rows) in memory."""
+
+        self._thumb_cache.pin(rels)
+
     def reset_for_album(self, root: Optional[Path]) -> None:
         """Reset caches so a new album can be loaded."""
 
         self._album_root = root
         self._thumb_loader.reset_for_album(root)
-        self._thumb_cache.clear()
+        self.clear_all_thumbnails()
         self._placeholder_cache.clear()
         self._placeholder_templates.clear()
         self._recently_removed_rows.clear()
@@ -119,29 +132,29 @@ class AssetCacheManager(QObject):
     def set_thumbnail(self, rel: str, pixmap: QPixmap) -> None:
         """Store *pixmap* under the cache key *rel*."""
 
-        self._thumb_cache[rel] = pixmap
+        self._thumb_cache.put(rel, pixmap)
 
     def remove_thumbnail(self, rel: str) -> None:
         """Remove the cached thumbnail for *rel* when it exists."""
 
-        self._thumb_cache.pop(rel, None)
+        self._thumb_cache.pop(rel)
 
     def move_thumbnail(self, old_rel: str, new_rel: str) -> None:
         """Move the cached thumbnail from *old_rel* to *new_rel*."""
 
-        pixmap = self._thumb_cache.pop(old_rel, None)
+        pixmap = self._thumb_cache.pop(old_rel)
         if pixmap is not None:
-            self._thumb_cache[new_rel] = pixmap
+            self._thumb_cache.put(new_rel, pixmap)
 
     def clear_thumbnails_not_in(self, active: set[str]) -> None:
         """Discard cached thumbnails whose keys are not present in *active*."""
 
-        self._thumb_cache = {rel: pix for rel, pix in self._thumb_cache.items() if rel in active}
+        self._thumb_cache.discard_where(lambda key: isinstance(key, str) and key not in active)
 
     def clear_all_thumbnails(self) -> None:
         """Remove every cached thumbnail."""
 
-        self._thumb_cache.clear()
+        self._thumb_cache.discard_where(lambda key: isinstance(key, str))
 
     def move_placeholder(self, old_rel: str, new_rel: str) -> None:
         """Move the cached placeholder entry from *old_rel* to *new_rel*."""
@@ -188,7 +201,7 @@ class AssetCacheManager(QObject):
                 priority=priority,
             )
             if pixmap is not None:
-                self._thumb_cache[rel] = pixmap
+                self._thumb_cache.put(rel, pixmap)
                 return pixmap
 
         if bool(row.get("is_video")):
@@ -211,7 +224,7 @@ class AssetCacheManager(QObject):
                 priority=priority,
             )
             if pixmap is not None:
-                self._thumb_cache[rel] = pixmap
+                self._thumb_cache.put(rel, pixmap)
                 return pixmap
 
         return placeholder
@@ -296,7 +309,7 @@ class AssetCacheManager(QObject):
 
         if self._album_root and root != self._album_root:
             return
-        self._thumb_cache[rel] = pixmap
+        self._thumb_cache.put(rel, pixmap)
         self.thumbnailReady.emit(root, rel, pixmap)
 
     def _placeholder_for(self, rel: str, is_video: bool) -> QPixmap:
@@ -8,7 +8,7 @@ from typing import Dict, List, Optional, Tuple
 from PySide6.QtCore import QObject, QThreadPool, Signal, QTimer
 
 from ..tasks.asset_loader_worker import AssetLoaderSignals, AssetLoaderWorker, compute_asset_rows
-from ....config import WORK_DIR_NAME
+from ....cache.index_store import IndexStore
 
 
 class AssetDataLoader(QObject):
@@ -52,13 +52,8 @@ class AssetDataLoader(QObject):
         notification window when they connect right after ``open_album`` returns.
         """
 
-        index_path = root / WORK_DIR_NAME / "index.jsonl"
-        try:
-            size = index_path.stat().st_size
-        except OSError:
-            size = 0
-
-        if size > max_index_bytes:
+        # Count pending journal records too: they are replayed on every read.
+        if IndexStore(root).storage_bytes() > max_index_bytes:
             return None
 
         try:
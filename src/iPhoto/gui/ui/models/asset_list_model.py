@@ -18,6 +18,7 @@ from PySide6.QtCore import (
 )
 from PySide6.QtGui import QPixmap
 
+from ..tasks.asset_loader_worker import build_asset_entries
 from ..tasks.thumbnail_loader import ThumbnailLoader
 from .asset_cache_manager import AssetCacheManager
 from .asset_data_loader import AssetDataLoader
@@ -65,6 +66,7 @@ class AssetListModel(QAbstractListModel):
         self._pending_loader_root: Optional[Path] = None
 
         self._facade.linksUpdated.connect(self.handle_links_updated)
+        self._facade.scanChunkReady.connect(self._on_scan_chunk_ready)
 
     def album_root(self) -> Optional[Path]:
         """Return the path of the currently open album, if any."""
@@ -388,6 +390,36 @@ class AssetListModel(QAbstractListModel):
         # resort after every sub-album traversal.
         self._pending_rows.extend(chunk)
 
+    def _on_scan_chunk_ready(self, root: Path, chunk: List[Dict[str, object]]) -> None:
+        """Append assets discovered by a running scan that the model lacks.
+
+        A first-time scan can take minutes, so newly indexed rows are shown as
+        they arrive instead of after the scan completes.  A pending loader run
+        already covers the index, and rows the model knows are skipped.
+        """
+
+        if (
+            not self._album_root
+            or root != self._album_root
+            or not chunk
+            or self._pending_loader_root == self._album_root
+        ):
+            return
+
+        known = self._state_manager.row_lookup
+        manifest = self._facade.current_album.manifest if self._facade.current_album else {}
+        entries = [
+            entry
+            for entry in build_asset_entries(root, chunk, manifest.get("featured", []) or [])
+            if entry["rel"] not in known
+        ]
+        if not entries:
+            return
+        start = self._state_manager.row_count()
+        self.beginInsertRows(QModelIndex(), start, start + len(entries) - 1)
+        self._state_manager.append_chunk(entries)
+        self.endInsertRows()
+
     def _on_loader_progress(self, root: Path, current: int, total: int) -> None:
         if not self._album_root or root != self._album_root:
             return
@@ -51,11 +51,15 @@ class AssetListStateManager:
         """Replace the cached set of visible rows."""
 
         self._visible_rows = set(visible)
+        self._cache.pin_thumbnails(
+            str(self._rows[row]["rel"]) for row in self._visible_rows if 0 <= row < len(self._rows)
+        )
 
     def clear_visible_rows(self) -> None:
         """Forget the cached set of visible rows."""
 
         self._visible_rows.clear()
+        self._cache.pin_thumbnails(())
 
     def row_count(self) -> int:
         """Return the number of cached rows."""
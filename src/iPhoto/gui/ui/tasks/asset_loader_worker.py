@@ -7,11 +7,11 @@ from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from PySide6.QtCore import QObject, QRunnable, Signal
 
-from ....cache.index_store import IndexStore
+from ....cache.index_snapshot import read_index_rows
 from ....config import WORK_DIR_NAME
 from ....core.pairing import pair_live
 from ....media_classifier import classify_media
-from ....utils.geocoding import resolve_location_name
+from ....utils.geocoding import resolve_location_names
 from ....utils.pathutils import ensure_work_dir
 
 
@@ -115,12 +115,27 @@ def _motion_paths_to_hide(live_map: Dict[str, Dict[str, object]]) -> Set[str]:
     return motion_paths
 
 
+def _resolve_locations(
+    root: Path, rows: List[Dict[str, object]], *, wait: bool = True
+) -> List[Optional[str]]:
+    """Return the place name of every row, resolved in a single batch.
+
+    Callers on the GUI thread pass ``wait=False`` so a geocoder that is still
+    warming up leaves the names empty instead of freezing the interface.
+    """
+
+    return resolve_location_names(
+        (row.get("gps") for row in rows), album_root=root, wait=wait
+    )
+
+
 def _build_entry(
     root: Path,
     row: Dict[str, object],
     featured: Set[str],
     live_map: Dict[str, Dict[str, object]],
     motion_paths_to_hide: Set[str],
+    location_name: Optional[str] = None,
 ) -> Optional[Dict[str, object]]:
     rel = str(row.get("rel"))
     if not rel or rel in motion_paths_to_hide:
@@ -147,7 +162,6 @@ def _build_entry(
         live_group_id = str(live_info["id"])
 
     gps_raw = row.get("gps") if isinstance(row, dict) else None
-    location_name = resolve_location_name(gps_raw if isinstance(gps_raw, dict) else None)
 
     entry: Dict[str, object] = {
         "rel": rel,
@@ -194,19 +208,43 @@ def compute_asset_rows(
     live_map: Dict[str, Dict[str, object]],
 ) -> Tuple[List[Dict[str, object]], int]:
     ensure_work_dir(root, WORK_DIR_NAME)
-    index_rows = list(IndexStore(root).read_all())
+    index_rows = read_index_rows(root)
     resolved_map = _resolve_live_map(index_rows, live_map)
     motion_paths = _motion_paths_to_hide(resolved_map)
     featured_set = _normalize_featured(featured)
+    # Small albums are loaded synchronously on the GUI thread.
+    locations = _resolve_locations(root, index_rows, wait=False)
 
     entries: List[Dict[str, object]] = []
-    for row in index_rows:
-        entry = _build_entry(root, row, featured_set, resolved_map, motion_paths)
+    for row, location in zip(index_rows, locations):
+        entry = _build_entry(root, row, featured_set, resolved_map, motion_paths, location)
         if entry is not None:
             entries.append(entry)
     return entries, len(index_rows)
 
 
+def build_asset_entries(
+    root: Path,
+    rows: Iterable[Dict[str, object]],
+    featured: Iterable[str],
+) -> List[Dict[str, object]]:
+    """Convert raw index *rows* into model entries without Live Photo data.
+
+    Used for partial scan results, which arrive before pairing has run; the
+    reload that follows the scan replaces them with fully paired entries.
+    """
+
+    featured_set = _normalize_featured(featured)
+    pending = list(rows)
+    locations = _resolve_locations(root, pending, wait=False)
+    entries: List[Dict[str, object]] = []
+    for row, location in zip(pending, locations):
+        entry = _build_entry(root, row, featured_set, {}, set(), location)
+        if entry is not None:
+            entries.append(entry)
+    return entries
+
+
 class AssetLoaderSignals(QObject):
     """Signal container for :class:`AssetLoaderWorker` events."""
 
@@ -274,9 +312,10 @@ class AssetLoaderWorker(QRunnable):
     # ------------------------------------------------------------------
     def _build_payload_chunks(self) -> Iterable[List[Dict[str, object]]]:
         ensure_work_dir(self._root, WORK_DIR_NAME)
-        index_rows = list(IndexStore(self._root).read_all())
+        index_rows = read_index_rows(self._root)
         live_map = _resolve_live_map(index_rows, self._live_map)
         motion_paths_to_hide = _motion_paths_to_hide(live_map)
+        locations = _resolve_locations(self._root, index_rows)
 
         total = len(index_rows)
         if total == 0:
@@ -286,7 +325,7 @@ class AssetLoaderWorker(QRunnable):
         chunk_size = 200
         chunk: List[Dict[str, object]] = []
         last_reported = 0
-        for position, row in enumerate(index_rows, start=1):
+        for position, (row, location) in enumerate(zip(index_rows, locations), start=1):
             if self._is_cancelled:
                 return
             should_emit = position == total or position - last_reported >= 50
@@ -296,6 +335,7 @@ class AssetLoaderWorker(QRunnable):
                 self._featured,
                 live_map,
                 motion_paths_to_hide,
+                location,
             )
             if entry is not None:
                 chunk.append(entry)
@@ -192,7 +192,9 @@ class MoveWorker(QRunnable):
             rels.append(rel)
         if rels:
             store.remove_rows(rels)
-        backend.pair(self._source_root)
+        # Only the stems, folders and content ids of the moved files can change
+        # their pairings, so the rest of ``links.json`` is kept as is.
+        backend.pair(self._source_root, removed=rels)
 
         # When moves originate from the Basic Library view ``self._source_root`` is
         # the virtual aggregate rather than the concrete album that owned the asset.
@@ -204,7 +206,7 @@ class MoveWorker(QRunnable):
                 continue
             album_store = IndexStore(album_root)
             album_store.remove_rows(album_rels)
-            backend.pair(album_root)
+            backend.pair(album_root, removed=album_rels)
 
     def _update_destination_index(self, moved: List[Tuple[Path, Path]]) -> None:
         """Append moved assets to the destination album's index and links."""
@@ -259,7 +261,7 @@ class MoveWorker(QRunnable):
                 annotated_rows.append(enriched)
             new_rows = annotated_rows
         store.append_rows(new_rows)
-        backend.pair(self._destination_root)
+        backend.pair(self._destination_root, added=[str(row["rel"]) for row in new_rows])
 
         self._synchronise_library_index(moved, image_paths, video_paths)
 
@@ -303,6 +305,7 @@ class MoveWorker(QRunnable):
         if removals:
             store.remove_rows(removals)
 
+        library_rows: List[Dict[str, object]] = []
         if additions_images or additions_videos:
             library_rows = list(
                 process_media_paths(library_root, additions_images, additions_videos)
@@ -312,7 +315,11 @@ class MoveWorker(QRunnable):
         # Pairing the Basic Library after each update keeps library-wide Live Photo metadata
         # consistent with the concrete album indices, ensuring that aggregated views present
         # fresh still/motion relationships immediately after moves or restores complete.
-        backend.pair(library_root)
+        backend.pair(
+            library_root,
+            added=[str(row["rel"]) for row in library_rows],
+            removed=removals,
+        )
 
     def _resolve_optional(self, path: Optional[Path]) -> Optional[Path]:
         """Resolve *path* defensively, returning ``None`` when unavailable."""
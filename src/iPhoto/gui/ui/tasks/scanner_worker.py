@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
+from contextlib import closing
+from itertools import chain
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 from PySide6.QtCore import QObject, QRunnable, Signal
 
-from ....config import WORK_DIR_NAME
-from ....io.scanner import gather_media_paths, process_media_paths
+from ....cache.index_store import IndexStore
+from ....cache.scan_checkpoint import ScanCheckpoint
+from ....config import SCAN_CHECKPOINT_ROWS, WORK_DIR_NAME
+from ....errors import IndexCorruptedError
+from ....io.scanner import (
+    ScanStats,
+    gather_media_paths,
+    process_media_paths,
+    split_unchanged_paths,
+)
+from ....utils.logging import get_logger
 from ....utils.pathutils import ensure_work_dir
 
+LOGGER = get_logger()
+
 
 class ScannerSignals(QObject):
     """Signals emitted by :class:`ScannerWorker` while scanning."""
 
     progressUpdated = Signal(Path, int, int)
+    chunkReady = Signal(Path, list)
     finished = Signal(Path, list)
     error = Signal(Path, str)
 
@@ -29,6 +43,9 @@ class ScannerWorker(QRunnable):
         include: Iterable[str],
         exclude: Iterable[str],
         signals: ScannerSignals,
+        *,
+        incremental: bool = True,
+        workers: Optional[int] = None,
     ) -> None:
         super().__init__()
         self.setAutoDelete(False)
@@ -36,6 +53,17 @@ class ScannerWorker(QRunnable):
         self._include = list(include)
         self._exclude = list(exclude)
         self._signals = signals
+        # ``incremental`` scans reuse cached index rows for files whose stat
+        # fingerprint is unchanged so only new or modified files are inspected.
+        self._incremental = incremental
+        # ``workers`` overrides the scanner pipeline's thread count; ``None``
+        # keeps :data:`SCAN_WORKERS`.  Per-stage timings land in ``stats``.
+        self._workers = workers
+        self._stats = ScanStats()
+        # Rows are streamed to the checkpoint as they are produced so a
+        # cancelled scan can be resumed and the result promoted without
+        # re-serialising the whole list on the GUI thread.
+        self._checkpoint = ScanCheckpoint(root)
         self._is_cancelled = False
         self._had_error = False
 
@@ -45,6 +73,18 @@ class ScannerWorker(QRunnable):
 
         return self._root
 
+    @property
+    def stats(self) -> ScanStats:
+        """Per-stage timings collected while processing files."""
+
+        return self._stats
+
+    @property
+    def checkpoint(self) -> ScanCheckpoint:
+        """Checkpoint file that receives the rows produced by this scan."""
+
+        return self._checkpoint
+
     @property
     def signals(self) -> ScannerSignals:
         """Signal container used by this worker."""
@@ -81,28 +121,64 @@ class ScannerWorker(QRunnable):
             if self._is_cancelled:
                 return
 
+            existing_rows: Optional[List[dict]] = None
+            if self._incremental:
+                try:
+                    existing_rows = list(IndexStore(self._root).read_all())
+                except IndexCorruptedError as exc:
+                    LOGGER.warning("Ignoring unreadable index for %s: %s", self._root, exc)
+            # Rows checkpointed by an interrupted scan are reused as well, so a
+            # restarted scan only processes the files it had not reached yet.
+            existing_rows = self._checkpoint.merge_existing(existing_rows)
+            reused: List[dict] = []
+            if existing_rows is not None:
+                reused, image_paths, video_paths = split_unchanged_paths(
+                    self._root, image_paths, video_paths, existing_rows
+                )
+            if self._is_cancelled:
+                return
+
+            # Progress only covers files that still need metadata extraction;
+            # rows reused by an incremental scan are already complete.
             total_files = len(image_paths) + len(video_paths)
             self._signals.progressUpdated.emit(self._root, 0, total_files)
-            if total_files == 0:
-                self._signals.finished.emit(self._root, [])
-                return
 
-            processed_count = 0
+            processed = process_media_paths(
+                self._root,
+                image_paths,
+                video_paths,
+                workers=self._workers,
+                stats=self._stats,
+            )
+            chunk: List[dict] = []
             last_reported = 0
-            for row in process_media_paths(self._root, image_paths, video_paths):
-                if self._is_cancelled:
-                    return
-                rows.append(row)
-                processed_count += 1
-
-                # To avoid overwhelming the UI thread we only emit progress
-                # every 25 items (and always on completion).  This matches the
-                # cadence of the original worker implementation.
-                if processed_count == total_files or processed_count - last_reported >= 25:
-                    self._signals.progressUpdated.emit(
-                        self._root, processed_count, total_files
-                    )
-                    last_reported = processed_count
+            with closing(self._checkpoint.record(chain(reused, processed))) as stream:
+                for row in stream:
+                    if self._is_cancelled:
+                        return
+                    rows.append(row)
+                    chunk.append(row)
+                    # Partial chunks let the grid show assets while a first-time
+                    # scan is still running.
+                    if len(chunk) >= SCAN_CHECKPOINT_ROWS:
+                        self._signals.chunkReady.emit(self._root, chunk)
+                        chunk = []
+
+                    processed_count = len(rows) - len(reused)
+                    # To avoid overwhelming the UI thread we only emit progress
+                    # every 25 items (and always on completion).  This matches
+                    # the cadence of the original worker implementation.
+                    if processed_count > 0 and (
+                        processed_count == total_files or processed_count - last_reported >= 25
+                    ):
+                        self._signals.progressUpdated.emit(
+                            self._root, processed_count, total_files
+                        )
+                        last_reported = processed_count
+            if chunk:
+                self._signals.chunkReady.emit(self._root, chunk)
+            if total_files:
+                LOGGER.info("Scanned %s: %s", self._root, self._stats.summary())
         except Exception as exc:  # pragma: no cover - best-effort error propagation
             if not self._is_cancelled:
                 self._had_error = True
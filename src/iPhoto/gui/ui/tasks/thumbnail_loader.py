@@ -4,8 +4,8 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from enum import IntEnum
-import hashlib
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Optional, Set, Tuple
 
@@ -20,9 +20,18 @@ from PySide6.QtCore import (
 )
 from PySide6.QtGui import QImage, QPainter, QPixmap
 
-from ....config import THUMBNAIL_SEEK_GUARD_SEC, WORK_DIR_NAME
+from ....cache.thumbnail_store import ThumbnailStore
+from ....config import (
+    DEFAULT_THUMBNAIL_CODEC,
+    DEFAULT_THUMBNAIL_STORE_LAYOUT,
+    THUMBNAIL_QUALITY,
+    THUMBNAIL_SEEK_GUARD_SEC,
+    WORK_DIR_NAME,
+)
 from ....utils.pathutils import ensure_work_dir
 from ...utils import image_loader
+from ...utils.pixmap_cache import PixmapCache
+from ...utils.thumbnail_codec import encode_thumbnail
 from .video_frame_grabber import grab_video_frame
 
 
@@ -36,7 +45,7 @@ class ThumbnailJob(QRunnable):
         abs_path: Path,
         size: QSize,
         stamp: int,
-        cache_path: Path,
+        store: ThumbnailStore,
         *,
         is_image: bool,
         is_video: bool,
@@ -49,7 +58,7 @@ class ThumbnailJob(QRunnable):
         self._abs_path = abs_path
         self._size = size
         self._stamp = stamp
-        self._cache_path = cache_path
+        self._store = store
         self._is_image = is_image
         self._is_video = is_video
         self._still_image_time = still_image_time
@@ -79,7 +88,7 @@ class ThumbnailJob(QRunnable):
         return None
 
     def _render_image(self) -> Optional[QImage]:  # pragma: no cover - worker helper
-        image = image_loader.load_qimage(self._abs_path, self._size)
+        image = image_loader.load_thumbnail_qimage(self._abs_path, self._size)
         if image is None:
             return None
         return self._composite_canvas(image)
@@ -159,16 +168,16 @@ class ThumbnailJob(QRunnable):
 
     def _write_cache(self, canvas: QImage) -> None:  # pragma: no cover - worker helper
         try:
-            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
-            tmp_path = self._cache_path.with_suffix(self._cache_path.suffix + ".tmp")
-            if canvas.save(str(tmp_path), "PNG"):
-                ThumbnailLoader._safe_unlink(self._cache_path)
-                try:
-                    tmp_path.replace(self._cache_path)
-                except OSError:
-                    tmp_path.unlink(missing_ok=True)
-            else:  # pragma: no cover - Qt returns False on IO errors
-                tmp_path.unlink(missing_ok=True)
+            data = encode_thumbnail(canvas, self._store.codec, self._store.quality)
+            if data is None:
+                return
+            self._store.put(
+                self._rel,
+                self._size.width(),
+                self._size.height(),
+                self._stamp,
+                data,
+            )
         except Exception:
             pass
 
@@ -190,7 +199,15 @@ class ThumbnailLoader(QObject):
         NORMAL = 0
         VISIBLE = 1
 
-    def __init__(self, parent: Optional[QObject] = None) -> None:
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        *,
+        store_layout: str = DEFAULT_THUMBNAIL_STORE_LAYOUT,
+        codec: str = DEFAULT_THUMBNAIL_CODEC,
+        quality: int = THUMBNAIL_QUALITY,
+        memory_cache: Optional[PixmapCache] = None,
+    ) -> None:
         if parent is None:
             parent = QCoreApplication.instance()
         super().__init__(parent)
@@ -203,9 +220,18 @@ class ThumbnailLoader(QObject):
         self._video_pool.setMaxThreadCount(video_threads)
         self._album_root: Optional[Path] = None
         self._album_root_str: Optional[str] = None
-        self._memory: Dict[Tuple[str, str, int, int, int], QPixmap] = {}
+        self._store_layout = store_layout
+        self._codec = codec
+        self._quality = quality
+        self._store: Optional[ThumbnailStore] = None
+        # Decoded thumbnails, bounded by THUMBNAIL_MEMORY_BUDGET_BYTES.  Callers
+        # such as AssetCacheManager add their own entries to the same cache.
+        self._memory = memory_cache if memory_cache is not None else PixmapCache()
+        # Bookkeeping is keyed by ``(root, rel, width, height)`` and records the
+        # stamp concerned, so a newer stamp replaces an older entry in O(1).
+        self._stamps: Dict[Tuple[str, str, int, int], int] = {}
         self._pending: Set[Tuple[str, str, int, int, int]] = set()
-        self._failures: Set[Tuple[str, str, int, int, int]] = set()
+        self._failures: Dict[Tuple[str, str, int, int], int] = {}
         self._missing: Set[Tuple[str, str, int, int]] = set()
         self._video_queue: Dict[
             int, OrderedDict[Tuple[str, str, int, int, int], ThumbnailJob]
@@ -219,6 +245,11 @@ class ThumbnailLoader(QObject):
         ] = {}
         self._delivered.connect(self._handle_result)
 
+    def memory_cache(self) -> PixmapCache:
+        """Return the in-memory tier shared with callers of this loader."""
+
+        return self._memory
+
     def shutdown(self) -> None:
         """Stop background workers so the interpreter can exit cleanly."""
 
@@ -249,6 +280,7 @@ class ThumbnailLoader(QObject):
         self._album_root = root
         self._album_root_str = str(root.resolve())
         self._memory.clear()
+        self._stamps.clear()
         self._pending.clear()
         self._failures.clear()
         self._missing.clear()
@@ -260,6 +292,12 @@ class ThumbnailLoader(QObject):
             (work_dir / "thumbs").mkdir(parents=True, exist_ok=True)
         except OSError:
             pass
+        # Jobs still running for the previous album keep their own store
+        # reference; it simply falls out of use once they finish.
+        self._store = ThumbnailStore(
+            root, layout=self._store_layout, codec=self._codec, quality=self._quality
+        )
+        self._schedule_collection(self._store)
 
     def request(
         self,
@@ -293,18 +331,18 @@ class ThumbnailLoader(QObject):
         cached = self._memory.get(key)
         if cached is not None:
             return cached
-        if key in self._failures:
+        if self._failures.get(base_key) == stamp:
+            return None
+        store = self._store
+        if store is None:
             return None
-        cache_path = self._cache_path(rel, size, stamp)
-        if cache_path.exists():
-            pixmap = QPixmap(str(cache_path))
-            if not pixmap.isNull():
-                # Print the cached thumbnail path to help debugging the
-                # Location view while reusing disk-stored thumbnails.
-                print(f"[ThumbnailLoader] Cached thumbnail hit: {cache_path}")
-                self._memory[key] = pixmap
+        data = store.get(rel, size.width(), size.height(), stamp)
+        if data is not None:
+            pixmap = QPixmap()
+            if pixmap.loadFromData(data):
+                self._remember(key, pixmap, rel)
                 return pixmap
-            self._safe_unlink(cache_path)
+            store.discard(rel, size.width(), size.height(), stamp)
         if key in self._pending:
             return None
         job = ThumbnailJob(
@@ -313,7 +351,7 @@ class ThumbnailLoader(QObject):
             path,
             size,
             stamp,
-            cache_path,
+            store,
             is_image=is_image,
             is_video=is_video,
             still_image_time=still_image_time,
@@ -334,11 +372,18 @@ class ThumbnailLoader(QObject):
         base = self._base_key(rel, size)
         return (*base, stamp)
 
-    def _cache_path(self, rel: str, size: QSize, stamp: int) -> Path:
-        assert self._album_root is not None
-        digest = hashlib.sha1(rel.encode("utf-8")).hexdigest()
-        filename = f"{digest}_{stamp}_{size.width()}x{size.height()}.png"
-        return self._album_root / WORK_DIR_NAME / "thumbs" / filename
+    @staticmethod
+    def _schedule_collection(store: ThumbnailStore) -> None:
+        """Compact the album's thumbnail packs in the background when worthwhile."""
+
+        def _collect() -> None:
+            try:
+                if store.needs_collection():
+                    store.collect_garbage()
+            except Exception:  # pragma: no cover - best effort maintenance
+                pass
+
+        threading.Thread(target=_collect, name="iphoto-thumbs-gc", daemon=True).start()
 
     def _handle_result(
         self,
@@ -348,39 +393,35 @@ class ThumbnailLoader(QObject):
     ) -> None:
         self._pending.discard(key)
         if image is None:
-            self._failures.add(key)
+            self._failures[key[:-1]] = key[-1]
             self._drain_video_queue()
             return
         pixmap = QPixmap.fromImage(image)
         if pixmap.isNull():
-            self._failures.add(key)
+            self._failures[key[:-1]] = key[-1]
             self._drain_video_queue()
             return
-        base = key[:-1]
-        obsolete = [existing for existing in self._memory if existing[:-1] == base and existing != key]
-        for existing in obsolete:
-            self._memory.pop(existing, None)
-            if self._album_root is not None:
-                _, _, width, height, stale_stamp = existing
-                stale_size = QSize(width, height)
-                stale_path = self._cache_path(rel, stale_size, stale_stamp)
-                self._safe_unlink(stale_path)
-        self._memory[key] = pixmap
+        self._remember(key, pixmap, rel)
         if self._album_root is not None:
             self.ready.emit(self._album_root, rel, pixmap)
         self._drain_video_queue()
 
-    @staticmethod
-    def _safe_unlink(path: Path) -> None:
-        try:
-            path.unlink(missing_ok=True)
-        except PermissionError:
-            try:
-                path.rename(path.with_suffix(path.suffix + ".stale"))
-            except OSError:
-                pass
-        except OSError:
-            pass
+    def _remember(
+        self,
+        key: Tuple[str, str, int, int, int],
+        pixmap: QPixmap,
+        rel: str,
+    ) -> None:
+        """Cache *pixmap* as the current thumbnail, dropping one with an older stamp."""
+
+        base = key[:-1]
+        previous = self._stamps.get(base)
+        self._stamps[base] = key[-1]
+        if previous is not None and previous != key[-1]:
+            self._memory.pop((*base, previous))
+            if self._store is not None:
+                self._store.discard(rel, key[2], key[3], previous)
+        self._memory.put(key, pixmap)
 
     def _queue_video_job(
         self,
@@ -12,14 +12,31 @@ from PySide6.QtGui import QImage, QImageReader, QPixmap
 from ...utils.deps import load_pillow
 
 _PILLOW = load_pillow()
+
 if _PILLOW is not None:  # pragma: no branch - import guard
     _Image = _PILLOW.Image
     _ImageOps = _PILLOW.ImageOps
     _ImageQt = _PILLOW.ImageQt
+    _ORIENTATION_TRANSPOSE = {
+        2: _Image.Transpose.FLIP_LEFT_RIGHT,
+        3: _Image.Transpose.ROTATE_180,
+        4: _Image.Transpose.FLIP_TOP_BOTTOM,
+        5: _Image.Transpose.TRANSPOSE,
+        6: _Image.Transpose.ROTATE_270,
+        7: _Image.Transpose.TRANSVERSE,
+        8: _Image.Transpose.ROTATE_90,
+    }
 else:  # pragma: no cover - executed when Pillow is unavailable
     _Image = None  # type: ignore[assignment]
     _ImageOps = None  # type: ignore[assignment]
     _ImageQt = None  # type: ignore[assignment]
+    _ORIENTATION_TRANSPOSE = {}
+
+_EXIF_HEADER = b"Exif\x00\x00"
+_EXIF_IFD1 = -1  # ``PIL.ExifTags.IFD.IFD1``: the thumbnail directory
+_ORIENTATION_TAG = 0x0112
+_THUMBNAIL_OFFSET_TAG = 0x0201
+_THUMBNAIL_LENGTH_TAG = 0x0202
 
 
 def load_qimage(source: Path, target: QSize | None = None) -> Optional[QImage]:
@@ -35,6 +52,25 @@ def load_qimage(source: Path, target: QSize | None = None) -> Optional[QImage]:
     return _load_with_pillow(source, target)
 
 
+def load_thumbnail_qimage(source: Path, target: QSize) -> Optional[QImage]:
+    """Return a :class:`QImage` of *source* suitable for a *target* thumbnail.
+
+    Decoding the full-resolution photo dominates thumbnail rendering, so
+    cheaper sources are tried first: the EXIF thumbnail embedded in camera
+    JPEGs, then Pillow's draft mode, which decodes JPEGs at a reduced DCT
+    scale and selects an embedded HEIF thumbnail.  Either is used only when
+    it covers *target* in both dimensions, and it keeps the photo's aspect
+    ratio.  Other sources go through :func:`load_qimage`.
+    """
+
+    pillow_ready = _Image is not None and _ImageOps is not None and _ImageQt is not None
+    if pillow_ready and target.isValid() and not target.isEmpty():
+        image = _load_preview_with_pillow(source, target)
+        if image is not None:
+            return image
+    return load_qimage(source, target)
+
+
 def load_qpixmap(source: Path, target: QSize | None = None) -> Optional[QPixmap]:
     """Return a :class:`QPixmap` for *source*, falling back to Pillow when required."""
 
@@ -70,6 +106,57 @@ def qimage_from_bytes(data: bytes) -> Optional[QImage]:
     return QImage(qt_image)
 
 
+def _load_preview_with_pillow(source: Path, target: QSize) -> Optional[QImage]:
+    try:
+        with _Image.open(source) as img:  # type: ignore[union-attr]
+            orientation = img.getexif().get(_ORIENTATION_TAG, 1)
+            # The preview is rotated after decoding, so swap the bounds first.
+            if orientation in (5, 6, 7, 8):
+                size = (target.height(), target.width())
+            else:
+                size = (target.width(), target.height())
+            preview = _exif_thumbnail(img, size)
+            if preview is not None:
+                method = _ORIENTATION_TRANSPOSE.get(orientation)
+                if method is not None:
+                    preview = preview.transpose(method)
+            elif img.draft(img.mode, size) is not None:
+                preview = _ImageOps.exif_transpose(img)  # type: ignore[union-attr]
+            else:
+                return None
+            qt_image = _ImageQt(preview.convert("RGBA"))  # type: ignore[misc]
+    except Exception:  # pragma: no cover - fall back to the full decode
+        return None
+    return QImage(qt_image)
+
+
+def _exif_thumbnail(img, size: tuple[int, int]):
+    """Return the decoded EXIF thumbnail of *img* when it covers *size*."""
+
+    raw = img.info.get("exif")
+    if not isinstance(raw, bytes) or not raw.startswith(_EXIF_HEADER):
+        return None
+    ifd1 = img.getexif().get_ifd(_EXIF_IFD1)
+    offset = ifd1.get(_THUMBNAIL_OFFSET_TAG)
+    length = ifd1.get(_THUMBNAIL_LENGTH_TAG)
+    if not isinstance(offset, int) or not isinstance(length, int) or length <= 0:
+        return None
+    start = len(_EXIF_HEADER) + offset
+    data = raw[start : start + length]
+    if len(data) != length:
+        return None
+    thumbnail = _Image.open(BytesIO(data))  # type: ignore[union-attr]
+    width, height = thumbnail.size
+    if width < size[0] or height < size[1]:
+        return None
+    # Some cameras letterbox the thumbnail to a fixed 4:3 frame.
+    full_width, full_height = img.size
+    if abs(width * full_height - height * full_width) > 0.02 * full_width * height:
+        return None
+    thumbnail.load()
+    return thumbnail
+
+
 def _load_with_pillow(source: Path, target: QSize | None = None) -> Optional[QImage]:
     if _Image is None or _ImageOps is None or _ImageQt is None:
         return None
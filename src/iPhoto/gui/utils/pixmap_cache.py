@@ -0,0 +1,146 @@
+"""Byte-budgeted in-memory cache for decoded thumbnails."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set
+
+from PySide6.QtGui import QPixmap
+
+from ...config import THUMBNAIL_MEMORY_BUDGET_BYTES
+
+
+@dataclass(frozen=True)
+class PixmapCacheStats:
+    """Counters describing a :class:`PixmapCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    budget_bytes: int
+
+
+def pixmap_bytes(pixmap: QPixmap) -> int:
+    """Return the size of the pixel data held by *pixmap*."""
+
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class PixmapCache:
+    """LRU mapping of keys to :class:`QPixmap` bounded by pixel bytes.
+
+    Several keys may hold copies of one pixmap (Qt shares the pixel data);
+    such data is counted once and released when its last key goes.  Pinned
+    keys, normally the visible rows, are never evicted, so the cache may
+    exceed its budget while they alone fill it.  Meant for the GUI thread.
+    """
+
+    def __init__(self, budget_bytes: int = THUMBNAIL_MEMORY_BUDGET_BYTES) -> None:
+        self._budget = max(budget_bytes, 0)
+        self._entries: "OrderedDict[Hashable, QPixmap]" = OrderedDict()
+        self._shared: Dict[int, int] = {}
+        self._pinned: Set[Hashable] = set()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> List[Hashable]:
+        """Return the cached keys, least recently used first."""
+
+        return list(self._entries)
+
+    def get(self, key: Hashable) -> Optional[QPixmap]:
+        """Return the pixmap stored under *key* and mark it recently used."""
+
+        pixmap = self._entries.get(key)
+        if pixmap is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return pixmap
+
+    def put(self, key: Hashable, pixmap: QPixmap) -> None:
+        """Store *pixmap* under *key*, evicting old entries beyond the budget."""
+
+        self.pop(key)
+        self._entries[key] = pixmap
+        self._retain(pixmap)
+        self._evict()
+
+    def pop(self, key: Hashable) -> Optional[QPixmap]:
+        """Remove and return the pixmap stored under *key*, if any."""
+
+        pixmap = self._entries.pop(key, None)
+        if pixmap is not None:
+            self._release(pixmap)
+        return pixmap
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove every entry whose key satisfies *predicate*."""
+
+        for key in [key for key in self._entries if predicate(key)]:
+            self.pop(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._shared.clear()
+        self._pinned.clear()
+        self._bytes = 0
+
+    def pin(self, keys: Iterable[Hashable]) -> None:
+        """Protect exactly *keys* from eviction, replacing any earlier pins."""
+
+        self._pinned = set(keys)
+        self._evict()
+
+    def set_budget(self, budget_bytes: int) -> None:
+        self._budget = max(budget_bytes, 0)
+        self._evict()
+
+    def stats(self) -> PixmapCacheStats:
+        return PixmapCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            bytes=self._bytes,
+            budget_bytes=self._budget,
+        )
+
+    def _retain(self, pixmap: QPixmap) -> None:
+        key = pixmap.cacheKey()
+        count = self._shared.get(key, 0)
+        if not count:
+            self._bytes += pixmap_bytes(pixmap)
+        self._shared[key] = count + 1
+
+    def _release(self, pixmap: QPixmap) -> None:
+        key = pixmap.cacheKey()
+        count = self._shared.get(key, 0) - 1
+        if count > 0:
+            self._shared[key] = count
+            return
+        self._shared.pop(key, None)
+        self._bytes -= pixmap_bytes(pixmap)
+
+    def _evict(self) -> None:
+        while self._bytes > self._budget:
+            victim = next((key for key in self._entries if key not in self._pinned), None)
+            if victim is None:
+                return
+            self.pop(victim)
+            self._evictions += 1
+
+
+__all__ = ["PixmapCache", "PixmapCacheStats", "pixmap_bytes"]
@@ -0,0 +1,64 @@
+"""Encode thumbnail canvases for the on-disk thumbnail cache."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+from PySide6.QtGui import QImage
+
+from ...config import THUMBNAIL_CODECS
+
+_FORMATS = {"png": "PNG", "jpeg": "JPEG", "webp": "WEBP"}
+
+
+def is_opaque(image: QImage) -> bool:
+    """Return ``True`` when no pixel of *image* is transparent."""
+
+    if not image.hasAlphaChannel():
+        return True
+    alpha = image.convertToFormat(QImage.Format_Alpha8)
+    width, stride = alpha.width(), alpha.bytesPerLine()
+    data = bytes(alpha.constBits())
+    return all(
+        data.count(255, offset, offset + width) == width
+        for offset in range(0, stride * alpha.height(), stride)
+    )
+
+
+def _save(image: QImage, image_format: str, quality: int) -> Optional[bytes]:
+    payload = QByteArray()
+    buffer = QBuffer(payload)
+    buffer.open(QIODevice.WriteOnly)
+    try:
+        if not image.save(buffer, image_format, quality):
+            return None
+    finally:
+        buffer.close()
+    return payload.data()
+
+
+def encode_thumbnail(image: QImage, codec: str, quality: int) -> Optional[bytes]:
+    """Return *image* encoded with *codec* at *quality*, or ``None`` on failure.
+
+    JPEG cannot store transparency, so canvases with transparent pixels are
+    written as PNG instead; WebP keeps alpha.  Opaque canvases are flattened
+    to RGB before lossy encoding.  When the Qt image plugin for *codec* is
+    missing the thumbnail is written as PNG.
+    """
+
+    if codec not in THUMBNAIL_CODECS:
+        raise ValueError(f"Unknown thumbnail codec {codec!r}")
+    if codec == "png":
+        return _save(image, "PNG", -1)
+    opaque = is_opaque(image)
+    if codec == "jpeg" and not opaque:
+        return _save(image, "PNG", -1)
+    source = image.convertToFormat(QImage.Format_RGB32) if opaque else image
+    data = _save(source, _FORMATS[codec], quality)
+    if data is None:
+        return _save(image, "PNG", -1)
+    return data
+
+
+__all__ = ["encode_thumbnail", "is_opaque"]
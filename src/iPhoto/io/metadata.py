@@ -6,11 +6,12 @@ import re
 from datetime import datetime, timezone
 from fractions import Fraction
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 from dateutil.parser import isoparse
 from dateutil.tz import gettz
 
+from ..config import DEFAULT_VIDEO_METADATA_SOURCE
 from ..errors import ExternalToolError
 from ..utils.deps import load_pillow
 from ..utils.exiftool import get_metadata_batch
@@ -489,8 +490,110 @@ def read_image_meta(path: Path) -> Dict[str, Any]:
     return read_image_meta_with_exiftool(path, metadata_block)
 
 
-def read_video_meta(path: Path, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Return metadata for a video file, enriching it with ExifTool payloads."""
+# Fields that the ExifTool fast path must provide before ffprobe is skipped.
+_VIDEO_STREAM_FIELDS = ("dur", "w", "h", "codec", "frame_rate")
+
+# QuickTime sample description FourCCs mapped to the codec names ffprobe reports,
+# so rows look the same whichever tool filled them.
+_QUICKTIME_CODECS = {
+    "hvc1": "hevc",
+    "hev1": "hevc",
+    "avc1": "h264",
+    "avc3": "h264",
+    "mp4v": "mpeg4",
+    "av01": "av1",
+    "vp09": "vp9",
+    "apch": "prores",
+    "apcn": "prores",
+    "apcs": "prores",
+    "apco": "prores",
+    "ap4h": "prores",
+    "ap4x": "prores",
+    "jpeg": "mjpeg",
+}
+
+_TRACK_GROUP_PATTERN = re.compile(r"^Track(\d+)$")
+
+
+def _iter_track_groups(metadata: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield the ``TrackN`` groups of an ExifTool payload in track order."""
+
+    names = set()
+    for key in metadata:
+        if not isinstance(key, str):
+            continue
+        match = _TRACK_GROUP_PATTERN.match(key.split(":", 1)[0])
+        if match is not None:
+            names.add((int(match.group(1)), match.group(0)))
+    for _, name in sorted(names):
+        group = _extract_group(metadata, name)
+        if group:
+            yield group
+
+
+def _positive_int(value: Any) -> Optional[int]:
+    """Return *value* as a positive integer, or ``None``."""
+
+    number = _coerce_decimal(value)
+    if number is None or number <= 0:
+        return None
+    return int(number)
+
+
+def _apply_exiftool_video_fields(info: Dict[str, Any], metadata: Dict[str, Any]) -> None:
+    """Fill the stream fields of *info* from ExifTool's QuickTime groups.
+
+    The payload is expected in ``-n -g1`` form: durations are in seconds and
+    the video track (``Track1``, ``Track2``...) carries the dimensions, the
+    sample description FourCC and the frame rate.
+    """
+
+    quicktime_group = _extract_group(metadata, "QuickTime") or {}
+    composite_group = _extract_group(metadata, "Composite") or {}
+    keys_group = _extract_group(metadata, "Keys") or {}
+
+    duration = _coerce_decimal(quicktime_group.get("Duration"))
+    if duration is None:
+        duration = _coerce_decimal(composite_group.get("Duration"))
+    if duration is not None and duration > 0:
+        info["dur"] = duration
+
+    for track in _iter_track_groups(metadata):
+        width = _positive_int(track.get("ImageWidth") or track.get("SourceImageWidth"))
+        height = _positive_int(track.get("ImageHeight") or track.get("SourceImageHeight"))
+        if width is None or height is None:
+            continue
+        info["w"], info["h"] = width, height
+        compressor = _pick_string(track.get("CompressorID"))
+        if compressor is not None:
+            info["codec"] = _QUICKTIME_CODECS.get(compressor.lower(), compressor.lower())
+        frame_rate = _coerce_fractional(track.get("VideoFrameRate"))
+        if frame_rate is not None and frame_rate > 0:
+            info["frame_rate"] = frame_rate
+        if info["dur"] is None:
+            track_duration = _coerce_decimal(track.get("TrackDuration"))
+            if track_duration is not None and track_duration > 0:
+                info["dur"] = track_duration
+        break
+
+    still_time = _coerce_decimal(keys_group.get("StillImageTime"))
+    if still_time is not None and still_time >= 0:
+        info["still_image_time"] = still_time
+
+
+def read_video_meta(
+    path: Path,
+    metadata: Optional[Dict[str, Any]] = None,
+    *,
+    source: str = DEFAULT_VIDEO_METADATA_SOURCE,
+) -> Dict[str, Any]:
+    """Return metadata for a video file, enriching it with ExifTool payloads.
+
+    With the ``exiftool`` *source* the stream fields (duration, dimensions,
+    codec and frame rate) are read from the QuickTime groups of *metadata* and
+    ``ffprobe`` only runs when one of them is missing, filling just the gaps.
+    The ``ffprobe`` source probes every clip and lets its values win.
+    """
 
     info = _empty_media_info()
     info["mime"] = "video/quicktime" if path.suffix.lower() in {".mov", ".qt"} else "video/mp4"
@@ -550,11 +653,32 @@ def read_video_meta(path: Path, metadata: Optional[Dict[str, Any]] = None) -> Di
         if lens_value is not None:
             info["lens"] = lens_value
 
+    if source == "exiftool" and isinstance(metadata, dict):
+        _apply_exiftool_video_fields(info, metadata)
+        if all(info[key] is not None for key in _VIDEO_STREAM_FIELDS):
+            return info
+
     try:
         ffprobe_meta = probe_media(path)
     except ExternalToolError:
         return info
 
+    if source != "exiftool":
+        _apply_ffprobe_payload(info, ffprobe_meta)
+        return info
+
+    # Only fill what ExifTool could not provide; its values stay authoritative.
+    probed = _empty_media_info()
+    _apply_ffprobe_payload(probed, ffprobe_meta)
+    for key, value in probed.items():
+        if info.get(key) is None and value is not None:
+            info[key] = value
+    return info
+
+
+def _apply_ffprobe_payload(info: Dict[str, Any], ffprobe_meta: Any) -> None:
+    """Merge an ``ffprobe`` JSON payload into *info*."""
+
     fmt = ffprobe_meta.get("format", {}) if isinstance(ffprobe_meta, dict) else {}
     duration = fmt.get("duration") if isinstance(fmt, dict) else None
     if isinstance(duration, str):
@@ -654,7 +778,5 @@ def read_video_meta(path: Path, metadata: Optional[Dict[str, Any]] = None) -> Di
                 if isinstance(codec, str) and not info.get("codec"):
                     info["codec"] = codec
 
-    return info
-
 
 __all__ = ["read_image_meta", "read_image_meta_with_exiftool", "read_video_meta"]
@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 import mimetypes
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from ..config import WORK_DIR_NAME
+from ..config import DEFAULT_HASH_POLICY, EXIFTOOL_CHUNK_SIZE, SCAN_WORKERS, WORK_DIR_NAME
 from ..errors import ExternalToolError, IPhotoError
 from ..utils.exiftool import get_metadata_batch
-from ..utils.hashutils import file_xxh3
+from ..utils.ffmpeg import probe_count
+from ..utils.hashutils import file_fingerprint, file_xxh3
 from ..utils.logging import get_logger
-from ..utils.pathutils import ensure_work_dir, is_excluded, should_include
+from ..utils.pathutils import compile_globs, ensure_work_dir
 from .metadata import read_image_meta_with_exiftool, read_video_meta
 
 _IMAGE_EXTENSIONS = {".heic", ".jpg", ".jpeg", ".png"}
@@ -29,41 +37,149 @@ def gather_media_paths(
     Separating discovery from processing allows callers to present accurate
     progress indicators, because the total work is known before any metadata
     extraction begins.
+
+    The walk uses :func:`os.scandir` so file/directory checks come from the
+    directory entries instead of extra ``stat`` calls, matches relative paths
+    against globs compiled once per call, and skips excluded directories (and
+    every ``.iPhoto`` work directory) without descending into them.  Files are
+    returned in the same order as a ``root.rglob("*")`` traversal.
     """
 
     image_paths: List[Path] = []
     video_paths: List[Path] = []
+    globs = compile_globs(tuple(include_globs), tuple(exclude_globs))
 
-    for candidate in root.rglob("*"):
-        if not candidate.is_file():
-            continue
-        if WORK_DIR_NAME in candidate.parts:
-            continue
-        if is_excluded(candidate, exclude_globs, root=root):
-            continue
-        if not should_include(candidate, include_globs, exclude_globs, root=root):
+    # Pre-order depth-first walk: the files of a directory come before the
+    # contents of its subdirectories, which are visited in listing order.
+    stack: List[Tuple[str, str]] = [(os.fspath(root), "")]
+    while stack:
+        directory, rel_dir = stack.pop()
+        subdirectories: List[Tuple[str, str]] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    rel = f"{rel_dir}{entry.name}"
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name != WORK_DIR_NAME and not globs.prunes(rel):
+                                subdirectories.append((entry.path, f"{rel}/"))
+                            continue
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    suffix = os.path.splitext(entry.name)[1].lower()
+                    if suffix in _IMAGE_EXTENSIONS:
+                        target = image_paths
+                    elif suffix in _VIDEO_EXTENSIONS:
+                        target = video_paths
+                    else:
+                        continue
+                    if globs.includes(rel):
+                        target.append(root / rel)
+        except OSError as exc:
+            LOGGER.warning("Unable to list directory %s: %s", directory, exc)
             continue
-
-        suffix = candidate.suffix.lower()
-        if suffix in _IMAGE_EXTENSIONS:
-            image_paths.append(candidate)
-        elif suffix in _VIDEO_EXTENSIONS:
-            video_paths.append(candidate)
+        stack.extend(reversed(subdirectories))
 
     return image_paths, video_paths
 
 
-def process_media_paths(
-    root: Path, image_paths: List[Path], video_paths: List[Path]
-) -> Iterator[Dict[str, Any]]:
-    """Yield populated index rows for the provided media paths."""
+@dataclass
+class ScanStats:
+    """Cumulative per-stage timings collected by :func:`process_media_paths`.
 
-    all_paths = image_paths + video_paths
-    try:
-        metadata_payloads = get_metadata_batch(all_paths)
-    except ExternalToolError as exc:
-        LOGGER.warning("Batch ExifTool query failed for %s files: %s", len(all_paths), exc)
-        metadata_payloads = []
+    ``stage_seconds`` sums the time spent in each stage across all worker
+    threads, so on a parallel scan the values can exceed ``wall_seconds``.
+    Stages are ``gather`` (directory walk, recorded by :func:`scan_album`),
+    ``exiftool`` (batch metadata queries), ``stat``, ``hash`` (content
+    hashing), ``image_meta`` and ``video_meta`` (per-file parsing, the latter
+    including ffprobe) and ``wait`` (workers blocked on a pending ExifTool
+    batch).  ``counts`` tallies the external processes involved:
+    ``exiftool_batches`` requests and ``ffprobe`` runs.  ``files`` and
+    ``bytes`` cover the rows yielded by :func:`process_media_paths` only.
+    """
+
+    files: int = 0
+    bytes: int = 0
+    wall_seconds: float = 0.0
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    counts: Dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Accumulate *seconds* for *stage* (thread-safe)."""
+
+        with self._lock:
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increase the *name* counter by *amount* (thread-safe)."""
+
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + amount
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Time the body of a ``with`` block and record it under *stage*."""
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started)
+
+    @property
+    def files_per_second(self) -> float:
+        """Return the file throughput over ``wall_seconds``."""
+
+        return self.files / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Return the byte throughput over ``wall_seconds``."""
+
+        return self.bytes / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the collected figures as a JSON-serialisable mapping."""
+
+        with self._lock:
+            stages = dict(sorted(self.stage_seconds.items()))
+            counts = dict(sorted(self.counts.items()))
+        return {
+            "files": self.files,
+            "bytes": self.bytes,
+            "wall_seconds": self.wall_seconds,
+            "files_per_second": self.files_per_second,
+            "bytes_per_second": self.bytes_per_second,
+            "stage_seconds": stages,
+            "counts": counts,
+        }
+
+    def summary(self) -> str:
+        """Return a one-line, human-readable breakdown of the collected timings."""
+
+        with self._lock:
+            stages = ", ".join(
+                f"{stage} {seconds:.2f}s" for stage, seconds in sorted(self.stage_seconds.items())
+            )
+        return (
+            f"{self.files} files in {self.wall_seconds:.2f}s "
+            f"({self.files_per_second:.1f} files/s; {stages or 'no stages'})"
+        )
+
+
+def _load_metadata_chunk(paths: List[Path], stats: ScanStats) -> Dict[Path, Dict[str, Any]]:
+    """Run one ExifTool batch for *paths* and index the payloads by path."""
+
+    stats.count("exiftool_batches")
+    with stats.measure("exiftool"):
+        try:
+            metadata_payloads = get_metadata_batch(paths)
+        except ExternalToolError as exc:
+            LOGGER.warning("Batch ExifTool query failed for %s files: %s", len(paths), exc)
+            metadata_payloads = []
 
     metadata_lookup: Dict[Path, Dict[str, Any]] = {}
     for payload in metadata_payloads:
@@ -78,68 +194,309 @@ def process_media_paths(
             # constructed the candidate list.
             metadata_lookup[source_path] = payload
             metadata_lookup[source_path.resolve()] = payload
+    return metadata_lookup
 
-    for path in all_paths:
-        try:
-            resolved = path.resolve()
-            metadata = metadata_lookup.get(resolved)
-            if metadata is None:
-                metadata = metadata_lookup.get(path)
-            yield _build_row(root, path, metadata)
-        except (IPhotoError, OSError) as exc:
-            # Each asset must be processed independently so that one corrupt
-            # file does not abort the entire album scan.  When metadata
-            # extraction raises an ``IPhotoError`` or the underlying imaging
-            # libraries throw ``OSError`` (common for truncated fixtures during
-            # tests), we log the failure and fall back to a minimal row built
-            # from filesystem metadata so the asset still appears in the index.
-            LOGGER.warning("Could not process file %s: %s", path, exc)
+
+def _process_path(
+    root: Path,
+    path: Path,
+    metadata_future: "Future[Dict[Path, Dict[str, Any]]]",
+    stats: ScanStats,
+    hash_policy: str,
+) -> Optional[Dict[str, Any]]:
+    """Build the index row for *path* on a pipeline worker thread.
+
+    Stat and hashing run immediately so they overlap with the pending ExifTool
+    batch; the worker only blocks on *metadata_future* once the content hash is
+    known.
+    """
+
+    try:
+        with stats.measure("stat"):
+            stat = path.stat()
+        with stats.measure("hash"):
+            base_row = _build_base_row(root, path, stat, hash_policy=hash_policy)
+    except OSError as exc:
+        LOGGER.warning("Unable to read file %s: %s", path, exc)
+        return None
+
+    with stats.measure("wait"):
+        metadata_lookup = metadata_future.result()
+
+    try:
+        metadata = metadata_lookup.get(path.resolve())
+        if metadata is None:
+            metadata = metadata_lookup.get(path)
+        stage = "video_meta" if path.suffix.lower() in _VIDEO_EXTENSIONS else "image_meta"
+        with stats.measure(stage):
+            return _apply_metadata(base_row, path, metadata)
+    except (IPhotoError, OSError) as exc:
+        # Each asset must be processed independently so that one corrupt
+        # file does not abort the entire album scan.  When metadata
+        # extraction raises an ``IPhotoError`` or the underlying imaging
+        # libraries throw ``OSError`` (common for truncated fixtures during
+        # tests), we log the failure and fall back to a minimal row built
+        # from filesystem metadata so the asset still appears in the index.
+        LOGGER.warning("Could not process file %s: %s", path, exc)
+        return base_row
+
+
+def process_media_paths(
+    root: Path,
+    image_paths: List[Path],
+    video_paths: List[Path],
+    *,
+    workers: Optional[int] = None,
+    stats: Optional[ScanStats] = None,
+    hash_policy: str = DEFAULT_HASH_POLICY,
+) -> Iterator[Dict[str, Any]]:
+    """Yield populated index rows for the provided media paths.
+
+    The scan is pipelined: ExifTool batches of :data:`EXIFTOOL_CHUNK_SIZE` files
+    run on a dedicated thread while a bounded pool of *workers* threads (default
+    :data:`SCAN_WORKERS`) stats, hashes and, for videos, probes each file.  Rows
+    are still yielded in input order (images first, then videos) with the same
+    schema as a serial scan.  Pass a :class:`ScanStats` instance as *stats* to
+    collect per-stage timings.  *hash_policy* selects how much of each file is
+    hashed (see :data:`HASH_POLICIES`).
+    """
+
+    all_paths = image_paths + video_paths
+    if not all_paths:
+        return
+    stats = stats if stats is not None else ScanStats()
+    worker_count = max(1, workers if workers is not None else SCAN_WORKERS)
+    # Keep a bounded number of files in flight so memory does not grow with the
+    # album size when the consumer is slower than the pool.
+    window = worker_count * 4
+
+    started = time.perf_counter()
+    # ffprobe runs are counted process-wide, so concurrent scans are included.
+    probes_before = probe_count()
+    metadata_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="iphoto-exiftool")
+    file_executor = ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="iphoto-scan")
+    # ExifTool batches are requested lazily, at most one chunk ahead of the
+    # files being submitted, and dropped once their last row has been yielded,
+    # so only a couple of chunk payloads are ever held in memory.
+    chunk_futures: Dict[int, "Future[Dict[Path, Dict[str, Any]]]"] = {}
+
+    def _chunk(index: int) -> "Future[Dict[Path, Dict[str, Any]]]":
+        future = chunk_futures.get(index)
+        if future is None:
+            offset = index * EXIFTOOL_CHUNK_SIZE
+            future = metadata_executor.submit(
+                _load_metadata_chunk, all_paths[offset : offset + EXIFTOOL_CHUNK_SIZE], stats
+            )
+            chunk_futures[index] = future
+        return future
+
+    def _submit(position: int) -> "Future[Optional[Dict[str, Any]]]":
+        index = position // EXIFTOOL_CHUNK_SIZE
+        if (index + 1) * EXIFTOOL_CHUNK_SIZE < len(all_paths):
+            _chunk(index + 1)
+        return file_executor.submit(
+            _process_path, root, all_paths[position], _chunk(index), stats, hash_policy
+        )
+
+    try:
+        pending: Deque["Future[Optional[Dict[str, Any]]]"] = deque()
+        next_position = 0
+        for position in range(len(all_paths)):
+            while next_position < len(all_paths) and len(pending) < window:
+                pending.append(_submit(next_position))
+                next_position += 1
+            row = pending.popleft().result()
+            if (position + 1) % EXIFTOOL_CHUNK_SIZE == 0:
+                chunk_futures.pop(position // EXIFTOOL_CHUNK_SIZE, None)
+            if row is not None:
+                stats.files += 1
+                stats.bytes += row.get("bytes") or 0
+                yield row
+    finally:
+        # Do not block a consumer that abandons the generator: queued work is
+        # cancelled and in-flight files finish in the background.
+        file_executor.shutdown(wait=False, cancel_futures=True)
+        metadata_executor.shutdown(wait=False, cancel_futures=True)
+        stats.wall_seconds += time.perf_counter() - started
+        stats.count("ffprobe", probe_count() - probes_before)
+
+
+def split_unchanged_paths(
+    root: Path,
+    image_paths: List[Path],
+    video_paths: List[Path],
+    existing_rows: Iterable[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[Path], List[Path]]:
+    """Separate files whose cached index row is still current from changed files.
+
+    A cached row is reused when the file's size, ``st_mtime_ns`` and inode match
+    the fingerprint recorded by :func:`_build_base_row`.  Rows written before
+    fingerprints were recorded never match, so those files are re-extracted once
+    and carry a fingerprint afterwards.  Rows for files that no longer exist are
+    not returned, which drops deleted assets from the rebuilt index.
+
+    Returns
+    -------
+    tuple
+        ``(reused_rows, changed_images, changed_videos)`` where the path lists
+        preserve the order of the input lists.
+    """
+
+    cached: Dict[str, Dict[str, Any]] = {}
+    for row in existing_rows:
+        rel = row.get("rel")
+        if isinstance(rel, str) and rel:
+            cached[Path(rel).as_posix()] = row
+
+    reused: List[Dict[str, Any]] = []
+
+    def _filter(paths: List[Path]) -> List[Path]:
+        changed: List[Path] = []
+        for path in paths:
+            row = cached.get(path.relative_to(root).as_posix())
+            if row is None:
+                changed.append(path)
+                continue
             try:
                 stat = path.stat()
-            except OSError as stat_exc:
-                LOGGER.warning(
-                    "Unable to stat file %s after metadata failure: %s", path, stat_exc
-                )
+            except OSError:
+                changed.append(path)
                 continue
-            yield _build_base_row(root, path, stat)
+            if _fingerprint_matches(row, stat):
+                reused.append(row)
+            else:
+                changed.append(path)
+        return changed
+
+    changed_images = _filter(image_paths)
+    changed_videos = _filter(video_paths)
+    return reused, changed_images, changed_videos
 
 
 def scan_album(
     root: Path,
     include_globs: Iterable[str],
     exclude_globs: Iterable[str],
+    *,
+    existing_rows: Optional[Iterable[Dict[str, Any]]] = None,
+    workers: Optional[int] = None,
+    stats: Optional[ScanStats] = None,
+    hash_policy: str = DEFAULT_HASH_POLICY,
 ) -> Iterator[Dict[str, Any]]:
-    """Yield index rows for all matching assets in *root*."""
+    """Yield index rows for all matching assets in *root*.
+
+    When *existing_rows* is supplied the scan runs incrementally: rows for files
+    whose stat fingerprint is unchanged are yielded as-is and only new or
+    modified files are hashed and inspected with ExifTool/ffprobe.  Passing
+    ``None`` performs a full scan of every file.  *workers*, *stats* and
+    *hash_policy* are forwarded to :func:`process_media_paths`; with the
+    ``full`` policy, reused rows that lack a full-content hash receive one.
+    """
 
     ensure_work_dir(root, WORK_DIR_NAME)
-    image_paths, video_paths = gather_media_paths(root, include_globs, exclude_globs)
-    yield from process_media_paths(root, image_paths, video_paths)
+    stats = stats if stats is not None else ScanStats()
+    with stats.measure("gather"):
+        image_paths, video_paths = gather_media_paths(root, include_globs, exclude_globs)
+    if existing_rows is not None:
+        reused, image_paths, video_paths = split_unchanged_paths(
+            root, image_paths, video_paths, existing_rows
+        )
+        LOGGER.debug(
+            "Incremental scan of %s reuses %s rows and refreshes %s files",
+            root,
+            len(reused),
+            len(image_paths) + len(video_paths),
+        )
+        for row in reused:
+            if hash_policy == "full" and "xxh3" not in row:
+                row = _with_full_hash(root, row)
+            yield row
+    yield from process_media_paths(
+        root, image_paths, video_paths, workers=workers, stats=stats, hash_policy=hash_policy
+    )
+
+
+def _fingerprint_matches(row: Dict[str, Any], stat: Any) -> bool:
+    """Return ``True`` when *row* was built from a file with the given *stat*."""
 
+    return (
+        row.get("mtime_ns") == stat.st_mtime_ns
+        and row.get("ino") == stat.st_ino
+        and row.get("bytes") == stat.st_size
+    )
 
-def _build_base_row(root: Path, file_path: Path, stat: Any) -> Dict[str, Any]:
-    """Create the common metadata fields shared by images and videos."""
+
+def _build_base_row(
+    root: Path, file_path: Path, stat: Any, *, hash_policy: str = DEFAULT_HASH_POLICY
+) -> Dict[str, Any]:
+    """Create the common metadata fields shared by images and videos.
+
+    ``mtime_ns`` and ``ino`` together with ``bytes`` form the stat fingerprint
+    that incremental scans use to decide whether a file must be re-inspected.
+    The ``id`` always derives from the sampled :func:`file_fingerprint`, so it
+    does not depend on the policy; ``full`` adds the whole-file ``xxh3`` hash.
+    """
 
     rel = file_path.relative_to(root).as_posix()
-    return {
+    digest = file_fingerprint(file_path, size=stat.st_size)
+    row: Dict[str, Any] = {
         "rel": rel,
         "bytes": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "ino": stat.st_ino,
         "dt": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat().replace(
             "+00:00", "Z"
         ),
-        "id": f"as_{file_xxh3(file_path)}",
+        "id": f"as_{digest}",
         "mime": mimetypes.guess_type(file_path.name)[0],
     }
+    if hash_policy == "full":
+        row["xxh3"] = file_xxh3(file_path)
+    return row
 
 
-def _build_row(
-    root: Path,
+def _with_full_hash(root: Path, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of *row* carrying the full-content ``xxh3`` hash."""
+
+    try:
+        digest = file_xxh3(root / str(row["rel"]))
+    except OSError as exc:
+        LOGGER.warning("Unable to hash %s: %s", row.get("rel"), exc)
+        return row
+    return {**row, "xxh3": digest}
+
+
+def fill_full_hashes(root: Path, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return updated copies of the *rows* that still lack a full-content hash.
+
+    Rows whose file changed since it was indexed are skipped, because their
+    stat fingerprint no longer describes the bytes that would be hashed; the
+    next scan refreshes them.
+    """
+
+    updated: List[Dict[str, Any]] = []
+    for row in rows:
+        rel = row.get("rel")
+        if "xxh3" in row or not isinstance(rel, str):
+            continue
+        try:
+            stat = (root / rel).stat()
+        except OSError:
+            continue
+        if not _fingerprint_matches(row, stat):
+            continue
+        refreshed = _with_full_hash(root, row)
+        if "xxh3" in refreshed:
+            updated.append(refreshed)
+    return updated
+
+
+def _apply_metadata(
+    base_row: Dict[str, Any],
     file_path: Path,
     metadata_override: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    """Return an index row for ``file_path``."""
-
-    stat = file_path.stat()
-    base_row = _build_base_row(root, file_path, stat)
+    """Merge image or video metadata for ``file_path`` into *base_row*."""
 
     suffix = file_path.suffix.lower()
     metadata: Dict[str, Any]
@@ -23,9 +23,9 @@ from ..errors import (
 )
 from ..media_classifier import classify_media
 from ..models.album import Album
-from ..utils.geocoding import resolve_location_name
+from ..utils.geocoding import resolve_location_names
 from ..utils.jsonio import read_json
-from ..cache.index_store import IndexStore
+from ..cache.index_snapshot import read_geotagged_rows
 from .tree import AlbumNode
 
 
@@ -114,8 +114,13 @@ class LibraryManager(QObject):
     # ------------------------------------------------------------------
     # Asset helpers
     # ------------------------------------------------------------------
-    def get_geotagged_assets(self) -> List[GeotaggedAsset]:
-        """Return every asset in the library that exposes GPS coordinates."""
+    def get_geotagged_assets(self, *, wait_for_geocoder: bool = True) -> List[GeotaggedAsset]:
+        """Return every asset in the library that exposes GPS coordinates.
+
+        When *wait_for_geocoder* is ``False`` and the reverse geocoder is still
+        warming up, assets whose place name is not cached get ``None`` as their
+        ``location_name`` instead of blocking the caller.
+        """
 
         root = self._require_root()
         # ``seen`` prevents duplicate entries when a sub-album and its parent
@@ -128,10 +133,19 @@ class LibraryManager(QObject):
 
         for album_path in sorted(album_paths):
             try:
-                rows = IndexStore(album_path).read_all()
+                rows = read_geotagged_rows(album_path)
             except Exception:
                 continue
-            for row in rows:
+            # ``resolve_location_names`` maps each GPS coordinate to a human-readable
+            # label (typically the city) so that low zoom levels can show a
+            # meaningful aggregate marker instead of individual thumbnails.  The
+            # whole album is resolved in one batch backed by its geocode cache.
+            location_names = resolve_location_names(
+                (row.get("gps") if isinstance(row, dict) else None for row in rows),
+                album_root=album_path,
+                wait=wait_for_geocoder,
+            )
+            for row, location_name in zip(rows, location_names):
                 if not isinstance(row, dict):
                     continue
                 gps = row.get("gps")
@@ -141,10 +155,6 @@ class LibraryManager(QObject):
                 lon = gps.get("lon")
                 if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
                     continue
-                # ``resolve_location_name`` maps the GPS coordinate to a human-readable
-                # label (typically the city) so that low zoom levels can show a
-                # meaningful aggregate marker instead of individual thumbnails.
-                location_name = resolve_location_name(gps)
                 rel = row.get("rel")
                 if not isinstance(rel, str) or not rel:
                     continue
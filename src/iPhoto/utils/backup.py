@@ -0,0 +1,194 @@
+"""Versioned backups of the JSON documents rewritten by :func:`write_json`."""
+
+from __future__ import annotations
+
+import gzip
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..config import BACKUP_COMPRESS, BACKUP_KEEP_COUNT, BACKUP_MAX_AGE_DAYS
+from .hashutils import bytes_xxh3
+from .logging import get_logger
+
+LOGGER = get_logger()
+
+_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S%fZ"
+# ``<stem>.<timestamp>.<digest><suffix>[.gz]``, e.g.
+# ``links.20240501T101500123456Z.9f86d081884c7d65.json.gz``.
+_BACKUP_NAME = re.compile(
+    r"^(?P<stem>.+)\.(?P<stamp>\d{8}T\d{12}Z)\.(?P<digest>[0-9a-f]{16})"
+    r"(?P<suffix>\.[^.]+)(?P<gz>\.gz)?$"
+)
+# Backups written before retention existed were named ``<timestamp><suffix>``.
+_LEGACY_NAME = re.compile(r"^(?P<stamp>\d{8}T\d{6}Z)(?P<suffix>\.[^.]+)$")
+
+
+@dataclass(frozen=True)
+class BackupEntry:
+    """A backup file and the document it belongs to."""
+
+    path: Path
+    group: Tuple[str, str]
+    created: datetime
+    digest: Optional[str]
+
+
+def _parse(path: Path) -> Optional[BackupEntry]:
+    match = _BACKUP_NAME.match(path.name)
+    if match is not None:
+        created = datetime.strptime(match["stamp"], _TIMESTAMP_FORMAT)
+        return BackupEntry(
+            path,
+            (match["stem"], match["suffix"]),
+            created.replace(tzinfo=timezone.utc),
+            match["digest"],
+        )
+    match = _LEGACY_NAME.match(path.name)
+    if match is not None:
+        created = datetime.strptime(match["stamp"], "%Y%m%dT%H%M%SZ")
+        return BackupEntry(
+            path, ("", match["suffix"]), created.replace(tzinfo=timezone.utc), None
+        )
+    return None
+
+
+def _group_for(source: Path) -> Tuple[str, str]:
+    # Manifests may be dot-files (``.iphoto.album.json``); keep backups visible.
+    return source.stem.lstrip(".") or source.stem, source.suffix
+
+
+def list_backups(backup_dir: Path) -> Dict[Tuple[str, str], List[BackupEntry]]:
+    """Return the backups in *backup_dir* grouped by document, newest first."""
+
+    groups: Dict[Tuple[str, str], List[BackupEntry]] = {}
+    try:
+        candidates = list(backup_dir.iterdir())
+    except FileNotFoundError:
+        return groups
+    for path in candidates:
+        entry = _parse(path)
+        if entry is not None:
+            groups.setdefault(entry.group, []).append(entry)
+    for entries in groups.values():
+        entries.sort(key=lambda entry: entry.created, reverse=True)
+    return groups
+
+
+def write_backup(
+    source: Path,
+    backup_dir: Path,
+    *,
+    replacement: Optional[bytes] = None,
+    compress: bool = BACKUP_COMPRESS,
+) -> Optional[Path]:
+    """Copy the current contents of *source* into *backup_dir* before it changes.
+
+    Nothing is written when *source* does not exist, when its contents equal
+    *replacement* (the bytes about to be written, so no version is lost) or
+    when they match the newest backup of the same document.  Returns the path
+    of the new backup, if any, and prunes old versions in the background.
+    """
+
+    try:
+        data = source.read_bytes()
+    except FileNotFoundError:
+        return None
+    if replacement is not None and data == replacement:
+        return None
+
+    digest = bytes_xxh3(data)
+    group = _group_for(source)
+    newest = list_backups(backup_dir).get(group)
+    if newest and newest[0].digest == digest:
+        return None
+
+    backup_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime(_TIMESTAMP_FORMAT)
+    name = f"{group[0]}.{stamp}.{digest}{group[1]}"
+    if compress:
+        backup_path = backup_dir / f"{name}.gz"
+        backup_path.write_bytes(gzip.compress(data, mtime=0))
+    else:
+        backup_path = backup_dir / name
+        backup_path.write_bytes(data)
+    schedule_prune(backup_dir)
+    return backup_path
+
+
+def read_backup(path: Path) -> bytes:
+    """Return the original bytes stored in the backup at *path*."""
+
+    data = path.read_bytes()
+    return gzip.decompress(data) if path.suffix == ".gz" else data
+
+
+def prune_backups(
+    backup_dir: Path,
+    *,
+    keep: int = BACKUP_KEEP_COUNT,
+    max_age_days: float = BACKUP_MAX_AGE_DAYS,
+    now: Optional[datetime] = None,
+) -> int:
+    """Delete backups beyond the retention policy and return how many were removed.
+
+    Each document keeps its *keep* newest backups, minus any older than
+    *max_age_days*; the newest backup of a document is never removed.
+    """
+
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=max_age_days)
+    removed = 0
+    for entries in list_backups(backup_dir).values():
+        for position, entry in enumerate(entries):
+            if position == 0:
+                continue
+            if position < keep and entry.created >= cutoff:
+                continue
+            try:
+                entry.path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as exc:
+                LOGGER.warning("Could not remove old backup %s: %s", entry.path, exc)
+                continue
+            removed += 1
+    if removed:
+        LOGGER.debug("Pruned %d backups from %s", removed, backup_dir)
+    return removed
+
+
+_PRUNING: set[Path] = set()
+_PRUNING_LOCK = threading.Lock()
+
+
+def schedule_prune(backup_dir: Path) -> None:
+    """Prune *backup_dir* on a daemon thread unless a prune is already running."""
+
+    with _PRUNING_LOCK:
+        if backup_dir in _PRUNING:
+            return
+        _PRUNING.add(backup_dir)
+
+    def _run() -> None:
+        try:
+            prune_backups(backup_dir)
+        except OSError as exc:  # pragma: no cover - defensive guard
+            LOGGER.warning("Pruning backups in %s failed: %s", backup_dir, exc)
+        finally:
+            with _PRUNING_LOCK:
+                _PRUNING.discard(backup_dir)
+
+    threading.Thread(target=_run, name="iphoto-backup-prune", daemon=True).start()
+
+
+__all__ = [
+    "BackupEntry",
+    "list_backups",
+    "prune_backups",
+    "read_backup",
+    "schedule_prune",
+    "write_backup",
+]
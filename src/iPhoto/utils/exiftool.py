@@ -2,22 +2,252 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import shutil
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional
 
+from ..config import EXIFTOOL_CHUNK_SIZE
 from ..errors import ExternalToolError
+from .logging import get_logger
+
+LOGGER = get_logger()
+
+_MISSING_MESSAGE = (
+    "exiftool executable not found. Install it from https://exiftool.org/ "
+    "and ensure it is available on PATH."
+)
+
+# Arguments applied to every request sent to the long-lived session.
+_COMMON_ARGS = [
+    "-n",  # emit numeric GPS values instead of DMS strings
+    "-g1",  # keep group information (e.g. Composite, GPS) in the payload
+    "-json",
+    "-charset",
+    "UTF8",  # decode metadata strings as UTF-8
+    "-charset",
+    "filename=UTF8",  # interpret the paths read from the argument stream as UTF-8
+]
+
+
+class ExifToolSession:
+    """Long-lived ``exiftool -stay_open True -@ -`` process.
+
+    Starting ExifTool pays the Perl interpreter start-up cost (hundreds of
+    milliseconds), so a single process is kept alive and fed requests through
+    its argument stream.  Each request is terminated by ``-executeN`` and its
+    JSON output ends with a ``{readyN}`` marker on stdout.  Requests are
+    serialised with a lock because the process handles one command at a time.
+    When the process dies mid-request it is restarted once and the request is
+    replayed.
+    """
+
+    def __init__(self, executable: str) -> None:
+        self._executable = executable
+        self._process: Optional[subprocess.Popen[bytes]] = None
+        self._stderr_tail: Deque[str] = deque(maxlen=20)
+        self._lock = threading.Lock()
+        self._counter = 0
+
+    @property
+    def running(self) -> bool:
+        """Return ``True`` while the ExifTool process is alive."""
+
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def pid(self) -> Optional[int]:
+        """Return the process id of the running ExifTool instance, if any."""
+
+        return self._process.pid if self.running and self._process is not None else None
+
+    def execute_json(self, paths: List[Path]) -> List[Dict[str, Any]]:
+        """Return the ExifTool JSON payloads for *paths* in a single request."""
+
+        if not paths:
+            return []
+        with self._lock:
+            try:
+                return self._request(paths)
+            except (BrokenPipeError, ConnectionResetError, EOFError) as exc:
+                LOGGER.warning("ExifTool session ended unexpectedly (%s); restarting", exc)
+                self._terminate()
+            try:
+                return self._request(paths)
+            except (BrokenPipeError, ConnectionResetError, EOFError) as exc:
+                self._terminate()
+                stderr = "; ".join(self._stderr_tail) or str(exc) or "process exited"
+                raise ExternalToolError(f"ExifTool failed with an error: {stderr}") from exc
+
+    def close(self) -> None:
+        """Ask ExifTool to exit and reap the process."""
+
+        with self._lock:
+            process = self._process
+            if process is None:
+                return
+            if process.poll() is None and process.stdin is not None:
+                try:
+                    process.stdin.write(b"-stay_open\nFalse\n")
+                    process.stdin.flush()
+                    process.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+            self._terminate()
+
+    def _request(self, paths: List[Path]) -> List[Dict[str, Any]]:
+        process = self._ensure_process()
+        assert process.stdin is not None and process.stdout is not None
+        self._counter += 1
+        marker = f"{{ready{self._counter}}}".encode("ascii")
+        lines = [*_COMMON_ARGS]
+        for path in paths:
+            text = str(path)
+            if "\n" in text:
+                # The argument stream is line based; such names cannot be sent.
+                LOGGER.warning("Skipping path with a newline for ExifTool: %r", text)
+                continue
+            lines.append(text)
+        lines.append(f"-execute{self._counter}")
+        process.stdin.write(("\n".join(lines) + "\n").encode("utf-8"))
+        process.stdin.flush()
+
+        chunks: List[bytes] = []
+        while True:
+            line = process.stdout.readline()
+            if not line:
+                raise EOFError("exiftool closed its output stream")
+            if line.rstrip(b"\r\n") == marker:
+                break
+            chunks.append(line)
+
+        output = b"".join(chunks).decode("utf-8", errors="replace").strip()
+        if not output:
+            # ExifTool prints nothing to stdout when every file failed; the
+            # reasons are on stderr and were logged by the drain thread.
+            return []
+        try:
+            payload = json.loads(output)
+        except json.JSONDecodeError as exc:
+            raise ExternalToolError(f"Failed to parse JSON output from ExifTool: {exc}") from exc
+        return payload if isinstance(payload, list) else []
+
+    def _ensure_process(self) -> subprocess.Popen[bytes]:
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+        self._terminate()
+        try:
+            process = subprocess.Popen(
+                [self._executable, "-stay_open", "True", "-@", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except FileNotFoundError as exc:
+            raise ExternalToolError(_MISSING_MESSAGE) from exc
+        except OSError as exc:
+            raise ExternalToolError(f"Unable to start ExifTool: {exc}") from exc
+        assert process.stderr is not None
+        # Drain stderr continuously so a chatty run cannot fill the pipe and
+        # block ExifTool while we wait for its stdout marker.
+        threading.Thread(
+            target=self._drain_stderr,
+            args=(process.stderr,),
+            name="iphoto-exiftool-stderr",
+            daemon=True,
+        ).start()
+        self._process = process
+        return process
+
+    def _drain_stderr(self, stream: IO[bytes]) -> None:
+        for raw in iter(stream.readline, b""):
+            line = raw.decode("utf-8", errors="replace").strip()
+            if line:
+                self._stderr_tail.append(line)
+                LOGGER.debug("exiftool: %s", line)
+
+    def _terminate(self) -> None:
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+        if process.poll() is None:
+            process.kill()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:  # pragma: no cover - defensive
+            pass
+        for stream in (process.stdin, process.stdout):
+            if stream is not None:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+
+
+_SESSION: Optional[ExifToolSession] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> ExifToolSession:
+    """Return the process-wide :class:`ExifToolSession`, creating it on demand.
+
+    Raises
+    ------
+    ExternalToolError
+        Raised when the ``exiftool`` executable is not available on ``PATH``.
+    """
+
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            executable = shutil.which("exiftool")
+            if executable is None:
+                raise ExternalToolError(_MISSING_MESSAGE)
+            _SESSION = ExifToolSession(executable)
+        return _SESSION
+
+
+def shutdown_session() -> None:
+    """Stop the shared ExifTool process; a later request starts a new one."""
+
+    global _SESSION
+    with _SESSION_LOCK:
+        session, _SESSION = _SESSION, None
+    if session is not None:
+        session.close()
+
+
+atexit.register(shutdown_session)
+
+
+def iter_metadata_batches(
+    paths: List[Path], chunk_size: int = EXIFTOOL_CHUNK_SIZE
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield ExifTool payloads for *paths* one chunk of *chunk_size* files at a time.
+
+    Bounding each request keeps the argument stream and the JSON response small
+    regardless of album size, and lets callers consume results while later
+    chunks are still pending.
+    """
+
+    session = get_session()
+    for offset in range(0, len(paths), max(1, chunk_size)):
+        yield session.execute_json(paths[offset : offset + chunk_size])
 
 
 def get_metadata_batch(paths: List[Path]) -> List[Dict[str, Any]]:
-    """Return metadata for *paths* by launching a single ``exiftool`` process.
+    """Return metadata for *paths* using the shared ExifTool session.
 
-    The prior implementation spawned one external process per asset which was
-    both slow and prone to locale-related decoding errors on Windows.  Issuing a
-    single batch request avoids that overhead and lets us explicitly request
-    UTF-8 so ``exiftool`` output is decoded consistently across platforms.
+    Requests go to a persistent ``-stay_open`` process (see
+    :class:`ExifToolSession`) in chunks of :data:`EXIFTOOL_CHUNK_SIZE`, so
+    neither the per-call process start-up nor the command-line length grows
+    with the number of files.  UTF-8 is requested explicitly so output is
+    decoded consistently across platforms.
 
     Parameters
     ----------
@@ -28,67 +258,26 @@ def get_metadata_batch(paths: List[Path]) -> List[Dict[str, Any]]:
     Raises
     ------
     ExternalToolError
-        Raised when the ``exiftool`` executable is missing or when the command
-        exits with a non-zero status code.
+        Raised when the ``exiftool`` executable is missing or when the session
+        cannot complete a request even after a restart.
     """
 
-    executable = shutil.which("exiftool")
-    if executable is None:
-        raise ExternalToolError(
-            "exiftool executable not found. Install it from https://exiftool.org/ "
-            "and ensure it is available on PATH."
-        )
-
     if not paths:
+        # Preserve the historical behaviour of reporting a missing executable
+        # before checking the input.
+        get_session()
         return []
 
-    cmd = [
-        executable,
-        "-n",  # emit numeric GPS values instead of DMS strings
-        "-g1",  # keep group information (e.g. Composite, GPS) in the payload
-        "-json",
-        "-charset",
-        "UTF8",  # tell exiftool how to interpret incoming file paths
-        *[str(path) for path in paths],
-    ]
-
-    try:
-        # ``encoding`` forces Python to decode the JSON using UTF-8 even on
-        # locales that default to a more restrictive codec such as ``cp1252``.
-        # ``errors='replace'`` keeps the scan moving if unexpected byte
-        # sequences appear in the metadata.
-        process = subprocess.run(
-            cmd,
-            capture_output=True,
-            check=True,
-            encoding="utf-8",
-            errors="replace",
-        )
-    except FileNotFoundError as exc:
-        raise ExternalToolError(
-            "exiftool executable not found. Install it from https://exiftool.org/ "
-            "and ensure it is available on PATH."
-        ) from exc
-    except subprocess.CalledProcessError as exc:
-        stderr = exc.stderr.strip() if exc.stderr else "unknown error"
-        # ExifTool reports a successful batch run with summary lines such as
-        # ``"2 image files read"`` on stderr. Treat these runs as successful
-        # so long as JSON payload is present, otherwise propagate the real
-        # failure details to the caller.
-        if "image files read" in stderr.lower() and exc.stdout:
-            try:
-                return json.loads(exc.stdout)
-            except json.JSONDecodeError as json_exc:  # pragma: no cover - defensive
-                raise ExternalToolError(
-                    "Failed to parse JSON output from ExifTool: "
-                    f"{json_exc}"
-                ) from json_exc
-        raise ExternalToolError(f"ExifTool failed with an error: {stderr}") from exc
-
-    try:
-        return json.loads(process.stdout)
-    except json.JSONDecodeError as exc:
-        raise ExternalToolError(f"Failed to parse JSON output from ExifTool: {exc}") from exc
+    payloads: List[Dict[str, Any]] = []
+    for chunk in iter_metadata_batches(paths):
+        payloads.extend(chunk)
+    return payloads
 
 
-__all__ = ["get_metadata_batch"]
+__all__ = [
+    "ExifToolSession",
+    "get_metadata_batch",
+    "get_session",
+    "iter_metadata_batches",
+    "shutdown_session",
+]
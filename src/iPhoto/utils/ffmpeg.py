@@ -6,9 +6,11 @@ import json
 import os
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional, Sequence
 
+from ..config import FFPROBE_WORKERS
 from ..errors import ExternalToolError
 
 try:  # pragma: no cover - optional dependency detection
@@ -17,6 +19,10 @@ except Exception:  # pragma: no cover - OpenCV not available or broken
     cv2 = None  # type: ignore[assignment]
 
 _FFMPEG_LOG_LEVEL = "error"
+# Bounds the number of concurrent ffprobe processes across all callers.
+_PROBE_SLOTS = threading.BoundedSemaphore(FFPROBE_WORKERS)
+_PROBE_COUNT_LOCK = threading.Lock()
+_PROBE_COUNT = 0
 
 
 def _run_command(command: Sequence[str]) -> subprocess.CompletedProcess[bytes]:
@@ -248,12 +254,20 @@ def _extract_with_opencv(
     except Exception:
         return None
 
+
+def probe_count() -> int:
+    """Return how many ffprobe processes this process has launched so far."""
+
+    return _PROBE_COUNT
+
+
 def probe_media(source: Path) -> Dict[str, Any]:
     """Return ffprobe metadata for *source*.
 
     The JSON structure mirrors ffprobe's ``show_format`` and ``show_streams``
     output. ``ExternalToolError`` is raised when the toolchain is unavailable or
-    returns an error.
+    returns an error.  Calls may come from many threads at once; at most
+    :data:`FFPROBE_WORKERS` ffprobe processes run concurrently.
     """
 
     command = [
@@ -268,7 +282,11 @@ def probe_media(source: Path) -> Dict[str, Any]:
         str(source),
     ]
 
-    process = _run_command(command)
+    global _PROBE_COUNT
+    with _PROBE_COUNT_LOCK:
+        _PROBE_COUNT += 1
+    with _PROBE_SLOTS:
+        process = _run_command(command)
     if process.returncode != 0 or not process.stdout:
         stderr = process.stderr.decode("utf-8", "ignore").strip()
         raise ExternalToolError(
@@ -2,74 +2,395 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import Dict, Optional
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import reverse_geocoder  # type: ignore[import]
+from scipy.spatial import cKDTree  # type: ignore[import]
 
+from ..config import GEOCODE_CACHE_SIZE, GEOCODE_GRID_DEGREES, WORK_DIR_NAME
+from .jsonio import atomic_write_text, dumps_line, loads
 from .logging import get_logger
 
+LOGGER = get_logger()
 
-@lru_cache(maxsize=1)
-def _geocoder() -> "reverse_geocoder.RGeocoder":
-    """Return a cached reverse geocoder instance."""
+_CACHE_FILE_NAME = "geocode.cache"
+_CACHE_VERSION = 1
+_TREE_CACHE_VERSION = 1
+# Place attributes kept from the GeoNames table bundled with reverse_geocoder.
+_PLACE_FIELDS = ("name", "admin1", "admin2", "cc")
 
-    return reverse_geocoder.RGeocoder(mode=1, verbose=False)
+Cell = Tuple[int, int]
 
 
-def resolve_location_name(gps: Optional[Dict[str, float]]) -> Optional[str]:
-    """Return a human readable place name for *gps* coordinates.
+def default_geocoder_cache_path() -> Path:
+    """Return the per-user file caching the geocoder's city table."""
 
-    Parameters
-    ----------
-    gps:
-        Mapping containing ``lat`` and ``lon`` keys. When either value is
-        missing or the lookup fails the function returns ``None``.
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA")
+        root = Path(base) if base else Path.home() / "AppData" / "Local"
+        return root / "iPhoto" / "Cache" / "geocoder.npz"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "iPhoto" / "geocoder.npz"
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "iPhoto" / "geocoder.npz"
+
+
+class _CityIndex:
+    """Nearest-city lookup over the GeoNames table shipped with reverse_geocoder.
+
+    Building ``reverse_geocoder.RGeocoder`` parses a large CSV on every start;
+    the coordinates and place names are therefore saved to a compact ``.npz``
+    file and later starts only rebuild the (fast) KD-tree from that array.
+    """
+
+    def __init__(self, coordinates: "np.ndarray", places: Dict[str, List[str]]) -> None:
+        self._tree = cKDTree(coordinates)
+        self._places = places
+
+    @classmethod
+    def build(cls) -> "_CityIndex":
+        geocoder = reverse_geocoder.RGeocoder(mode=1, verbose=False)
+        places = {
+            field: [str(location.get(field, "")) for location in geocoder.locations]
+            for field in _PLACE_FIELDS
+        }
+        return cls(np.asarray(geocoder.tree.data, dtype=np.float64), places)
+
+    @classmethod
+    def load(cls, path: Path, source: str) -> Optional["_CityIndex"]:
+        try:
+            with np.load(path, allow_pickle=False) as payload:
+                if int(payload["version"]) != _TREE_CACHE_VERSION:
+                    return None
+                if str(payload["source"]) != source:
+                    return None
+                coordinates = payload["coordinates"]
+                places = {
+                    field: bytes(payload[field]).decode("utf-8").split("\0")
+                    for field in _PLACE_FIELDS
+                }
+        except (OSError, KeyError, ValueError) as exc:
+            LOGGER.debug("Ignoring geocoder cache %s: %s", path, exc)
+            return None
+        return cls(coordinates, places)
+
+    def save(self, path: Path, source: str) -> None:
+        blobs = {
+            field: np.frombuffer("\0".join(values).encode("utf-8"), dtype=np.uint8)
+            for field, values in self._places.items()
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        try:
+            np.savez(
+                tmp_path,
+                version=np.int64(_TREE_CACHE_VERSION),
+                source=np.str_(source),
+                coordinates=self._tree.data,
+                **blobs,
+            )
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def query(self, coordinates: List[Tuple[float, float]]) -> List[Dict[str, str]]:
+        _, indices = self._tree.query(coordinates, k=1)
+        return [
+            {field: self._places[field][index] for field in _PLACE_FIELDS}
+            for index in np.atleast_1d(indices).tolist()
+        ]
+
+
+def _source_signature() -> str:
+    """Identify the bundled city table so a stale tree cache is rebuilt."""
+
+    source = Path(reverse_geocoder.rel_path(reverse_geocoder.RG_FILE))
+    try:
+        stat = source.stat()
+    except OSError:
+        return str(source)
+    return f"{source}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class _GeocoderLoader:
+    """Build the :class:`_CityIndex` once, optionally on a background thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._index: Optional[_CityIndex] = None
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def start(self, on_ready: Optional[Callable[[], None]] = None) -> bool:
+        with self._lock:
+            if self._ready.is_set():
+                return True
+            if on_ready is not None:
+                self._callbacks.append(on_ready)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._build, name="iphoto-geocoder", daemon=True
+                )
+                self._thread.start()
+        return False
+
+    def get(self) -> _CityIndex:
+        self.start()
+        self._ready.wait()
+        if self._index is None:
+            raise RuntimeError("reverse geocoder failed to load")
+        return self._index
+
+    def _build(self) -> None:
+        cache_path = default_geocoder_cache_path()
+        index: Optional[_CityIndex] = None
+        try:
+            source = _source_signature()
+            index = _CityIndex.load(cache_path, source) if cache_path.exists() else None
+            if index is None:
+                index = _CityIndex.build()
+                try:
+                    index.save(cache_path, source)
+                except OSError as exc:
+                    LOGGER.warning("Could not write geocoder cache %s: %s", cache_path, exc)
+        except Exception as exc:  # pragma: no cover - depends on the installed data
+            LOGGER.warning("Reverse geocoder failed to load: %s", exc)
+        with self._lock:
+            self._index = index
+            self._ready.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as exc:  # pragma: no cover - defensive guard
+                LOGGER.debug("Geocoder ready callback failed: %s", exc)
+
+
+_LOADER = _GeocoderLoader()
+
+
+def warm_up_geocoder(on_ready: Optional[Callable[[], None]] = None) -> bool:
+    """Start loading the reverse geocoder on a background thread.
+
+    Returns ``True`` when the geocoder is already available.  Otherwise the
+    load is started (once per process) and *on_ready* is called from the
+    loading thread when it completes; GUI callers should forward it through a
+    queued signal.
+    """
+
+    return _LOADER.start(on_ready)
+
+
+def geocoder_ready() -> bool:
+    """Return ``True`` once the reverse geocoder has finished loading."""
+
+    return _LOADER.ready
+
+
+def _geocoder() -> _CityIndex:
+    """Return the loaded geocoder, waiting for an in-flight warm-up."""
+
+    return _LOADER.get()
+
+
+class _NameCache:
+    """Thread-safe LRU mapping grid cells to resolved place names.
+
+    ``None`` is a valid cached value: it records a cell the geocoder has no
+    name for, so such cells are not queried again either.
     """
 
-    if not gps:
+    def __init__(self, capacity: int) -> None:
+        self._capacity = max(1, capacity)
+        self._entries: "OrderedDict[Cell, Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, cell: Cell) -> Tuple[bool, Optional[str]]:
+        with self._lock:
+            if cell not in self._entries:
+                return False, None
+            self._entries.move_to_end(cell)
+            return True, self._entries[cell]
+
+    def store(self, cell: Cell, name: Optional[str]) -> None:
+        with self._lock:
+            self._entries[cell] = name
+            self._entries.move_to_end(cell)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_NAMES = _NameCache(GEOCODE_CACHE_SIZE)
+
+
+def _grid_cell(gps: Optional[Dict[str, float]]) -> Optional[Cell]:
+    """Return the grid cell holding *gps*, or ``None`` for unusable input."""
+
+    if not isinstance(gps, dict):
         return None
     latitude = gps.get("lat")
     longitude = gps.get("lon")
     if not isinstance(latitude, (int, float)) or not isinstance(longitude, (int, float)):
         return None
-
-    try:
-        result = _geocoder().query([(latitude, longitude)])
-    except Exception:
+    if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
         return None
+    return round(latitude / GEOCODE_GRID_DEGREES), round(longitude / GEOCODE_GRID_DEGREES)
+
+
+def _cell_key(cell: Cell) -> str:
+    return f"{cell[0]},{cell[1]}"
 
-    record: Optional[Dict[str, str]] = None
-    def _to_text(value: object) -> str:
-        if isinstance(value, bytes):
-            return value.decode("utf-8", errors="ignore")
-        return str(value)
-
-    if isinstance(result, dict):
-        record = {key: _to_text(value) for key, value in result.items() if isinstance(key, str)}
-    elif isinstance(result, list) and result:
-        first = result[0]
-        if isinstance(first, dict):
-            record = {
-                key: _to_text(value)
-                for key, value in first.items()
-                if isinstance(key, str)
-            }
-
-    if not record:
-        return None
 
+def _to_text(value: object) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="ignore")
+    return str(value)
+
+
+def _format_record(result: object) -> Optional[str]:
+    """Return the display name for a single geocoder *result* record."""
+
+    if not isinstance(result, dict):
+        return None
+    record = {key: _to_text(value) for key, value in result.items() if isinstance(key, str)}
     city = str(record.get("name", "")).strip()
     admin = str(record.get("admin2") or record.get("admin1") or "").strip()
 
     components = [component for component in (city, admin) if component]
     if not components:
         return None
-    location_name = " — ".join(components)
     # Use an en dash to match macOS Photos' layout conventions.
-    get_logger().debug("Resolved location display name: %s", location_name)
-    return location_name
+    return " — ".join(components)
+
+
+def _query_cells(cells: List[Cell]) -> Dict[Cell, Optional[str]]:
+    """Resolve every cell in *cells* with a single geocoder query."""
+
+    coordinates = [
+        (cell[0] * GEOCODE_GRID_DEGREES, cell[1] * GEOCODE_GRID_DEGREES) for cell in cells
+    ]
+    try:
+        results = _geocoder().query(coordinates)
+    except Exception as exc:
+        LOGGER.debug("Reverse geocoding of %d locations failed: %s", len(cells), exc)
+        return {}
+    if isinstance(results, dict):
+        results = [results]
+    if not isinstance(results, list) or len(results) != len(cells):
+        return {}
+    return {cell: _format_record(result) for cell, result in zip(cells, results)}
+
+
+class _AlbumCache:
+    """Place names resolved for an album, persisted in ``.iPhoto/geocode.cache``."""
+
+    def __init__(self, album_root: Path) -> None:
+        self.path = album_root / WORK_DIR_NAME / _CACHE_FILE_NAME
+        self.names: Dict[str, Optional[str]] = {}
+        try:
+            payload = loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(payload, dict)
+            and payload.get("version") == _CACHE_VERSION
+            and payload.get("grid") == GEOCODE_GRID_DEGREES
+            and isinstance(payload.get("names"), dict)
+        ):
+            self.names = payload["names"]
+
+    def save(self) -> None:
+        payload = {"version": _CACHE_VERSION, "grid": GEOCODE_GRID_DEGREES, "names": self.names}
+        try:
+            atomic_write_text(self.path, dumps_line(payload))
+        except OSError as exc:
+            LOGGER.warning("Could not write geocode cache %s: %s", self.path, exc)
+
+
+def resolve_location_names(
+    gps_values: Iterable[Optional[Dict[str, float]]],
+    *,
+    album_root: Optional[Path] = None,
+    wait: bool = True,
+) -> List[Optional[str]]:
+    """Return the place name for each entry of *gps_values*, in order.
+
+    Coordinates are snapped to a grid of :data:`GEOCODE_GRID_DEGREES` and each
+    cell is resolved once: from the in-memory LRU, then from the album's
+    ``geocode.cache`` when *album_root* is given, and finally with one batched
+    geocoder query covering every remaining cell.  Newly resolved cells are
+    written back to the album cache.  Entries without usable ``lat``/``lon``
+    values, or that the geocoder cannot name, resolve to ``None``.
+
+    With *wait* disabled, cells that would need the geocoder while it is still
+    warming up (see :func:`warm_up_geocoder`) resolve to ``None`` instead of
+    blocking; they are not cached, so a later call resolves them.
+    """
+
+    cells = [_grid_cell(gps) for gps in gps_values]
+    resolved: Dict[Cell, Optional[str]] = {}
+    for cell in cells:
+        if cell is None or cell in resolved:
+            continue
+        found, name = _NAMES.lookup(cell)
+        if found:
+            resolved[cell] = name
+    pending = {cell for cell in cells if cell is not None and cell not in resolved}
+
+    album_cache = _AlbumCache(album_root) if album_root is not None else None
+    if album_cache is not None and pending:
+        for cell in list(pending):
+            key = _cell_key(cell)
+            if key in album_cache.names:
+                name = album_cache.names[key]
+                resolved[cell] = name
+                _NAMES.store(cell, name)
+                pending.discard(cell)
+
+    if pending and not wait and not warm_up_geocoder():
+        pending = set()
+
+    if pending:
+        queried = _query_cells(sorted(pending))
+        for cell, name in queried.items():
+            resolved[cell] = name
+            _NAMES.store(cell, name)
+        LOGGER.debug("Reverse geocoded %d locations in one batch", len(queried))
+        if album_cache is not None and queried:
+            album_cache.names.update({_cell_key(cell): name for cell, name in queried.items()})
+            album_cache.save()
+
+    return [resolved.get(cell) if cell is not None else None for cell in cells]
+
+
+def resolve_location_name(gps: Optional[Dict[str, float]]) -> Optional[str]:
+    """Return a human readable place name for *gps* coordinates.
+
+    Parameters
+    ----------
+    gps:
+        Mapping containing ``lat`` and ``lon`` keys. When either value is
+        missing or the lookup fails the function returns ``None``.  Resolving
+        many coordinates should go through :func:`resolve_location_names`.
+    """
 
+    return resolve_location_names([gps])[0]
 
-__all__ = ["resolve_location_name"]
 
+__all__ = ["resolve_location_name", "resolve_location_names"]
@@ -3,9 +3,28 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Optional
 
 import xxhash
 
+from ..config import FINGERPRINT_BLOCK_SIZE
+
+
+def text_xxh3(*parts: str) -> str:
+    """Return the XXH3 64-bit hash of *parts*, joined with NUL separators.
+
+    Unlike the built-in :func:`hash`, the digest does not depend on
+    ``PYTHONHASHSEED``, so it is stable across processes and machines.
+    """
+
+    return xxhash.xxh3_64_hexdigest("\0".join(parts).encode("utf-8"))
+
+
+def bytes_xxh3(data: bytes) -> str:
+    """Return the XXH3 64-bit hash of *data* as a hex string."""
+
+    return xxhash.xxh3_64_hexdigest(data)
+
 
 def file_xxh3(path: Path, *, chunk_size: int = 1024 * 1024) -> str:
     """Return the XXH3 128-bit hash of *path*."""
@@ -18,3 +37,28 @@ def file_xxh3(path: Path, *, chunk_size: int = 1024 * 1024) -> str:
                 break
             hasher.update(chunk)
     return hasher.hexdigest()
+
+
+def file_fingerprint(
+    path: Path, *, size: Optional[int] = None, block_size: int = FINGERPRINT_BLOCK_SIZE
+) -> str:
+    """Return a fast XXH3 128-bit fingerprint of *path* built from sampled blocks.
+
+    The digest covers the file size followed by the first, middle and last
+    *block_size* bytes, so at most three blocks are read regardless of how large
+    the file is.  Files no larger than three blocks are hashed in full.  Pass the
+    already known *size* to avoid another ``stat`` call.
+    """
+
+    if size is None:
+        size = path.stat().st_size
+    hasher = xxhash.xxh3_128()
+    hasher.update(size.to_bytes(8, "little"))
+    with path.open("rb") as handle:
+        if size <= block_size * 3:
+            hasher.update(handle.read())
+        else:
+            for offset in (0, (size - block_size) // 2, size - block_size):
+                handle.seek(offset)
+                hasher.update(handle.read(block_size))
+    return hasher.hexdigest()
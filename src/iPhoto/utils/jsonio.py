@@ -5,21 +5,156 @@ from __future__ import annotations
 import json
 import os
 import time
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
 
 from ..errors import ManifestInvalidError
+from .backup import write_backup
+
+try:  # pragma: no cover - optional dependency detection
+    import orjson
+except Exception:  # pragma: no cover - orjson not installed or broken
+    orjson = None  # type: ignore[assignment]
+
+
+class JsonCodec:
+    """Encode and decode the JSON documents iPhoto keeps on disk.
+
+    Every codec produces the same layout: single-line records use sorted keys
+    and compact ``,``/``:`` separators, documents are indented by two spaces
+    with sorted keys, and non-ASCII text is written as UTF-8.  Files therefore
+    stay diff-friendly and identical in structure whichever codec wrote them;
+    only the spelling of some floats differs (``1e-05`` versus ``0.00001``).
+    Decoding errors are raised as :class:`json.JSONDecodeError`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        dumps_line: Callable[[Any], str],
+        dumps_document: Callable[[Any], str],
+        loads: Callable[[Any], Any],
+    ) -> None:
+        self.name = name
+        self.dumps_line = dumps_line
+        self.dumps_document = dumps_document
+        self.loads = loads
+
+
+def _stdlib_dumps_line(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def _stdlib_dumps_document(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+STDLIB_CODEC = JsonCodec(
+    "stdlib",
+    dumps_line=_stdlib_dumps_line,
+    dumps_document=_stdlib_dumps_document,
+    loads=json.loads,
+)
+
+ORJSON_CODEC: Optional[JsonCodec] = None
+if orjson is not None:
+    _ORJSON_LINE = orjson.OPT_SORT_KEYS
+    _ORJSON_DOCUMENT = orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+
+    def _orjson_dumps_line(value: Any) -> str:
+        try:
+            return orjson.dumps(value, option=_ORJSON_LINE).decode("utf-8")
+        except TypeError:
+            # Integers beyond 64 bits, non-string keys or other values orjson
+            # rejects still round-trip through the standard library.
+            return _stdlib_dumps_line(value)
+
+    def _orjson_dumps_document(value: Any) -> str:
+        try:
+            return orjson.dumps(value, option=_ORJSON_DOCUMENT).decode("utf-8")
+        except TypeError:
+            return _stdlib_dumps_document(value)
+
+    def _orjson_loads(data: Any) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the ``NaN``/``Infinity`` literals the standard
+            # library writes for non-finite floats.
+            return json.loads(data)
+
+    ORJSON_CODEC = JsonCodec(
+        "orjson",
+        dumps_line=_orjson_dumps_line,
+        dumps_document=_orjson_dumps_document,
+        loads=_orjson_loads,
+    )
+
+_CODECS = {codec.name: codec for codec in (STDLIB_CODEC, ORJSON_CODEC) if codec is not None}
+_ACTIVE: JsonCodec = ORJSON_CODEC or STDLIB_CODEC
+
+
+def available_codecs() -> list[str]:
+    """Return the names of the JSON codecs usable in this environment."""
+
+    return sorted(_CODECS)
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """Return the codec named *name*, or the active one (orjson when installed).
+
+    Raises
+    ------
+    ValueError
+        Raised when *name* is not one of :func:`available_codecs`.
+    """
+
+    if name is None:
+        return _ACTIVE
+    try:
+        return _CODECS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON codec {name!r}; expected one of {available_codecs()}"
+        ) from None
+
+
+def set_codec(name: str) -> JsonCodec:
+    """Select the codec named *name* for all JSON helpers and return it.
+
+    Raises
+    ------
+    ValueError
+        Raised when *name* is not one of :func:`available_codecs`.
+    """
+
+    global _ACTIVE
+    _ACTIVE = get_codec(name)
+    return _ACTIVE
+
+
+def dumps_line(value: Any) -> str:
+    """Serialise *value* as a single-line record with sorted keys."""
+
+    return _ACTIVE.dumps_line(value)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse the JSON text or UTF-8 bytes in *data*."""
+
+    return _ACTIVE.loads(data)
 
 
 def read_json(path: Path) -> dict[str, Any]:
     """Read JSON from *path* and return a dictionary."""
 
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        data = path.read_bytes()
     except FileNotFoundError as exc:
         raise ManifestInvalidError(f"JSON file not found: {path}") from exc
+    try:
+        return loads(data)
     except json.JSONDecodeError as exc:
         raise ManifestInvalidError(f"Invalid JSON data in {path}") from exc
 
@@ -61,19 +196,14 @@ def atomic_write_text(path: Path, data: str) -> None:
             raise last_exc
 
 
-def _write_backup(path: Path, backup_dir: Path) -> None:
-    if not path.exists():
-        return
-    backup_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    backup_path = backup_dir / f"{timestamp}{path.suffix}"
-    backup_path.write_bytes(path.read_bytes())
-
-
 def write_json(path: Path, data: dict[str, Any], *, backup_dir: Path | None = None) -> None:
-    """Write *data* into *path* atomically with optional backups."""
+    """Write *data* into *path* atomically with optional backups.
+
+    With *backup_dir*, the previous contents are kept as a versioned backup
+    (see :func:`~iPhoto.utils.backup.write_backup`) unless they are unchanged.
+    """
 
+    payload = _ACTIVE.dumps_document(data)
     if backup_dir is not None:
-        _write_backup(path, backup_dir)
-    payload = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True)
+        write_backup(path, backup_dir, replacement=payload.encode("utf-8"))
     atomic_write_text(path, payload)
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import fnmatch
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Iterator
+from typing import Iterable, Iterator, Optional, Pattern, Tuple
 
 
 def _expand(pattern: str) -> Iterator[str]:
@@ -19,6 +21,69 @@ def _expand(pattern: str) -> Iterator[str]:
         yield from _expand(prefix + option + suffix)
 
 
+def _variants(globs: Iterable[str]) -> Iterator[str]:
+    """Yield every brace expansion of *globs*, plus its ``**/``-less form."""
+
+    for pattern in globs:
+        for expanded in _expand(pattern):
+            yield expanded
+            if expanded.startswith("**/"):
+                yield expanded[3:]
+
+
+def _compile(patterns: Iterable[str]) -> Optional[Pattern[str]]:
+    translated = [fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns]
+    if not translated:
+        return None
+    return re.compile("|".join(f"(?:{item})" for item in translated))
+
+
+class GlobFilter:
+    """Include/exclude globs compiled once into single regular expressions.
+
+    Matching follows :func:`fnmatch.fnmatch` on relative POSIX paths exactly as
+    :func:`is_excluded` and :func:`should_include` always did (``*`` also
+    matches ``/`` and a leading ``**/`` may match nothing), but brace patterns
+    are expanded and translated once instead of on every call.
+    """
+
+    def __init__(self, include_globs: Iterable[str], exclude_globs: Iterable[str]) -> None:
+        exclude_variants = list(_variants(exclude_globs))
+        self._include = _compile(_variants(include_globs))
+        self._exclude = _compile(exclude_variants)
+        # A pattern ending in ``*`` that matches ``"<dir>/"`` matches every
+        # path below ``<dir>`` as well, so such directories can be skipped
+        # without visiting their contents.
+        self._prune = _compile(pattern for pattern in exclude_variants if pattern.endswith("*"))
+
+    def excludes(self, rel: str) -> bool:
+        """Return ``True`` when the relative POSIX path *rel* is excluded."""
+
+        return self._exclude is not None and self._exclude.match(os.path.normcase(rel)) is not None
+
+    def includes(self, rel: str) -> bool:
+        """Return ``True`` when *rel* matches an include glob and is not excluded."""
+
+        if self.excludes(rel):
+            return False
+        return self._include is not None and self._include.match(os.path.normcase(rel)) is not None
+
+    def prunes(self, dir_rel: str) -> bool:
+        """Return ``True`` when every path inside directory *dir_rel* is excluded."""
+
+        return (
+            self._prune is not None
+            and self._prune.match(os.path.normcase(f"{dir_rel}/")) is not None
+        )
+
+
+@lru_cache(maxsize=32)
+def compile_globs(include_globs: Tuple[str, ...], exclude_globs: Tuple[str, ...]) -> GlobFilter:
+    """Return a cached :class:`GlobFilter` for the given glob tuples."""
+
+    return GlobFilter(include_globs, exclude_globs)
+
+
 def is_excluded(path: Path, globs: Iterable[str], *, root: Path) -> bool:
     """Return ``True`` if *path* should be excluded based on *globs*.
 
@@ -27,28 +92,16 @@ def is_excluded(path: Path, globs: Iterable[str], *, root: Path) -> bool:
     """
 
     rel = path.relative_to(root).as_posix()
-    for pattern in globs:
-        for expanded in _expand(pattern):
-            if fnmatch.fnmatch(rel, expanded):
-                return True
-            if expanded.startswith("**/") and fnmatch.fnmatch(rel, expanded[3:]):
-                return True
-    return False
+    return compile_globs((), tuple(globs)).excludes(rel)
 
 
-def should_include(path: Path, include_globs: Iterable[str], exclude_globs: Iterable[str], *, root: Path) -> bool:
+def should_include(
+    path: Path, include_globs: Iterable[str], exclude_globs: Iterable[str], *, root: Path
+) -> bool:
     """Return ``True`` if *path* should be scanned."""
 
-    if is_excluded(path, exclude_globs, root=root):
-        return False
     rel = path.relative_to(root).as_posix()
-    for pattern in include_globs:
-        for expanded in _expand(pattern):
-            if fnmatch.fnmatch(rel, expanded):
-                return True
-            if expanded.startswith("**/") and fnmatch.fnmatch(rel, expanded[3:]):
-                return True
-    return False
+    return compile_globs(tuple(include_globs), tuple(exclude_globs)).includes(rel)
 
 
 def ensure_work_dir(root: Path, name: str = ".iPhoto") -> Path:
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PIL")
+
+from iPhotos.src.iPhoto.bench import bench_scan, generate_synthetic_album
+from iPhotos.src.iPhoto.cache.index_store import IndexStore
+
+
+def test_synthetic_album_is_reproducible(tmp_path: Path) -> None:
+    first = generate_synthetic_album(tmp_path / "a", 6, seed=7)
+    second = generate_synthetic_album(tmp_path / "b", 6, seed=7)
+
+    assert [path.name for path in first] == [
+        "IMG_00000.JPG",
+        "SCR_00000.PNG",
+        "IMG_00000.MOV",
+        "IMG_00001.JPG",
+        "SCR_00001.PNG",
+        "IMG_00001.MOV",
+    ]
+    for left, right in zip(first, second):
+        assert left.read_bytes() == right.read_bytes()
+        assert left.stat().st_mtime == right.stat().st_mtime
+
+
+def test_bench_scan_reports_stage_breakdown(tmp_path: Path) -> None:
+    generate_synthetic_album(tmp_path, 9)
+
+    stats = bench_scan(tmp_path, workers=2)
+
+    assert stats.files == 9
+    assert stats.bytes == sum(path.stat().st_size for path in tmp_path.glob("batch_*/*"))
+    assert {"gather", "hash", "image_meta", "video_meta", "write"} <= set(stats.stage_seconds)
+    assert stats.counts["exiftool_batches"] == 1
+    assert len(list(IndexStore(tmp_path).read_all())) == 9
+    payload = json.loads(json.dumps(stats.as_dict()))
+    assert payload["files"] == 9 and payload["files_per_second"] > 0
+
+
+def test_bench_json_codecs_round_trips_every_codec() -> None:
+    from iPhotos.src.iPhoto.bench import bench_json_codecs
+    from iPhotos.src.iPhoto.utils.jsonio import available_codecs
+
+    results = bench_json_codecs(60, seed=3)
+
+    assert set(results) == set(available_codecs())
+    sizes = {result["bytes"] for result in results.values()}
+    assert len(sizes) == 1
+    assert all(result["decode_seconds"] >= 0 for result in results.values())
+
+
+def test_bench_thumbnail_codecs_reports_every_codec() -> None:
+    pytest.importorskip(
+        "iPhotos.src.iPhoto.gui.utils.thumbnail_codec",
+        reason="Qt is required for thumbnail encoding",
+        exc_type=ImportError,
+    )
+    from iPhotos.src.iPhoto.bench import bench_thumbnail_codecs
+    from iPhotos.src.iPhoto.config import THUMBNAIL_CODECS
+
+    results = bench_thumbnail_codecs(4, size=64, seed=1)
+
+    assert set(results) == set(THUMBNAIL_CODECS)
+    assert all(result["bytes"] > 0 for result in results.values())
+    assert results["jpeg"]["bytes"] < results["png"]["bytes"]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from iPhotos.src.iPhoto.config import WORK_DIR_NAME
+from iPhotos.src.iPhoto.utils import geocoding
+
+
+class _FakeGeocoder:
+    def __init__(self) -> None:
+        self.queries: list[list[tuple[float, float]]] = []
+
+    def query(self, coordinates):
+        self.queries.append(list(coordinates))
+        return [
+            {"name": f"City {round(lat)}", "admin1": "Region", "admin2": ""}
+            for lat, _lon in coordinates
+        ]
+
+
+@pytest.fixture()
+def fake_geocoder(monkeypatch: pytest.MonkeyPatch) -> _FakeGeocoder:
+    fake = _FakeGeocoder()
+    monkeypatch.setattr(geocoding, "_geocoder", lambda: fake)
+    geocoding._NAMES.clear()
+    yield fake
+    geocoding._NAMES.clear()
+
+
+def test_names_resolve_in_one_batch_per_grid_cell(fake_geocoder: _FakeGeocoder) -> None:
+    gps_values = [
+        {"lat": 10.0, "lon": 20.0},
+        {"lat": 10.001, "lon": 20.001},  # same grid cell as the first entry
+        None,
+        {"lat": 40.0, "lon": -3.0},
+        {"lat": "bad", "lon": 1.0},
+    ]
+
+    names = geocoding.resolve_location_names(gps_values)
+
+    assert names == ["City 10 — Region", "City 10 — Region", None, "City 40 — Region", None]
+    assert len(fake_geocoder.queries) == 1
+    assert len(fake_geocoder.queries[0]) == 2
+
+    assert geocoding.resolve_location_name({"lat": 40.0, "lon": -3.0}) == "City 40 — Region"
+    assert len(fake_geocoder.queries) == 1
+
+
+def test_album_cache_skips_the_geocoder_on_reload(
+    tmp_path: Path, fake_geocoder: _FakeGeocoder
+) -> None:
+    gps_values = [{"lat": 51.5, "lon": -0.12}, {"lat": -33.9, "lon": 151.2}]
+
+    first = geocoding.resolve_location_names(gps_values, album_root=tmp_path)
+    assert (tmp_path / WORK_DIR_NAME / "geocode.cache").exists()
+    assert len(fake_geocoder.queries) == 1
+
+    geocoding._NAMES.clear()
+    second = geocoding.resolve_location_names(gps_values, album_root=tmp_path)
+
+    assert second == first
+    assert len(fake_geocoder.queries) == 1
+
+
+def test_warm_up_runs_in_background_and_caches_the_city_table(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+
+    import numpy as np
+
+    cache_path = tmp_path / "geocoder.npz"
+    monkeypatch.setattr(geocoding, "default_geocoder_cache_path", lambda: cache_path)
+    monkeypatch.setattr(geocoding, "_source_signature", lambda: "test-source")
+    release = threading.Event()
+    builds: list[int] = []
+
+    def _build() -> geocoding._CityIndex:
+        release.wait(5)
+        builds.append(1)
+        places = {
+            "name": ["Oslo", "Lima"],
+            "admin1": ["Oslo", "Lima"],
+            "admin2": ["", ""],
+            "cc": ["NO", "PE"],
+        }
+        return geocoding._CityIndex(np.array([[59.9, 10.7], [-12.0, -77.0]]), places)
+
+    monkeypatch.setattr(geocoding._CityIndex, "build", staticmethod(_build))
+    loader = geocoding._GeocoderLoader()
+    monkeypatch.setattr(geocoding, "_LOADER", loader)
+    geocoding._NAMES.clear()
+
+    ready = threading.Event()
+    assert geocoding.warm_up_geocoder(ready.set) is False
+    gps = [{"lat": 59.91, "lon": 10.75}]
+    assert geocoding.resolve_location_names(gps, wait=False) == [None]
+
+    release.set()
+    assert ready.wait(5)
+    assert geocoding.geocoder_ready()
+    assert geocoding.resolve_location_names(gps, wait=False) == ["Oslo — Oslo"]
+    assert cache_path.exists()
+
+    reloaded = geocoding._CityIndex.load(cache_path, "test-source")
+    assert reloaded is not None
+    assert reloaded.query([(-12.1, -77.1)])[0]["name"] == "Lima"
+    assert geocoding._CityIndex.load(cache_path, "other-source") is None
+    assert builds == [1]
+    geocoding._NAMES.clear()
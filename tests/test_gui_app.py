@@ -31,6 +31,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from iPhotos.src.iPhoto.cache.thumbnail_store import ThumbnailStore
 from iPhotos.src.iPhoto.gui.facade import AppFacade
 from iPhotos.src.iPhoto.library.manager import LibraryManager
 from iPhotos.src.iPhoto.models.album import Album
@@ -747,14 +748,14 @@ def test_thumbnail_job_seek_targets_clamp(tmp_path: Path, qapp: QApplication) ->
     dummy_loader = cast(Any, object())
     video_path = tmp_path / "clip.MOV"
     video_path.touch()
-    cache_path = tmp_path / "cache.png"
+    store = ThumbnailStore(tmp_path)
     job = ThumbnailJob(
         dummy_loader,
         "clip.MOV",
         video_path,
         QSize(192, 192),
         1,
-        cache_path,
+        store,
         is_image=False,
         is_video=True,
         still_image_time=0.2,
@@ -769,14 +770,14 @@ def test_thumbnail_job_seek_targets_without_hint(tmp_path: Path, qapp: QApplicat
     dummy_loader = cast(Any, object())
     video_path = tmp_path / "clip.MOV"
     video_path.touch()
-    cache_path = tmp_path / "cache.png"
+    store = ThumbnailStore(tmp_path)
     job = ThumbnailJob(
         dummy_loader,
         "clip.MOV",
         video_path,
         QSize(192, 192),
         1,
-        cache_path,
+        store,
         is_image=False,
         is_video=True,
         still_image_time=None,
@@ -791,7 +792,7 @@ def test_thumbnail_job_seek_targets_without_hint(tmp_path: Path, qapp: QApplicat
         video_path,
         QSize(192, 192),
         1,
-        cache_path,
+        store,
         is_image=False,
         is_video=True,
         still_image_time=None,
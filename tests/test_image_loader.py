@@ -0,0 +1,82 @@
+import io
+import os
+import struct
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6", reason="PySide6 is required for image tests", exc_type=ImportError)
+image_loader = pytest.importorskip(
+    "iPhotos.src.iPhoto.gui.utils.image_loader",
+    reason="Qt GUI modules unavailable",
+    exc_type=ImportError,
+)
+Image = pytest.importorskip("PIL.Image")
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QColor, QGuiApplication
+
+
+@pytest.fixture(scope="module")
+def qapp() -> QGuiApplication:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QGuiApplication.instance()
+    if app is None:
+        app = QGuiApplication([])
+    yield app
+
+
+def _exif_with_thumbnail(thumbnail: bytes, orientation: int) -> bytes:
+    """Return an EXIF block holding *orientation* and an IFD1 JPEG thumbnail."""
+
+    ifd0 = struct.pack("<H", 1) + struct.pack("<HHII", 0x0112, 3, 1, orientation)
+    ifd1_offset = 8 + len(ifd0) + 4
+    data_offset = ifd1_offset + 2 + 2 * 12 + 4
+    ifd1 = struct.pack("<H", 2)
+    ifd1 += struct.pack("<HHII", 0x0201, 4, 1, data_offset)
+    ifd1 += struct.pack("<HHII", 0x0202, 4, 1, len(thumbnail))
+    tiff = b"II*\x00" + struct.pack("<I", 8) + ifd0 + struct.pack("<I", ifd1_offset)
+    return b"Exif\x00\x00" + tiff + ifd1 + struct.pack("<I", 0) + thumbnail
+
+
+def _camera_jpeg(path: Path, orientation: int = 1) -> None:
+    thumbnail = io.BytesIO()
+    Image.new("RGB", (256, 192), "blue").save(thumbnail, "JPEG")
+    exif = _exif_with_thumbnail(thumbnail.getvalue(), orientation)
+    Image.new("RGB", (2048, 1536), "red").save(path, "JPEG", exif=exif)
+
+
+def _colour(image) -> QColor:
+    return image.pixelColor(image.width() // 2, image.height() // 2)
+
+
+def test_thumbnail_uses_embedded_exif_preview(tmp_path: Path, qapp: QGuiApplication) -> None:
+    path = tmp_path / "IMG_0001.JPG"
+    _camera_jpeg(path, orientation=6)
+
+    image = image_loader.load_thumbnail_qimage(path, QSize(192, 192))
+
+    assert image is not None
+    assert (image.width(), image.height()) == (192, 256)
+    assert _colour(image).blue() > 200 and _colour(image).red() < 50
+
+
+def test_thumbnail_decodes_jpeg_at_reduced_scale(tmp_path: Path, qapp: QGuiApplication) -> None:
+    path = tmp_path / "IMG_0002.JPG"
+    _camera_jpeg(path)
+
+    # The embedded preview is too small for 512px, so the DCT-scaled decode runs.
+    image = image_loader.load_thumbnail_qimage(path, QSize(512, 512))
+
+    assert image is not None
+    assert (image.width(), image.height()) == (1024, 768)
+    assert _colour(image).red() > 200
+
+
+def test_thumbnail_falls_back_to_full_decode(tmp_path: Path, qapp: QGuiApplication) -> None:
+    path = tmp_path / "SCR_0001.PNG"
+    Image.new("RGB", (64, 48), "green").save(path)
+
+    image = image_loader.load_thumbnail_qimage(path, QSize(32, 32))
+
+    assert image is not None and not image.isNull()
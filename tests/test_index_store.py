@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from iPhotos.src.iPhoto.cache import index_store as index_store_module
+from iPhotos.src.iPhoto.cache.index_store import IndexStore
+from iPhotos.src.iPhoto.config import WORK_DIR_NAME
+
+
+def _rows() -> list[dict]:
+    return [
+        {"rel": "a.jpg", "id": "as_a", "dt": "2024-01-01T00:00:00Z"},
+        {"rel": "b.jpg", "id": "as_b", "gps": {"lat": 1.0, "lon": 2.0}},
+        {"rel": "c.mov", "id": "as_c", "content_id": "CID"},
+    ]
+
+
+def test_sqlite_backend_row_operations(tmp_path: Path) -> None:
+    store = IndexStore(tmp_path, backend="sqlite")
+    store.write_rows(_rows())
+    assert [row["rel"] for row in store.read_all()] == ["a.jpg", "b.jpg", "c.mov"]
+
+    store.upsert_row("a.jpg", {"rel": "a.jpg", "id": "as_a2"})
+    store.remove_rows(["c.mov"])
+    store.append_rows([{"rel": "d.jpg", "id": "as_d"}])
+
+    reopened = IndexStore(tmp_path)
+    assert reopened.backend_name == "sqlite"
+    rows = {row["rel"]: row for row in reopened.read_all()}
+    assert set(rows) == {"a.jpg", "b.jpg", "d.jpg"}
+    assert rows["a.jpg"]["id"] == "as_a2"
+    assert [row["rel"] for row in reopened.read_geotagged()] == ["b.jpg"]
+
+
+def test_sqlite_backend_imports_existing_jsonl(tmp_path: Path) -> None:
+    IndexStore(tmp_path).write_rows(_rows())
+    jsonl_path = tmp_path / WORK_DIR_NAME / "index.jsonl"
+    assert jsonl_path.exists()
+
+    store = IndexStore(tmp_path, backend="sqlite")
+    assert [row["rel"] for row in store.read_all()] == ["a.jpg", "b.jpg", "c.mov"]
+    assert not jsonl_path.exists()
+
+    exported = store.export_jsonl(tmp_path / "export.jsonl")
+    lines = exported.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["rel"] for line in lines] == ["a.jpg", "b.jpg", "c.mov"]
+
+
+def test_convert_round_trip(tmp_path: Path) -> None:
+    store = IndexStore(tmp_path)
+    store.write_rows(_rows())
+    store.convert("sqlite")
+    assert IndexStore(tmp_path).backend_name == "sqlite"
+    assert not (tmp_path / WORK_DIR_NAME / "index.jsonl").exists()
+    assert list(IndexStore(tmp_path).read_all()) == _rows()
+
+    store.convert("jsonl")
+    reopened = IndexStore(tmp_path)
+    assert reopened.backend_name == "jsonl"
+    assert not (tmp_path / WORK_DIR_NAME / "index.db").exists()
+    assert list(reopened.read_all()) == _rows()
+
+
+def test_jsonl_journal_records_deltas_without_rewriting_snapshot(tmp_path: Path) -> None:
+    store = IndexStore(tmp_path)
+    store.write_rows(_rows())
+    store.set_journal(True)
+    snapshot = tmp_path / WORK_DIR_NAME / "index.jsonl"
+    journal = tmp_path / WORK_DIR_NAME / "index.journal"
+    before = snapshot.read_bytes()
+
+    store.remove_rows(["b.jpg"])
+    store.append_rows([{"rel": "d.jpg", "id": "as_d"}])
+    store.upsert_row("a.jpg", {"rel": "a.jpg", "id": "as_a2"})
+
+    assert snapshot.read_bytes() == before
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 3
+    expected = [
+        {"rel": "a.jpg", "id": "as_a2"},
+        {"rel": "c.mov", "id": "as_c", "content_id": "CID"},
+        {"rel": "d.jpg", "id": "as_d"},
+    ]
+    assert list(store.read_all()) == expected
+
+    assert store.compact() is True
+    assert journal.read_bytes() == b""
+    assert list(IndexStore(tmp_path).read_all()) == expected
+    assert store.compact() is False
+
+    store.set_journal(False)
+    assert not journal.exists()
+    assert not IndexStore(tmp_path).journal_enabled
+
+
+def test_jsonl_journal_skips_torn_records(tmp_path: Path) -> None:
+    store = IndexStore(tmp_path)
+    store.write_rows(_rows())
+    store.set_journal(True)
+    journal = tmp_path / WORK_DIR_NAME / "index.journal"
+    journal.write_text('{"op": "remove", "rel": "a.jpg"}\n{"op": "rem', encoding="utf-8")
+
+    store.remove_rows(["c.mov"])
+
+    assert [row["rel"] for row in store.read_all()] == ["b.jpg"]
+
+
+def test_jsonl_journal_survives_interrupted_compaction(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = IndexStore(tmp_path)
+    store.write_rows(_rows())
+    store.set_journal(True)
+    store.append_rows([{"rel": "d.jpg", "id": "as_d"}])
+    store.remove_rows(["a.jpg"])
+    expected = list(store.read_all())
+
+    def _fail(*_args, **_kwargs) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(index_store_module, "atomic_write_text", _fail)
+    with pytest.raises(OSError):
+        store.compact()
+    monkeypatch.undo()
+
+    assert list(IndexStore(tmp_path).read_all()) == expected
+    exported = IndexStore(tmp_path).export_jsonl()
+    lines = exported.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == expected
+
+
+def test_snapshot_round_trips_rows_and_tracks_index_changes(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    from iPhotos.src.iPhoto.cache.index_snapshot import IndexSnapshot, snapshot_path
+
+    rows = _rows() + [
+        {"rel": "d.heic", "id": "as_d", "mime": "image/heic", "w": 4032, "bytes": 2**40},
+        {"rel": "e.mov", "id": "as_e", "dur": 2.5, "gps": {"lat": -1.5, "lon": 3.25}},
+        {"rel": "f.jpg", "id": "as_f", "w": "odd", "keywords": ["x", "y"]},
+    ]
+    store = IndexStore(tmp_path)
+    store.write_rows(rows)
+
+    snapshot = IndexSnapshot.load(tmp_path, min_bytes=0)
+    assert snapshot is not None
+    with snapshot:
+        assert snapshot.stamp == store.stamp()
+        decoded = [
+            {key: value for key, value in row.items() if value is not None}
+            for row in snapshot.iter_rows()
+        ]
+        assert decoded == rows
+        geotagged = snapshot.iter_rows(snapshot.geotagged_indices())
+        assert [row["rel"] for row in geotagged] == ["b.jpg", "e.mov"]
+
+    store.append_rows([{"rel": "g.jpg", "id": "as_g"}])
+    assert IndexSnapshot.open(snapshot_path(tmp_path), stamp=store.stamp()) is None
+    refreshed = IndexSnapshot.load(tmp_path, min_bytes=0)
+    assert refreshed is not None
+    with refreshed:
+        assert len(refreshed) == len(rows) + 1
+        assert refreshed.stamp == store.stamp()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from iPhotos.src.iPhoto.errors import ManifestInvalidError
+from iPhotos.src.iPhoto.utils import jsonio
+
+
+def _sample() -> dict:
+    return {
+        "rel": "Trip/IMG_0001.HEIC",
+        "title": "Café — día",
+        "gps": {"lon": 2.35, "lat": 48.85},
+        "w": 4032,
+        "dur": None,
+        "tags": ["a", "b"],
+        "empty": {},
+    }
+
+
+@pytest.mark.parametrize("name", jsonio.available_codecs())
+def test_codecs_share_the_stdlib_layout(name: str) -> None:
+    codec = jsonio.get_codec(name)
+    row = _sample()
+
+    line = codec.dumps_line(row)
+    assert line == json.dumps(row, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    assert codec.dumps_document(row) == json.dumps(
+        row, ensure_ascii=False, indent=2, sort_keys=True
+    )
+    assert codec.loads(line) == row
+    assert codec.loads(line.encode("utf-8")) == row
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads("{broken")
+
+
+def test_codec_selection_drives_read_and_write(tmp_path: Path) -> None:
+    previous = jsonio.get_codec()
+    try:
+        assert jsonio.set_codec("stdlib") is jsonio.STDLIB_CODEC
+        path = tmp_path / "doc.json"
+        jsonio.write_json(path, _sample())
+        assert jsonio.read_json(path) == _sample()
+        (tmp_path / "bad.json").write_text("{", encoding="utf-8")
+        with pytest.raises(ManifestInvalidError):
+            jsonio.read_json(tmp_path / "bad.json")
+        with pytest.raises(ValueError):
+            jsonio.set_codec("missing")
+    finally:
+        jsonio.set_codec(previous.name)
+
+
+def test_backups_skip_unchanged_content(tmp_path: Path) -> None:
+    from iPhotos.src.iPhoto.utils.backup import list_backups, read_backup
+
+    target = tmp_path / "links.json"
+    backups = tmp_path / "manifest.bak"
+    jsonio.write_json(target, {"v": 1}, backup_dir=backups)
+    assert not backups.exists()
+
+    first = target.read_bytes()
+    jsonio.write_json(target, {"v": 1}, backup_dir=backups)  # unchanged payload
+    jsonio.write_json(target, {"v": 2}, backup_dir=backups)
+    jsonio.write_json(target, {"v": 1}, backup_dir=backups)
+    jsonio.write_json(target, {"v": 2}, backup_dir=backups)
+
+    entries = list_backups(backups)[("links", ".json")]
+    assert len(entries) == 3  # v1, v2, v1: rapid writes get distinct names
+    assert len({entry.path for entry in entries}) == 3
+    assert read_backup(entries[-1].path) == first
+
+
+def test_prune_backups_applies_count_and_age(tmp_path: Path) -> None:
+    from datetime import datetime, timedelta, timezone
+
+    from iPhotos.src.iPhoto.utils.backup import list_backups, prune_backups
+
+    backups = tmp_path / "manifest.bak"
+    backups.mkdir()
+    now = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    for day in range(6):
+        stamp = (now - timedelta(days=day)).strftime("%Y%m%dT%H%M%S%fZ")
+        (backups / f"links.{stamp}.{day:016x}.json.gz").write_bytes(b"")
+    (backups / "20200101T000000Z.json").write_bytes(b"{}")
+    (backups / "notes.txt").write_bytes(b"keep me")
+
+    assert prune_backups(backups, keep=4, max_age_days=2.5, now=now) == 3
+    remaining = list_backups(backups)
+    assert [entry.created.day for entry in remaining[("links", ".json")]] == [1, 31, 30]
+    # The newest (only) legacy backup is kept, unrelated files are untouched.
+    assert len(remaining[("", ".json")]) == 1
+    assert (backups / "notes.txt").exists()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from iPhotos.src.iPhoto.cache import lock as lock_module
+from iPhotos.src.iPhoto.cache.lock import FileLock, lock_wait_stats
+from iPhotos.src.iPhoto.errors import LockTimeoutError
+
+pytestmark = pytest.mark.skipif(lock_module.fcntl is None, reason="flock is POSIX only")
+
+
+def _hold(lock: FileLock, entered: threading.Event, release: threading.Event) -> None:
+    with lock:
+        entered.set()
+        release.wait(5)
+
+
+def _times_out_elsewhere(lock: FileLock) -> bool:
+    """Return ``True`` when *lock* cannot be acquired from another thread."""
+
+    outcome: list[bool] = []
+
+    def _attempt() -> None:
+        try:
+            lock.acquire(timeout=0.2)
+        except LockTimeoutError:
+            outcome.append(True)
+        else:
+            lock.release()
+            outcome.append(False)
+
+    thread = threading.Thread(target=_attempt)
+    thread.start()
+    thread.join(5)
+    return outcome == [True]
+
+
+def test_shared_locks_coexist_and_exclusive_waits(tmp_path: Path) -> None:
+    release = threading.Event()
+    readers = [threading.Event(), threading.Event()]
+    threads = [
+        threading.Thread(
+            target=_hold, args=(FileLock(tmp_path, "t1", shared=True), entered, release)
+        )
+        for entered in readers
+    ]
+    for thread in threads:
+        thread.start()
+    assert all(entered.wait(5) for entered in readers)
+
+    with pytest.raises(LockTimeoutError):
+        FileLock(tmp_path, "t1").acquire(timeout=0.2)
+
+    writer = FileLock(tmp_path, "t1")
+    threading.Timer(0.2, release.set).start()
+    started = time.monotonic()
+    writer.acquire(timeout=5)
+    try:
+        assert time.monotonic() - started >= 0.15
+    finally:
+        writer.release()
+    for thread in threads:
+        thread.join(5)
+
+    stats = lock_wait_stats()["t1"]
+    assert stats.acquired == 3
+    assert stats.contended == 1
+    assert stats.max_wait_seconds >= 0.15
+
+
+def test_lock_is_reentrant_within_a_thread(tmp_path: Path) -> None:
+    with FileLock(tmp_path, "t2"):
+        with FileLock(tmp_path, "t2"), FileLock(tmp_path, "t2", shared=True):
+            pass
+        assert _times_out_elsewhere(FileLock(tmp_path, "t2", shared=True))
+    # Fully released: another thread can now take it immediately.
+    with FileLock(tmp_path, "t2"):
+        pass
+
+
+def test_lock_file_fallback_without_flock(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(lock_module, "fcntl", None)
+    lock = FileLock(tmp_path, "t3")
+    with lock:
+        assert lock.lock_path.exists()
+        assert _times_out_elsewhere(FileLock(tmp_path, "t3"))
+    assert not lock.lock_path.exists()
+    with FileLock(tmp_path, "t3", shared=True) as reader:
+        assert not reader.lock_path.exists()
@@ -64,3 +64,83 @@ def test_read_video_meta_enriches_quicktime_payload(monkeypatch: pytest.MonkeyPa
     assert info["frame_rate"] == pytest.approx(59.94, rel=1e-3)
     assert info["dur"] == pytest.approx(8.01, rel=1e-3)
     assert info["still_image_time"] == pytest.approx(1.5, rel=1e-6)
+
+
+def _quicktime_payload(**track_overrides: object) -> dict[str, object]:
+    """Return an ExifTool ``-n -g1`` payload for an iPhone Live Photo clip."""
+
+    track: dict[str, object] = {
+        "HandlerType": "vide",
+        "ImageWidth": 1920,
+        "ImageHeight": 1440,
+        "CompressorID": "hvc1",
+        "VideoFrameRate": 29.97,
+    }
+    track.update(track_overrides)
+    return {
+        "SourceFile": "clip.MOV",
+        "QuickTime": {"Duration": 2.5, "Make": "Apple"},
+        "Track1": track,
+        "Track2": {"HandlerType": "soun", "AudioFormat": "aac"},
+        "Keys": {"StillImageTime": 1.25},
+    }
+
+
+def test_read_video_meta_skips_ffprobe_when_exiftool_is_complete(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The ExifTool fast path fills the stream fields without forking ffprobe."""
+
+    def fail_probe(path: Path) -> dict[str, object]:
+        raise AssertionError("ffprobe should not run")
+
+    monkeypatch.setattr(metadata, "probe_media", fail_probe)
+
+    info = metadata.read_video_meta(tmp_path / "clip.MOV", _quicktime_payload())
+
+    assert info["dur"] == pytest.approx(2.5)
+    assert (info["w"], info["h"]) == (1920, 1440)
+    assert info["codec"] == "hevc"
+    assert info["frame_rate"] == pytest.approx(29.97)
+    assert info["still_image_time"] == pytest.approx(1.25)
+    assert info["make"] == "Apple"
+
+
+def test_read_video_meta_probes_only_missing_fields(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """ffprobe fills gaps in the ExifTool payload without overriding its values."""
+
+    calls: list[Path] = []
+
+    def fake_probe_media(path: Path) -> dict[str, object]:
+        calls.append(path)
+        return {
+            "format": {"duration": "9.0"},
+            "streams": [
+                {
+                    "codec_type": "video",
+                    "codec_name": "h264",
+                    "width": 640,
+                    "height": 480,
+                    "avg_frame_rate": "30/1",
+                }
+            ],
+        }
+
+    monkeypatch.setattr(metadata, "probe_media", fake_probe_media)
+    payload = _quicktime_payload(VideoFrameRate=None)
+
+    info = metadata.read_video_meta(tmp_path / "clip.MOV", payload)
+
+    assert len(calls) == 1
+    assert info["frame_rate"] == pytest.approx(30.0)
+    assert info["dur"] == pytest.approx(2.5)
+    assert (info["w"], info["h"]) == (1920, 1440)
+    assert info["codec"] == "hevc"
+
+    info = metadata.read_video_meta(tmp_path / "clip.MOV", payload, source="ffprobe")
+
+    assert len(calls) == 2
+    assert info["dur"] == pytest.approx(9.0)
+    assert info["codec"] == "h264"
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import os
-from datetime import datetime, timezone
+import random
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
 from iPhotos.src.iPhoto import app as backend
-from iPhotos.src.iPhoto.config import WORK_DIR_NAME
-from iPhotos.src.iPhoto.core.pairing import pair_live
+from iPhotos.src.iPhoto.config import PAIR_TIME_DELTA_SEC, WORK_DIR_NAME
+from iPhotos.src.iPhoto.cache.index_store import IndexStore
+from iPhotos.src.iPhoto.core import pairing
+from iPhotos.src.iPhoto.core.pairing import pair_live, repair_live
 from iPhotos.src.iPhoto.utils.jsonio import read_json
 
 
@@ -95,3 +100,167 @@ def test_rescan_pairs_new_live_assets(tmp_path: Path) -> None:
         group.get("still") == "IMG_5001.JPG" and group.get("motion") == "IMG_5001.MOV"
         for group in updated.get("live_groups", [])
     )
+
+
+def _reference_pairs(rows: list[dict]) -> list[tuple[str, str, float]]:
+    """Exhaustive pairing used to check the indexed implementation."""
+
+    photos = {row["rel"]: row for row in rows if row["rel"].endswith(".JPG")}
+    videos = {row["rel"]: row for row in rows if row["rel"].endswith(".MOV")}
+    pairs: dict[str, tuple[str, str, float]] = {}
+    used: set[str] = set()
+
+    def parse(value: str | None) -> datetime | None:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")) if value else None
+
+    def closest(photo: dict, candidates: list[dict]) -> dict | None:
+        best = None
+        photo_dt = parse(photo.get("dt"))
+        for candidate in candidates:
+            video_dt = parse(candidate.get("dt"))
+            if candidate["rel"] in used or photo_dt is None or video_dt is None:
+                continue
+            delta = abs((photo_dt - video_dt).total_seconds())
+            if delta <= PAIR_TIME_DELTA_SEC and (best is None or delta < best[0]):
+                best = (delta, candidate)
+        return best[1] if best else None
+
+    for confidence, key in ((0.7, lambda rel: Path(rel).stem), (0.5, lambda rel: Path(rel).parent)):
+        for photo in photos.values():
+            if photo["rel"] in pairs:
+                continue
+            candidates = [v for v in videos.values() if key(v["rel"]) == key(photo["rel"])]
+            chosen = closest(photo, candidates)
+            if chosen:
+                used.add(chosen["rel"])
+                pairs[photo["rel"]] = (photo["rel"], chosen["rel"], confidence)
+    return list(pairs.values())
+
+
+def test_indexed_pairing_matches_exhaustive_search() -> None:
+    rng = random.Random(1234)
+    base = datetime(2024, 5, 1, 9, 0, 0)
+    rows: list[dict] = []
+    for index in range(600):
+        folder = f"day{rng.randrange(4)}"
+        stem = f"IMG_{rng.randrange(150):04d}"
+        suffix = rng.choice([".JPG", ".MOV"])
+        offset = timedelta(milliseconds=rng.randrange(0, 400_000, 250))
+        dt = None if rng.random() < 0.05 else iso(base + offset)
+        rows.append({"rel": f"{folder}/{stem}_{index % 7}{suffix}", "dt": dt})
+
+    groups = pair_live(rows)
+
+    assert [(g.still, g.motion, g.confidence) for g in groups] == _reference_pairs(rows)
+    assert {g.confidence for g in groups} == {0.7, 0.5}
+
+
+def _live_rows(folder: str, start: int, count: int) -> list[dict]:
+    base = datetime(2024, 6, 1, 8, 0, 0)
+    rows: list[dict] = []
+    for index in range(start, start + count):
+        dt = iso(base + timedelta(minutes=index))
+        rows.append({"rel": f"{folder}/IMG_{index:04d}.HEIC", "mime": "image/heic", "dt": dt})
+        rows.append({"rel": f"{folder}/IMG_{index:04d}.MOV", "mime": "video/quicktime", "dt": dt})
+    return rows
+
+
+def test_repair_live_matches_full_pairing_after_moves() -> None:
+    rows = _live_rows("a", 0, 40) + _live_rows("b", 40, 40) + _live_rows("d", 80, 5)
+    rows.append({"rel": "b/IMG_0099.HEIC", "content_id": "CID", "dt": None})
+    rows.append({"rel": "c/clip.MOV", "content_id": "CID", "dt": None})
+    previous = pair_live(rows)
+
+    moved_out = {"a/IMG_0003.HEIC", "a/IMG_0003.MOV", "c/clip.MOV"}
+    moved_in = _live_rows("b", 200, 2)
+    updated = [row for row in rows if row["rel"] not in moved_out] + moved_in
+    changed = moved_out | {row["rel"] for row in moved_in}
+
+    repaired = repair_live(updated, previous, changed)
+
+    assert repaired == pair_live(updated)
+    untouched = next(group for group in previous if group.still == "d/IMG_0082.HEIC")
+    assert any(group is untouched for group in repaired)
+
+
+def test_incremental_pair_only_repairs_affected_folders(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rows = _live_rows("a", 0, 30) + _live_rows("b", 30, 30)
+    store = IndexStore(tmp_path)
+    store.write_rows(rows)
+    assert len(backend.pair(tmp_path)) == 60
+
+    store.remove_rows(["b/IMG_0031.HEIC", "b/IMG_0031.MOV"])
+    inspected: list[int] = []
+    original = pairing.pair_live
+
+    def tracking_pair_live(index_rows: list[dict]) -> list:
+        inspected.append(len(index_rows))
+        return original(index_rows)
+
+    monkeypatch.setattr(pairing, "pair_live", tracking_pair_live)
+    groups = backend.pair(tmp_path, removed=["b/IMG_0031.HEIC", "b/IMG_0031.MOV"])
+
+    assert inspected == [58]  # the remaining 29 pairs of folder "b" only
+    assert len(groups) == 59
+    stored = read_json(tmp_path / WORK_DIR_NAME / "links.json")["live_groups"]
+    assert [group["still"] for group in stored] == [group.still for group in groups]
+
+
+def test_live_group_ids_are_stable_and_reopening_skips_links_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rows = _live_rows("a", 0, 1)
+    script = (
+        "import sys; sys.path.insert(0, sys.argv[1]);"
+        "from iPhoto.core.pairing import pair_live;"
+        "print(pair_live([{'rel': 'IMG.HEIC', 'mime': 'image/heic', 'dt': '2024-01-01T00:00:00Z'},"
+        "{'rel': 'IMG.MOV', 'mime': 'video/quicktime', 'dt': '2024-01-01T00:00:00Z'}])[0].id)"
+    )
+    src = str(Path(__file__).resolve().parents[1] / "src")
+    ids = {
+        subprocess.run(
+            [sys.executable, "-c", script, src],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        for seed in ("1", "2")
+    }
+    assert len(ids) == 1 and ids.pop().startswith("live_")
+
+    IndexStore(tmp_path).write_rows(rows)
+    backend.open_album(tmp_path)
+    first = pair_live(rows)[0].id
+
+    def fail_write(root: Path, payload: dict) -> None:
+        raise AssertionError("links.json should not be rewritten")
+
+    monkeypatch.setattr(backend, "_write_links", fail_write)
+    backend.open_album(tmp_path)
+    assert read_json(tmp_path / WORK_DIR_NAME / "links.json")["live_groups"][0]["id"] == first
+
+
+def test_open_album_skips_pairing_while_index_stamp_matches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = IndexStore(tmp_path)
+    store.write_rows(_live_rows("a", 0, 2))
+    backend.open_album(tmp_path)
+    links_path = tmp_path / WORK_DIR_NAME / "links.json"
+    assert read_json(links_path)["index_stamp"] == store.stamp()
+
+    def fail_read_all(self: IndexStore) -> None:
+        raise AssertionError("index should not be read")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(IndexStore, "read_all", fail_read_all)
+        backend.open_album(tmp_path)
+
+    store.append_rows(_live_rows("a", 2, 1))
+    backend.open_album(tmp_path)
+    links = read_json(links_path)
+    assert links["index_stamp"] == store.stamp()
+    assert len(links["live_groups"]) == 3
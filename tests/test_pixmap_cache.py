@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+pytest.importorskip("PySide6", reason="PySide6 is required for pixmap tests", exc_type=ImportError)
+pixmap_cache = pytest.importorskip(
+    "iPhotos.src.iPhoto.gui.utils.pixmap_cache",
+    reason="Qt GUI modules unavailable",
+    exc_type=ImportError,
+)
+
+from PySide6.QtGui import QGuiApplication, QPixmap
+
+PixmapCache = pixmap_cache.PixmapCache
+pixmap_bytes = pixmap_cache.pixmap_bytes
+
+
+@pytest.fixture(scope="module")
+def qapp() -> QGuiApplication:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QGuiApplication.instance()
+    if app is None:
+        app = QGuiApplication([])
+    yield app
+
+
+def test_pixmap_cache_evicts_least_recently_used(qapp: QGuiApplication) -> None:
+    pixmaps = [QPixmap(64, 64) for _ in range(4)]
+    size = pixmap_bytes(pixmaps[0])
+    cache = PixmapCache(3 * size)
+    for index in range(3):
+        cache.put(index, pixmaps[index])
+    assert cache.get(0) is not None
+
+    cache.put(3, pixmaps[3])
+
+    assert 1 not in cache
+    assert cache.keys() == [2, 0, 3]
+    stats = cache.stats()
+    assert (stats.hits, stats.evictions, stats.bytes) == (1, 1, 3 * size)
+    assert cache.get(1) is None
+    assert cache.stats().misses == 1
+
+
+def test_pixmap_cache_pins_and_shares(qapp: QGuiApplication) -> None:
+    first, second, third = (QPixmap(64, 64) for _ in range(3))
+    size = pixmap_bytes(first)
+    cache = PixmapCache(2 * size)
+    cache.put("a", first)
+    cache.put(("loader", "a"), first)
+    assert cache.stats().bytes == size
+
+    cache.pin(["a"])
+    cache.put("b", second)
+    cache.put("c", third)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    cache.pop("a")
+    assert cache.stats().bytes == size
+    cache.discard_where(lambda key: isinstance(key, str))
+    assert cache.keys() == [] and cache.stats().bytes == 0
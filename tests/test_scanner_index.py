@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -29,3 +30,204 @@ def test_scan_album_produces_rows(tmp_path: Path) -> None:
     row = rows[0]
     assert row["rel"] == "IMG_0001.JPG"
     assert row["w"] == 10 and row["h"] == 10
+
+
+def test_incremental_scan_reuses_unchanged_rows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from iPhotos.src.iPhoto.io import scanner
+
+    kept = tmp_path / "IMG_0001.JPG"
+    removed = tmp_path / "IMG_0002.JPG"
+    create_image(kept)
+    create_image(removed)
+    initial = list(scan_album(tmp_path, DEFAULT_INCLUDE, DEFAULT_EXCLUDE))
+    assert {row["rel"] for row in initial} == {"IMG_0001.JPG", "IMG_0002.JPG"}
+
+    removed.unlink()
+    added = tmp_path / "IMG_0003.JPG"
+    create_image(added)
+
+    hashed: list[Path] = []
+    original_hash = scanner.file_fingerprint
+
+    def _tracking_hash(path: Path, **kwargs: object) -> str:
+        hashed.append(path)
+        return original_hash(path, **kwargs)
+
+    monkeypatch.setattr(scanner, "file_fingerprint", _tracking_hash)
+    rows = list(
+        scan_album(tmp_path, DEFAULT_INCLUDE, DEFAULT_EXCLUDE, existing_rows=initial)
+    )
+
+    assert {row["rel"] for row in rows} == {"IMG_0001.JPG", "IMG_0003.JPG"}
+    assert hashed == [added]
+    reused = next(row for row in rows if row["rel"] == "IMG_0001.JPG")
+    assert reused == next(row for row in initial if row["rel"] == "IMG_0001.JPG")
+
+
+def test_incremental_scan_refreshes_modified_files(tmp_path: Path) -> None:
+    asset = tmp_path / "IMG_0001.JPG"
+    create_image(asset)
+    initial = list(scan_album(tmp_path, DEFAULT_INCLUDE, DEFAULT_EXCLUDE))
+
+    Image.new("RGB", (20, 12), color="blue").save(asset)
+    stat = asset.stat()
+    os.utime(asset, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    rows = list(
+        scan_album(tmp_path, DEFAULT_INCLUDE, DEFAULT_EXCLUDE, existing_rows=initial)
+    )
+    assert len(rows) == 1
+    assert rows[0]["w"] == 20 and rows[0]["h"] == 12
+    assert rows[0]["mtime_ns"] == asset.stat().st_mtime_ns
+
+
+def test_parallel_scan_preserves_order_and_collects_stats(tmp_path: Path) -> None:
+    from iPhotos.src.iPhoto.io.scanner import ScanStats, gather_media_paths, process_media_paths
+
+    for index in range(12):
+        create_image(tmp_path / f"IMG_{index:04d}.JPG")
+    images, videos = gather_media_paths(tmp_path, DEFAULT_INCLUDE, DEFAULT_EXCLUDE)
+
+    serial = list(process_media_paths(tmp_path, images, videos, workers=1))
+    stats = ScanStats()
+    parallel = list(process_media_paths(tmp_path, images, videos, workers=4, stats=stats))
+
+    assert [row["rel"] for row in parallel] == [path.name for path in images]
+    assert parallel == serial
+    assert stats.files == 12
+    assert stats.stage_seconds["hash"] > 0
+    assert {"exiftool", "stat", "wait", "image_meta"} <= set(stats.stage_seconds)
+    assert stats.counts["exiftool_batches"] == 1
+    assert stats.bytes == sum(row["bytes"] for row in parallel)
+
+
+def test_interrupted_scan_resumes_from_checkpoint(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from iPhotos.src.iPhoto import app
+    from iPhotos.src.iPhoto.cache.index_store import IndexStore
+    from iPhotos.src.iPhoto.cache.scan_checkpoint import ScanCheckpoint
+    from iPhotos.src.iPhoto.io import scanner
+
+    for index in range(3):
+        create_image(tmp_path / f"IMG_{index:04d}.JPG")
+    checkpoint = ScanCheckpoint(tmp_path)
+    stream = checkpoint.record(scan_album(tmp_path, DEFAULT_INCLUDE, DEFAULT_EXCLUDE))
+    done = [next(stream), next(stream)]
+    stream.close()
+    assert [row["rel"] for row in checkpoint.read_rows()] == [row["rel"] for row in done]
+
+    hashed: list[str] = []
+    original_hash = scanner.file_fingerprint
+
+    def _tracking_hash(path: Path, **kwargs: object) -> str:
+        hashed.append(path.name)
+        return original_hash(path, **kwargs)
+
+    monkeypatch.setattr(scanner, "file_fingerprint", _tracking_hash)
+    rows = app.rescan(tmp_path)
+
+    remaining = {"IMG_0000.JPG", "IMG_0001.JPG", "IMG_0002.JPG"} - {row["rel"] for row in done}
+    assert hashed == sorted(remaining)
+    assert len(rows) == 3
+    assert not checkpoint.exists()
+    assert sorted(row["rel"] for row in IndexStore(tmp_path).read_all()) == [
+        "IMG_0000.JPG",
+        "IMG_0001.JPG",
+        "IMG_0002.JPG",
+    ]
+
+
+def test_fast_fingerprint_and_lazy_full_hash(tmp_path: Path) -> None:
+    from iPhotos.src.iPhoto import app
+    from iPhotos.src.iPhoto.cache.index_store import IndexStore
+    from iPhotos.src.iPhoto.utils.hashutils import file_fingerprint, file_xxh3
+
+    clip = tmp_path / "clip.bin"
+    clip.write_bytes(bytes(range(256)) * 4096)
+    before = file_fingerprint(clip, block_size=4096)
+    with clip.open("r+b") as handle:
+        handle.seek(300_000)
+        handle.write(b"changed")
+    assert file_fingerprint(clip, block_size=4096) == before
+    with clip.open("r+b") as handle:
+        handle.seek(len(bytes(range(256)) * 4096) // 2)
+        handle.write(b"changed")
+    assert file_fingerprint(clip, block_size=4096) != before
+
+    asset = tmp_path / "IMG_0001.JPG"
+    create_image(asset)
+    rows = app.rescan(tmp_path)
+    assert rows[0]["id"] == f"as_{file_fingerprint(asset)}"
+    assert "xxh3" not in rows[0]
+
+    assert app.compute_full_hashes(tmp_path) == 1
+    assert next(IndexStore(tmp_path).read_all())["xxh3"] == file_xxh3(asset)
+    assert app.compute_full_hashes(tmp_path) == 0
+
+
+def test_gather_media_paths_prunes_excluded_directories(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import fnmatch
+    import os
+
+    from iPhotos.src.iPhoto.io.scanner import gather_media_paths
+
+    for rel in (
+        "IMG_0001.JPG",
+        "clip.MOV",
+        "notes.txt",
+        "._IMG_0001.JPG",
+        "trip/IMG_0002.HEIC",
+        "trip/day 2/IMG_0003.PNG",
+        "trip/day 2/VID_0004.MP4",
+        "skip/IMG_0005.JPG",
+        ".iPhoto/IMG_0006.JPG",
+        "trip/.iPhoto/IMG_0007.JPG",
+    ):
+        target = tmp_path / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(b"x")
+    include = ["**/*.{HEIC,JPG,PNG,MOV,MP4}"]
+    exclude = ["**/.iPhoto/**", "**/._*", "skip/**"]
+
+    def _matches(rel: str, globs: list[str]) -> bool:
+        patterns = [
+            pattern.replace("{HEIC,JPG,PNG,MOV,MP4}", ext)
+            for pattern in globs
+            for ext in ("HEIC", "JPG", "PNG", "MOV", "MP4")
+        ]
+        patterns += [pattern[3:] for pattern in patterns if pattern.startswith("**/")]
+        return any(fnmatch.fnmatch(rel, pattern) for pattern in patterns)
+
+    expected = [
+        path
+        for path in tmp_path.rglob("*")
+        if path.is_file()
+        and ".iPhoto" not in path.relative_to(tmp_path).parts
+        and not _matches(path.relative_to(tmp_path).as_posix(), exclude)
+        and _matches(path.relative_to(tmp_path).as_posix(), include)
+    ]
+
+    listed: list[str] = []
+    original_scandir = os.scandir
+
+    def _tracking_scandir(path):  # type: ignore[no-untyped-def]
+        listed.append(Path(path).relative_to(tmp_path).as_posix())
+        return original_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _tracking_scandir)
+    images, videos = gather_media_paths(tmp_path, include, exclude)
+
+    video_suffixes = {".MOV", ".MP4"}
+    assert images == [path for path in expected if path.suffix not in video_suffixes]
+    assert videos == [path for path in expected if path.suffix in video_suffixes]
+    assert {path.relative_to(tmp_path).as_posix() for path in images} == {
+        "IMG_0001.JPG",
+        "trip/IMG_0002.HEIC",
+        "trip/day 2/IMG_0003.PNG",
+    }
+    assert sorted(listed) == [".", "trip", "trip/day 2"]
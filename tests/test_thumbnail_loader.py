@@ -41,10 +41,18 @@ def qapp() -> QApplication:
     yield app
 
 
+def _wait_ready(qapp: QApplication, spy: QSignalSpy) -> None:
+    deadline = time.monotonic() + 4.0
+    while time.monotonic() < deadline and spy.count() < 1:
+        qapp.processEvents()
+        time.sleep(0.05)
+    assert spy.count() >= 1
+
+
 def test_thumbnail_loader_cache_naming(tmp_path: Path, qapp: QApplication) -> None:
     image_path = tmp_path / "IMG_0001.JPG"
     _create_image(image_path)
-    loader = ThumbnailLoader()
+    loader = ThumbnailLoader(store_layout="files", codec="png")
     loader.reset_for_album(tmp_path)
 
     spy = QSignalSpy(loader.ready)
@@ -77,3 +85,24 @@ def test_thumbnail_loader_cache_naming(tmp_path: Path, qapp: QApplication) -> No
     files = list(thumbs_dir.iterdir())
     assert len(files) == 1
     assert files[0].name != filename
+
+
+def test_thumbnail_loader_packs_thumbnails(tmp_path: Path, qapp: QApplication) -> None:
+    image_path = tmp_path / "IMG_0001.JPG"
+    _create_image(image_path)
+    loader = ThumbnailLoader()
+    loader.reset_for_album(tmp_path)
+
+    spy = QSignalSpy(loader.ready)
+    assert loader.request("IMG_0001.JPG", image_path, QSize(192, 192), is_image=True) is None
+    _wait_ready(qapp, spy)
+
+    thumbs_dir = tmp_path / WORK_DIR_NAME / "thumbs"
+    names = sorted(path.name for path in thumbs_dir.iterdir())
+    assert names == ["pack-000001.bin", "pack.index"]
+
+    # A fresh loader serves the thumbnail straight from the pack.
+    other = ThumbnailLoader()
+    other.reset_for_album(tmp_path)
+    pixmap = other.request("IMG_0001.JPG", image_path, QSize(192, 192), is_image=True)
+    assert pixmap is not None and not pixmap.isNull()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from iPhotos.src.iPhoto.cache import thumbnail_store as store_module
+from iPhotos.src.iPhoto.cache.thumbnail_store import ThumbnailStore
+from iPhotos.src.iPhoto.config import WORK_DIR_NAME
+
+
+def test_pack_store_round_trip_and_supersede(tmp_path: Path) -> None:
+    store = ThumbnailStore(tmp_path)
+    store.put("a/IMG_1.JPG", 192, 192, 100, b"png-one")
+    store.put("a/IMG_2.JPG", 192, 192, 100, b"png-two")
+    store.put("a/IMG_1.JPG", 512, 512, 100, b"png-one-large")
+
+    assert store.get("a/IMG_1.JPG", 192, 192, 100) == b"png-one"
+    assert store.get("a/IMG_1.JPG", 512, 512, 100) == b"png-one-large"
+    assert store.get("a/IMG_1.JPG", 192, 192, 101) is None
+
+    store.put("a/IMG_1.JPG", 192, 192, 101, b"png-one-v2")
+    assert store.get("a/IMG_1.JPG", 192, 192, 100) is None
+    assert store.get("a/IMG_1.JPG", 192, 192, 101) == b"png-one-v2"
+    store.discard("a/IMG_2.JPG", 192, 192, 100)
+    assert store.get("a/IMG_2.JPG", 192, 192, 100) is None
+    assert store.garbage_bytes() == len(b"png-one") + len(b"png-two")
+
+    # A second reader (another process) sees every append.
+    other = ThumbnailStore(tmp_path)
+    assert other.get("a/IMG_1.JPG", 192, 192, 101) == b"png-one-v2"
+    store.put("b/IMG_3.JPG", 192, 192, 5, b"late")
+    assert other.get("b/IMG_3.JPG", 192, 192, 5) == b"late"
+
+    thumbs = tmp_path / WORK_DIR_NAME / "thumbs"
+    assert sorted(path.name for path in thumbs.iterdir() if path.name.endswith(".bin")) == [
+        "pack-000001.bin"
+    ]
+    store.close()
+    other.close()
+
+
+def test_pack_store_rolls_over_and_collects_garbage(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(store_module, "THUMBNAIL_PACK_MAX_BYTES", 64)
+    monkeypatch.setattr(store_module, "THUMBNAIL_PACK_GC_MIN_BYTES", 1)
+    store = ThumbnailStore(tmp_path)
+    for stamp in range(4):
+        for index in range(3):
+            store.put(f"IMG_{index}.JPG", 64, 64, stamp, bytes([index]) * 30)
+    thumbs = tmp_path / WORK_DIR_NAME / "thumbs"
+    assert len(list(thumbs.glob("pack-*.bin"))) > 1
+    assert store.needs_collection()
+
+    reader = ThumbnailStore(tmp_path)
+    assert reader.get("IMG_1.JPG", 64, 64, 3) == bytes([1]) * 30
+
+    assert store.collect_garbage() == 9 * 30
+    assert store.garbage_bytes() == 0
+    assert not store.needs_collection()
+    assert sum(path.stat().st_size for path in thumbs.glob("pack-*.bin")) == 3 * 30
+    for index in range(3):
+        assert store.get(f"IMG_{index}.JPG", 64, 64, 3) == bytes([index]) * 30
+        assert reader.get(f"IMG_{index}.JPG", 64, 64, 3) == bytes([index]) * 30
+    store.close()
+    reader.close()
+
+
+def test_switching_codec_invalidates_entries(tmp_path: Path) -> None:
+    ThumbnailStore(tmp_path, codec="png").put("IMG_1.JPG", 192, 192, 1, b"png-bytes")
+
+    jpeg = ThumbnailStore(tmp_path, codec="jpeg", quality=85)
+    assert jpeg.get("IMG_1.JPG", 192, 192, 1) is None
+    assert jpeg.garbage_bytes() == len(b"png-bytes")
+    jpeg.put("IMG_1.JPG", 192, 192, 1, b"jpeg")
+    assert jpeg.get("IMG_1.JPG", 192, 192, 1) == b"jpeg"
+    assert ThumbnailStore(tmp_path, codec="jpeg", quality=60).get("IMG_1.JPG", 192, 192, 1) is None
+    assert ThumbnailStore(tmp_path, codec="png").get("IMG_1.JPG", 192, 192, 1) is None
+
+    assert jpeg.collect_garbage() == len(b"png-bytes")
+    assert jpeg.get("IMG_1.JPG", 192, 192, 1) == b"jpeg"
+
+
+def test_outdated_index_is_replaced(tmp_path: Path) -> None:
+    thumbs = tmp_path / WORK_DIR_NAME / "thumbs"
+    thumbs.mkdir(parents=True)
+    (thumbs / "pack.index").write_bytes(b"IPHTIDX1" + b"\0" * 40)
+    (thumbs / "pack-000001.bin").write_bytes(b"x" * 40)
+
+    store = ThumbnailStore(tmp_path)
+    assert store.get("IMG_1.JPG", 192, 192, 1) is None
+    store.put("IMG_1.JPG", 192, 192, 1, b"jpeg")
+    assert ThumbnailStore(tmp_path).get("IMG_1.JPG", 192, 192, 1) == b"jpeg"
+    assert store.garbage_bytes() == 40
+
+
+def test_files_layout_keeps_one_file_per_thumbnail(tmp_path: Path) -> None:
+    store = ThumbnailStore(tmp_path, layout="files", codec="png")
+    store.put("IMG_0001.JPG", 192, 192, 7, b"png")
+
+    digest = hashlib.sha1(b"IMG_0001.JPG").hexdigest()
+    path = tmp_path / WORK_DIR_NAME / "thumbs" / f"{digest}_7_192x192.png"
+    assert path.read_bytes() == b"png"
+    assert store.get("IMG_0001.JPG", 192, 192, 7) == b"png"
+    store.discard("IMG_0001.JPG", 192, 192, 7)
+    assert not path.exists()
+
+    lossy = ThumbnailStore(tmp_path, layout="files", codec="webp", quality=70)
+    lossy.put("IMG_0001.JPG", 192, 192, 7, b"webp")
+    assert (path.parent / f"{digest}_7_192x192_q70.webp").read_bytes() == b"webp"
+    with pytest.raises(ValueError):
+        ThumbnailStore(tmp_path, layout="zip")
+    with pytest.raises(ValueError):
+        ThumbnailStore(tmp_path, codec="gif")
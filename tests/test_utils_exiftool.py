@@ -0,0 +1,74 @@
+"""Tests for the persistent ExifTool session."""
+
+from __future__ import annotations
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from iPhotos.src.iPhoto.errors import ExternalToolError
+from iPhotos.src.iPhoto.utils import exiftool
+
+_FAKE_EXIFTOOL = """#!{python}
+import json
+import sys
+
+args = []
+for raw in sys.stdin:
+    line = raw.rstrip("\\n")
+    if line == "-stay_open":
+        continue
+    if line == "False":
+        break
+    if line.startswith("-execute"):
+        files = [arg for arg in args if arg.startswith("/")]
+        if any(name.endswith("crash.jpg") for name in files):
+            sys.exit(1)
+        if files:
+            sys.stdout.write(json.dumps([{{"SourceFile": name}} for name in files]) + "\\n")
+        sys.stdout.write("{{ready" + line[len("-execute"):] + "}}\\n")
+        sys.stdout.flush()
+        args = []
+        continue
+    args.append(line)
+"""
+
+
+@pytest.fixture()
+def fake_exiftool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "exiftool"
+    script.write_text(_FAKE_EXIFTOOL.format(python=sys.executable), encoding="utf-8")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    exiftool.shutdown_session()
+    yield script
+    exiftool.shutdown_session()
+
+
+def test_session_is_reused_and_chunked(fake_exiftool: Path, tmp_path: Path) -> None:
+    paths = [tmp_path / f"IMG_{index:04d}.JPG" for index in range(5)]
+
+    payload = exiftool.get_metadata_batch(paths)
+    pid = exiftool.get_session().pid
+
+    assert [item["SourceFile"] for item in payload] == [str(path) for path in paths]
+    chunks = list(exiftool.iter_metadata_batches(paths, chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert exiftool.get_session().pid == pid
+
+
+def test_session_restarts_after_crash(fake_exiftool: Path, tmp_path: Path) -> None:
+    session = exiftool.get_session()
+    session.execute_json([tmp_path / "a.jpg"])
+    first_pid = session.pid
+
+    with pytest.raises(ExternalToolError):
+        session.execute_json([tmp_path / "crash.jpg"])
+
+    assert session.execute_json([tmp_path / "b.jpg"]) == [{"SourceFile": str(tmp_path / "b.jpg")}]
+    assert session.pid != first_pid